@@ -0,0 +1,179 @@
+# 제외 패턴 벤치마크 — 컴파일된 ExcludeMatcher 와 경로마다 fnmatch 를 도는 방식 비교
+#
+#   python benchmarks/bench_excludes.py --paths 200000
+#   python benchmarks/bench_excludes.py --projects 50 --dir /dev/shm
+#
+# match : 같은 상대 경로 목록을 두 방식으로 검사해서 초당 처리 개수를 비교한다
+#         (fnmatch 는 경로의 폴더마다 모든 패턴을 검사, 컴파일된 쪽도 폴더마다 한 번씩)
+# walk  : node_modules/.git 이 든 가짜 프로젝트 폴더를 만들어
+#         전부 훑은 뒤 fnmatch 로 거르기 vs 폴더째 잘라내며 훑기의 시간과 읽은 폴더 수
+import argparse
+import fnmatch
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from organizer.excludes import compile_excludes
+from organizer.walker import walk_files
+
+PATTERNS = [
+    "node_modules/", ".git/", "__pycache__/", "*.part", "*.crdownload", "~$*",
+    "*.tmp", "thumbs.db", ".ds_store", "/build", "docs/*.bak", "[._]*.swp",
+]
+
+NAMES = ["report", "IMG_", "data", "index", "~$memo", "Thumbs", "main"]
+EXTS = [".jpg", ".pdf", ".js", ".part", ".tmp", ".docx", ".db", ".swp", ".txt"]
+DIRS = ["src", "docs", "lib", "node_modules", ".git", "build", "assets", "__pycache__"]
+
+
+def naive_excluded(rel_path: str, name_patterns: list, path_patterns: list) -> bool:
+    # 흔히 쓰는 방식 — 폴더 이름 하나하나와 전체 경로에 모든 패턴을 fnmatch
+    parts = rel_path.lower().split("/")
+    for i, part in enumerate(parts):
+        is_dir = i < len(parts) - 1
+        for pattern, dir_only in name_patterns:
+            if (is_dir or not dir_only) and fnmatch.fnmatchcase(part, pattern):
+                return True
+        prefix = "/".join(parts[:i + 1])
+        for pattern, dir_only in path_patterns:
+            if (is_dir or not dir_only) and fnmatch.fnmatchcase(prefix, pattern):
+                return True
+    return False
+
+
+def split_patterns(patterns: list) -> tuple[list, list]:
+    name_patterns = []
+    path_patterns = []
+    for pattern in patterns:
+        dir_only = pattern.endswith("/")
+        pattern = pattern.lower().strip("/") if dir_only else pattern.lower()
+        if "/" in pattern:
+            path_patterns.append((pattern.lstrip("/"), dir_only))
+        else:
+            name_patterns.append((pattern, dir_only))
+    return name_patterns, path_patterns
+
+
+def compiled_excluded(matcher, rel_path: str) -> bool:
+    # 미리 잘라내지 않고 경로 하나만 받았을 때 — 폴더마다 한 번씩 검사
+    parts = rel_path.split("/")
+    rel_dir = ""
+    for part in parts[:-1]:
+        if matcher.match(part, rel_dir, True):
+            return True
+        rel_dir += part + "/"
+    return matcher.match(parts[-1], rel_dir)
+
+
+def make_paths(count: int) -> list[str]:
+    rng = random.Random(42)
+    paths = []
+    for i in range(count):
+        depth = rng.randint(0, 4)
+        dirs = [rng.choice(DIRS) for _ in range(depth)]
+        name = f"{rng.choice(NAMES)}{i}{rng.choice(EXTS)}"
+        paths.append("/".join(dirs + [name]))
+    return paths
+
+
+def bench_match(count: int):
+    paths = make_paths(count)
+    name_patterns, path_patterns = split_patterns(PATTERNS)
+    matcher = compile_excludes(PATTERNS)
+
+    results = {}
+    for label, func in [
+        ("fnmatch (경로마다)", lambda p: naive_excluded(p, name_patterns, path_patterns)),
+        ("compiled", lambda p: compiled_excluded(matcher, p)),
+    ]:
+        start = time.perf_counter()
+        excluded = sum(1 for path in paths if func(path))
+        elapsed = time.perf_counter() - start
+        results[label] = excluded
+        print(f"{label:<24} {elapsed:8.3f}s  {count / elapsed:14,.0f} paths/s  제외 {excluded:,}")
+
+    if len(set(results.values())) != 1:
+        print("경고: 두 방식의 제외 개수가 다릅니다", results)
+
+
+def make_tree(root: Path, projects: int, files: int):
+    # 프로젝트마다 src/docs 에 files 개, node_modules 와 .git 에는 그 몇 배
+    for p in range(projects):
+        project = root / f"project{p}"
+        for sub, count in [("src", files), ("docs", files // 4)]:
+            (project / sub).mkdir(parents=True)
+            for i in range(count):
+                (project / sub / f"file{i}.txt").touch()
+            (project / sub / f"~$draft{p}.docx").touch()
+            (project / sub / f"video{p}.mp4.part").touch()
+        for pkg in range(20):
+            package = project / "node_modules" / f"pkg{pkg}" / "lib"
+            package.mkdir(parents=True)
+            for i in range(files // 2):
+                (package / f"mod{i}.js").touch()
+        objects = project / ".git" / "objects"
+        for d in range(16):
+            (objects / f"{d:02x}").mkdir(parents=True)
+            for i in range(files // 4):
+                (objects / f"{d:02x}" / f"{i:038x}").touch()
+
+
+def bench_walk(root: Path):
+    name_patterns, path_patterns = split_patterns(PATTERNS)
+    opened = [0]
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        opened[0] += 1
+        return real_scandir(path)
+
+    os.scandir = counting_scandir
+    try:
+        for label, run in [
+            ("전부 훑고 fnmatch", lambda: [
+                e for e in walk_files(root)
+                if not naive_excluded(
+                    os.path.relpath(e.path, root).replace(os.sep, "/"),
+                    name_patterns, path_patterns,
+                )
+            ]),
+            ("잘라내며 훑기", lambda: list(walk_files(root, exclude_patterns=PATTERNS))),
+        ]:
+            opened[0] = 0
+            start = time.perf_counter()
+            kept = run()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<24} {elapsed:8.3f}s  남은 파일 {len(kept):8,}  읽은 폴더 {opened[0]:6,}")
+    finally:
+        os.scandir = real_scandir
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paths", type=int, default=200_000)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--files", type=int, default=40, help="프로젝트 src 폴더의 파일 수")
+    parser.add_argument("--dir", help="가짜 프로젝트를 만들 곳 (기본: 임시 폴더)")
+    args = parser.parse_args()
+
+    print(f"patterns: {' '.join(PATTERNS)}")
+    print("[match]")
+    bench_match(args.paths)
+
+    root = Path(tempfile.mkdtemp(dir=args.dir))
+    try:
+        make_tree(root, args.projects, args.files)
+        print(f"[walk] {root}")
+        bench_walk(root)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# 순차 / 병렬 이동 비교 벤치마크
+#
+#   python benchmarks/bench_executor.py --files 2000 --workers 1 4 8
+#
+# 원본은 tmpfs(/dev/shm), 정리 폴더는 디스크(--dest, 기본: 현재 폴더)에
+# 만들어서 장치 간 이동(복사 + 삭제)을 재현한다.
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from organizer.core import plan_organize, execute_plan
+
+RULES = {".jpg": "Images", ".png": "Images", ".mp4": "Videos", ".txt": "Docs"}
+SIZES = [1024, 64 * 1024, 1024 * 1024]
+
+
+def make_source(root: Path, count: int):
+    exts = list(RULES)
+    for i in range(count):
+        ext = exts[i % len(exts)]
+        size = SIZES[i % len(SIZES)]
+        with open(root / f"file_{i:06}{ext}", "wb") as f:
+            f.write(os.urandom(size))
+
+
+def run_once(src_root: Path, dest_root: Path, count: int, workers: int) -> float:
+    src = Path(tempfile.mkdtemp(dir=src_root))
+    dest = Path(tempfile.mkdtemp(dir=dest_root))
+    try:
+        make_source(src, count)
+        plan = plan_organize(
+            target_dir=src,
+            rules=RULES,
+            exclude_extensions=[],
+            mode="move",
+            conflict_mode="rename",
+            archive_folder=str(dest),     # 절대 경로면 다른 장치에 정리된다
+            exclude_hidden=True,
+        )
+        start = time.perf_counter()
+        execute_plan(plan, workers=workers)
+        return time.perf_counter() - start
+    finally:
+        shutil.rmtree(src, ignore_errors=True)
+        shutil.rmtree(dest, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--src", default="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    parser.add_argument("--dest", default=".")
+    args = parser.parse_args()
+
+    # undo 로그가 실제 설정 폴더에 쌓이지 않도록 분리
+    os.environ["HOME"] = tempfile.mkdtemp()
+    os.environ["APPDATA"] = os.environ["HOME"]
+
+    src_root = Path(args.src or tempfile.gettempdir())
+    dest_root = Path(args.dest)
+    same = os.stat(src_root).st_dev == os.stat(dest_root).st_dev
+    print(f"src={src_root} dest={dest_root.resolve()} cross_device={not same}")
+
+    for workers in args.workers:
+        elapsed = run_once(src_root, dest_root, args.files, workers)
+        print(f"workers={workers:<3} {elapsed:8.3f}s  {args.files / elapsed:10.1f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# 분류 규칙 매처 마이크로 벤치마크
+#
+#   python benchmarks/bench_rules.py --names 1000000
+#
+# 같은 이름 목록을 예전 방식(확장자 dict 조회)과 컴파일된 RuleMatcher 로
+# 분류해서 초당 처리 개수를 비교한다.
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from organizer.rules import compile_rules
+from organizer.scanner import get_suffix
+
+SIMPLE_RULES = {
+    "Images": [".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic"],
+    "Videos": [".mp4", ".mov", ".mkv", ".avi"],
+    "Docs": [".pdf", ".docx", ".xlsx", ".pptx", ".txt", ".hwp"],
+    "Archives": [".zip", ".7z", ".rar"],
+}
+
+RICH_RULES = {
+    "Screenshots": ["name:screenshot*", "re:^IMG_\\d{4}", "priority:10"],
+    "BigVideos": [".mp4", ".mov", "size:>1GB", "priority:5"],
+    "Tarballs": [".tar.gz", ".tar.bz2", ".tar.xz"],
+    "Bundles": [".min.js", ".min.css"],
+    **SIMPLE_RULES,
+    "Old": ["age:>365d"],
+}
+
+EXTS = [
+    ".jpg", ".png", ".mp4", ".pdf", ".docx", ".zip", ".tar.gz",
+    ".min.js", ".js", ".log", ".JPG", "",
+]
+
+
+def make_names(count: int) -> list[tuple[str, int, float]]:
+    rng = random.Random(42)
+    now = time.time()
+    names = []
+    for i in range(count):
+        prefix = rng.choice(["file", "Screenshot ", "IMG_", "report", "data"])
+        ext = rng.choice(EXTS)
+        size = rng.choice([1024, 1024 ** 2, 2 * 1024 ** 3])
+        mtime = now - rng.random() * 800 * 86400
+        names.append((f"{prefix}{i}{ext}", size, mtime))
+    return names
+
+
+def bench(label: str, func, names: list) -> float:
+    start = time.perf_counter()
+    for name, size, mtime in names:
+        func(name, size, mtime)
+    elapsed = time.perf_counter() - start
+    rate = len(names) / elapsed
+    print(f"{label:<24} {elapsed:8.3f}s  {rate:14,.0f} names/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    names = make_names(args.names)
+
+    flat = {ext: cat for cat, exts in SIMPLE_RULES.items() for ext in exts}
+
+    def legacy(name, size, mtime):
+        return flat.get(get_suffix(name), "Others")
+
+    bench("dict (예전 방식)", legacy, names)
+    bench("compiled (확장자만)", compile_rules(SIMPLE_RULES).classify, names)
+    bench("compiled (복합 규칙)", compile_rules(RICH_RULES).classify, names)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# 첫 창이 뜰 때까지의 시간 벤치마크 (회귀 확인용)
+#
+#   python benchmarks/bench_startup.py --runs 10
+#   python benchmarks/bench_startup.py --save baseline_startup.json
+#   python benchmarks/bench_startup.py --baseline baseline_startup.json --tolerance 0.2
+#
+# 새 프로세스에서 main.py 와 같은 순서로 창을 띄우고, 창이 처음 그려지는 순간까지를
+# 잰다 (인터프리터 시작 포함). 설정 폴더는 임시 폴더를 쓴다.
+# 화면이 없으면 QT_QPA_PLATFORM=offscreen 으로 실행한다.
+# --baseline 보다 중간값이 tolerance 이상 느리면 종료 코드 1.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 자식 프로세스: 창이 처음 그려지면 (시각, 미뤄 둔 일까지 끝난 시각) 을 출력하고 종료
+DRIVER = r"""
+import sys, time
+sys.path.insert(0, sys.argv[1])
+from PySide6.QtCore import QObject, QEvent, QTimer
+from PySide6.QtWidgets import QApplication
+from organizer.ui import FileOrganizerUI
+
+app = QApplication(sys.argv[:1])
+win = FileOrganizerUI()
+times = []
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and not times:
+            times.append(time.time())
+            # 첫 화면 뒤의 일(규칙 목록 채우기 등)이 끝난 다음 종료
+            QTimer.singleShot(0, lambda: QTimer.singleShot(0, done))
+        return False
+
+def done():
+    times.append(time.time())
+    print(" ".join(repr(t) for t in times))
+    app.quit()
+
+watcher = FirstPaint()
+win.installEventFilter(watcher)
+win.show()
+app.exec()
+"""
+
+
+def run_once(env: dict) -> tuple[float, float]:
+    start = time.time()
+    out = subprocess.run(
+        [sys.executable, "-c", DRIVER, str(ROOT)],
+        env=env, capture_output=True, text=True, timeout=60,
+    )
+    if out.returncode != 0:
+        raise RuntimeError(f"창을 띄우지 못했습니다:\n{out.stderr}")
+    first_paint, ready = (float(t) for t in out.stdout.split())
+    return first_paint - start, ready - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--save", type=Path, help="결과를 기준값으로 저장")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준값 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, USERPROFILE=home, APPDATA=home)
+        if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+            env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+        # 첫 실행은 설정 파일 생성, 디스크 캐시 준비 때문에 버린다
+        run_once(env)
+        results = [run_once(env) for _ in range(args.runs)]
+
+    first_paint = statistics.median(r[0] for r in results) * 1000
+    ready = statistics.median(r[1] for r in results) * 1000
+    print(f"첫 화면      {first_paint:8.1f} ms (중간값, {args.runs}회)")
+    print(f"준비 완료    {ready:8.1f} ms")
+
+    result = {"first_paint_ms": round(first_paint, 1), "ready_ms": round(ready, 1)}
+    if args.save:
+        args.save.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        limit = baseline["first_paint_ms"] * (1 + args.tolerance)
+        if first_paint > limit:
+            print(f"느려짐: 기준 {baseline['first_paint_ms']:.1f} ms → {first_paint:.1f} ms")
+            return 1
+        print(f"기준 {baseline['first_paint_ms']:.1f} ms 이내")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
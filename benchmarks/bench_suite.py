@@ -0,0 +1,394 @@
+# 정리 / 이름 충돌 / 되돌리기 기록 / 되돌리기 벤치마크 모음
+#
+#   python benchmarks/bench_suite.py --files 1k 100k
+#   python benchmarks/bench_suite.py --files 100k --src /dev/shm --dest . --save base.json
+#   python benchmarks/bench_suite.py --files 100k --baseline base.json --strace
+#
+# 벤치마크마다 새 프로세스에서 synth.py 로 대상 폴더를 만든 뒤 측정한다.
+#   files/s        : 처리한 파일 수 / 걸린 시간
+#   calls/file     : 측정 구간에서 Python 이 부른 os 함수 수 (stat, rename, open ...)
+#   syscalls/file  : --strace 일 때 strace 로 센 실제 시스템 콜 수
+#   peak RSS       : 측정 구간의 최대 메모리 (Linux 는 준비 단계를 빼고 잰다)
+# --baseline 과 비교해 tolerance 이상 나빠진 항목이 있으면 종료 코드 1.
+import argparse
+import builtins
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from synth import SynthSpec, make_tree, parse_count, add_spec_args, spec_from_args
+
+BENCHMARKS = ["organize", "conflict", "undo_log", "undo"]
+
+# 세는 os 함수 (다른 함수는 대부분 이것들을 거친다)
+COUNTED = [
+    "stat", "lstat", "fstat", "scandir", "listdir", "open", "close", "read", "write",
+    "rename", "replace", "link", "unlink", "mkdir", "rmdir", "fsync", "utime",
+    "chmod", "sendfile", "copy_file_range",
+]
+
+# strace 출력에서 측정 구간을 찾기 위한 표시 (없는 경로를 stat 한다)
+MARK_START = "/.bench-suite-start"
+MARK_END = "/.bench-suite-end"
+
+# 값이 클수록 좋은 항목 / 작을수록 좋은 항목
+HIGHER_IS_BETTER = {"files_per_sec"}
+LOWER_IS_BETTER = {"calls_per_file", "syscalls_per_file", "peak_rss_mb"}
+
+
+class CallCounter:
+    # os 함수를 감싸서 부른 횟수를 센다 (with 블록 안에서만)
+    def __init__(self):
+        self.counts = {}
+        self.saved = []
+
+    def wrap(self, module, name: str, key: str):
+        func = getattr(module, name, None)
+        if func is None:
+            return
+        counts = self.counts
+
+        def counted(*args, **kwargs):
+            counts[key] = counts.get(key, 0) + 1
+            return func(*args, **kwargs)
+
+        self.saved.append((module, name, func))
+        setattr(module, name, counted)
+
+    def __enter__(self):
+        for name in COUNTED:
+            self.wrap(os, name, name)
+        # pathlib / 파일 객체는 io.open 을 쓴다
+        self.wrap(builtins, "open", "open")
+        self.wrap(io, "open", "open")
+        return self
+
+    def __exit__(self, *exc):
+        for module, name, func in reversed(self.saved):
+            setattr(module, name, func)
+        self.saved = []
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def mark(path: str):
+    try:
+        os.stat(path)
+    except OSError:
+        pass
+
+
+def reset_peak_rss() -> bool:
+    # Linux 4.0+ : VmHWM 을 현재 값으로 되돌린다
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss_mb() -> float | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def organize(target: Path, dest: Path | None, args, recursive: bool) -> int:
+    from organizer.core import organize_desktop
+    from organizer.settings import DEFAULT_SETTINGS
+
+    return organize_desktop(
+        target_dir=target,
+        rules=DEFAULT_SETTINGS["rules"],
+        exclude_extensions=[],
+        mode="move",
+        conflict_mode="rename",
+        archive_folder=str(dest) if dest else DEFAULT_SETTINGS["archive_folder"],
+        exclude_hidden=True,
+        workers=args.workers,
+        recursive=recursive,
+    )
+
+
+# ---------- 벤치마크 본체 (자식 프로세스) ----------
+# setup(work, spec, args) -> 측정할 함수, 측정할 함수() -> 처리한 파일 수
+
+def setup_organize(work: Path, spec: SynthSpec, args):
+    target, dest = work / "target", get_dest(work, args)
+    make_tree(target, spec, dest_dir=dest or target / "Archive")
+    return lambda: organize(target, dest, args, spec.depth > 0)
+
+
+def setup_conflict(work: Path, spec: SynthSpec, args):
+    # 이미 있는 이름마다 _1 .. _chain 까지 차 있는 폴더에서 빈 이름 찾기
+    from organizer.dest_index import DestIndex
+
+    dest = work / "dest"
+    dest.mkdir()
+    names = [f"photo_{i:07}.jpg" for i in range(spec.files)]
+    for i, name in enumerate(names):
+        (dest / name).touch()
+        if i % 10 == 0:
+            for n in range(1, args.chain + 1):
+                (dest / f"photo_{i:07}_{n}.jpg").touch()
+
+    def run():
+        # 실제 실행처럼 폴더 목록은 한 번 읽고 이후는 메모리에서
+        index = DestIndex()
+        for name in names:
+            index.allocate(dest / name, "rename")
+        return len(names)
+
+    return run
+
+
+def setup_undo_log(work: Path, spec: SynthSpec, args):
+    # 기록 하나에 spec.files 개, args.entries 번 — 보관 개수를 넘으면 오래된 기록이 지워진다
+    from organizer.undo import write_undo_log
+
+    operations = [
+        {
+            "from": str(work / f"file_{i:07}.jpg"),
+            "to": str(work / "Archive" / "Images" / f"file_{i:07}.jpg"),
+            "size": 1024,
+            "category": "Images",
+        }
+        for i in range(spec.files)
+    ]
+
+    def run():
+        for _ in range(args.entries):
+            write_undo_log(operations)
+        return len(operations) * args.entries
+
+    return run
+
+
+def setup_undo(work: Path, spec: SynthSpec, args):
+    from organizer.undo import undo_last_operation
+
+    target, dest = work / "target", get_dest(work, args)
+    make_tree(target, spec, dest_dir=dest or target / "Archive")
+    organize(target, dest, args, spec.depth > 0)
+
+    def run():
+        report = undo_last_operation(workers=args.workers)
+        return len(report.restored)
+
+    return run
+
+
+SETUPS = {
+    "organize": setup_organize,
+    "conflict": setup_conflict,
+    "undo_log": setup_undo_log,
+    "undo": setup_undo,
+}
+
+
+def get_dest(work: Path, args) -> Path | None:
+    # --dest 를 주면 정리 폴더를 그쪽(다른 장치일 수 있음)에 만든다
+    # (부모가 끝나면 지운다)
+    if not args.dest:
+        return None
+    return get_dest_root(work, args.dest) / "Archive"
+
+
+def get_dest_root(work: Path, dest: str) -> Path:
+    return Path(dest) / f"{work.name}-dest"
+
+
+def run_child(args) -> dict:
+    work = Path(args.work)
+    spec = spec_from_args(args, args.child_files)
+    run = SETUPS[args.child](work, spec, args)
+
+    reset = reset_peak_rss()
+    with CallCounter() as counter:
+        mark(MARK_START)
+        start = time.perf_counter()
+        done = run()
+        elapsed = time.perf_counter() - start
+        mark(MARK_END)
+
+    return {
+        "files": done,
+        "seconds": round(elapsed, 4),
+        "files_per_sec": round(done / elapsed, 1) if elapsed > 0 else None,
+        "calls_per_file": round(counter.total / done, 2) if done else None,
+        "calls": counter.counts,
+        "peak_rss_mb": round(get_peak_rss_mb() or 0, 1) or None,
+        "rss_includes_setup": not reset,
+    }
+
+
+# ---------- 부모 프로세스 ----------
+
+def count_traced(trace: Path) -> int | None:
+    # 표시 사이의 줄 수 = 시스템 콜 수 (-f 의 resumed 줄은 한 번만 센다)
+    count = None
+    with open(trace, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if MARK_START in line:
+                count = 0
+            elif MARK_END in line:
+                return count
+            elif count is not None and "resumed>" not in line and "+++" not in line:
+                count += 1
+    return None
+
+
+def run_benchmark(name: str, files: int, args, argv: list) -> dict:
+    work = Path(tempfile.mkdtemp(dir=args.src))
+    out = work / "result.json"
+    trace = work / "strace.txt"
+    # 되돌리기 기록이 실제 설정 폴더에 쌓이지 않도록 분리
+    home = work / "home"
+    home.mkdir()
+    env = dict(os.environ, HOME=str(home), APPDATA=str(home), USERPROFILE=str(home))
+
+    cmd = [
+        sys.executable, __file__, *argv,
+        "--child", name, "--child-files", str(files), "--work", str(work), "--out", str(out),
+    ]
+    if args.strace:
+        cmd = ["strace", "-f", "-qq", "-e", "trace=all", "-o", str(trace), *cmd]
+
+    try:
+        subprocess.run(cmd, env=env, check=True)
+        result = json.loads(out.read_text(encoding="utf-8"))
+        if args.strace:
+            syscalls = count_traced(trace)
+            if syscalls is not None and result["files"]:
+                result["syscalls_per_file"] = round(syscalls / result["files"], 2)
+        return result
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+        if args.dest:
+            shutil.rmtree(get_dest_root(work, args.dest), ignore_errors=True)
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric in HIGHER_IS_BETTER | LOWER_IS_BETTER:
+            new, old = result.get(metric), base.get(metric)
+            if not new or not old:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                worse = new < old * (1 - tolerance)
+            else:
+                worse = new > old * (1 + tolerance)
+            if worse:
+                regressions.append(f"{key} {metric}: {old} → {new}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bench", nargs="+", choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument("--files", type=parse_count, nargs="+", default=[1000])
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chain", type=int, default=5, help="conflict: 이미 차 있는 번호 수")
+    parser.add_argument("--entries", type=int, default=20, help="undo_log: 기록 수")
+    parser.add_argument("--src", help="대상 폴더를 만들 곳 (예: /dev/shm)")
+    parser.add_argument("--dest", help="정리 폴더를 만들 곳 (다른 장치면 복사 + 삭제)")
+    parser.add_argument("--strace", action="store_true", help="strace 로 시스템 콜 수 세기")
+    parser.add_argument("--save", type=Path, help="결과를 기준값으로 저장")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준값 파일")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    add_spec_args(parser)
+    # 자식 프로세스용
+    parser.add_argument("--child", choices=BENCHMARKS, help=argparse.SUPPRESS)
+    parser.add_argument("--child-files", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--work", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_child(args)
+        Path(args.out).write_text(json.dumps(result), encoding="utf-8")
+        return 0
+
+    if args.strace and shutil.which("strace") is None:
+        parser.error("strace 가 없습니다.")
+
+    # 자식에게 그대로 넘길 설정 (벤치마크 선택, 기준값 관련 인자는 빼고)
+    argv = [
+        "--workers", str(args.workers), "--chain", str(args.chain),
+        "--entries", str(args.entries),
+        "--mix", args.mix, "--sizes", args.sizes, "--dup-names", str(args.dup_names),
+        "--hidden", str(args.hidden), "--depth", str(args.depth),
+        "--fanout", str(args.fanout), "--seed", str(args.seed),
+    ]
+    if args.dense:
+        argv.append("--dense")
+    if args.dest:
+        argv += ["--dest", str(Path(args.dest).resolve())]
+
+    # 같은 장치 / 다른 장치 결과는 따로 비교한다
+    layout = "same"
+    if args.dest:
+        src = Path(args.src or tempfile.gettempdir())
+        if os.stat(src).st_dev != os.stat(args.dest).st_dev:
+            layout = "cross"
+        print(f"src={src} dest={Path(args.dest).resolve()} layout={layout}")
+
+    results = {}
+    print(f"{'benchmark':<24} {'files/s':>12} {'calls/file':>11} {'syscalls/file':>14} {'peak RSS':>10}")
+    for files in args.files:
+        for name in args.bench:
+            key = f"{name}@{files}/{layout}"
+            result = run_benchmark(name, files, args, argv)
+            results[key] = result
+            syscalls = result.get("syscalls_per_file")
+            rss = result["peak_rss_mb"]
+            print(
+                f"{key:<24} {result['files_per_sec'] or 0:>12,.0f} "
+                f"{result['calls_per_file'] or 0:>11.2f} "
+                f"{'-' if syscalls is None else f'{syscalls:.2f}':>14} "
+                f"{'-' if rss is None else f'{rss:.1f} MB':>10}",
+                flush=True,
+            )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"느려짐: {line}")
+        if regressions:
+            return 1
+        print("기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
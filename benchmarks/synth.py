@@ -0,0 +1,178 @@
+# 벤치마크용 가짜 대상 폴더 만들기
+#
+#   python benchmarks/synth.py /dev/shm/desk --files 100k --mix photos --depth 2
+#
+# 확장자 비율, 크기 분포, 숨김 파일 비율, 하위 폴더 깊이, 정리 폴더에 같은 이름이
+# 이미 있는 비율(이름 충돌)을 정할 수 있다. 기본은 크기만 잡은 sparse 파일이라
+# 1M 개도 디스크를 거의 쓰지 않는다 (--dense 면 실제로 채운다).
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from organizer.rules import compile_rules, OTHERS
+from organizer.settings import DEFAULT_SETTINGS
+
+# 확장자 -> 비율
+EXT_MIXES = {
+    "mixed": {
+        ".jpg": 25, ".png": 10, ".pdf": 12, ".docx": 8, ".xlsx": 5, ".mp4": 5,
+        ".zip": 5, ".txt": 10, ".log": 8, ".tar.gz": 2, "": 5, ".JPG": 5,
+    },
+    "photos": {".jpg": 60, ".jpeg": 5, ".heic": 15, ".png": 10, ".mov": 5, ".mp4": 5},
+    "docs": {".pdf": 40, ".docx": 20, ".xlsx": 15, ".pptx": 5, ".txt": 15, ".hwp": 5},
+}
+
+# (크기, 비율)
+SIZE_DISTS = {
+    "empty": [(0, 1)],
+    "small": [(0, 5), (1024, 45), (16 * 1024, 40), (256 * 1024, 10)],
+    "mixed": [(1024, 40), (64 * 1024, 35), (1024 ** 2, 20), (16 * 1024 ** 2, 5)],
+    "large": [(1024 ** 2, 50), (16 * 1024 ** 2, 40), (256 * 1024 ** 2, 10)],
+}
+
+NAME_PREFIXES = ["IMG", "Screenshot", "report", "scan", "download", "data"]
+WRITE_BLOCK = 1024 * 1024
+
+
+class SynthSpec(NamedTuple):
+    files: int = 1000
+    mix: str = "mixed"
+    sizes: str = "small"
+    dup_names: float = 0.1      # 정리 폴더에 같은 이름이 이미 있는 비율
+    hidden: float = 0.05        # 숨김 파일 비율
+    depth: int = 0              # 하위 폴더 깊이 (0 이면 대상 폴더 바로 아래만)
+    fanout: int = 8             # 폴더마다 하위 폴더 수
+    dense: bool = False         # False 면 sparse 파일 (크기만)
+    seed: int = 42
+
+
+def parse_count(text: str) -> int:
+    # 1k, 100k, 1M 같은 표기
+    units = {"k": 1000, "m": 1000 ** 2}
+    text = text.strip().lower()
+    if text[-1:] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def make_dirs(root: Path, depth: int, fanout: int) -> list[Path]:
+    dirs = [root]
+    level = [root]
+    for d in range(depth):
+        next_level = []
+        for parent in level:
+            for i in range(fanout):
+                child = parent / f"dir{d}_{i}"
+                child.mkdir(exist_ok=True)
+                next_level.append(child)
+        dirs.extend(next_level)
+        level = next_level
+    return dirs
+
+
+def write_file(path: Path, size: int, dense: bool, tag: int):
+    with open(path, "wb") as f:
+        if not dense:
+            f.truncate(size)
+            return
+        # 같은 내용이 되지 않도록 앞에 번호를 넣는다 (중복 검사에 걸리지 않게)
+        head = tag.to_bytes(8, "little")
+        f.write(head[:size])
+        left = size - min(size, len(head))
+        block = bytes(WRITE_BLOCK)
+        while left > 0:
+            f.write(block[:left])
+            left -= WRITE_BLOCK
+
+
+def make_tree(
+    target: Path,
+    spec: SynthSpec,
+    rules: dict | None = None,
+    dest_dir: Path | None = None,
+) -> dict:
+    # target 아래에 파일을 만들고, dest_dir(정리 폴더) 의 카테고리 폴더에
+    # dup_names 비율만큼 같은 이름의 파일을 미리 만들어 둔다
+    # 반환: 만든 개수 요약
+    rng = random.Random(spec.seed)
+    rules = rules or DEFAULT_SETTINGS["rules"]
+    matcher = compile_rules(rules)
+    dest_dir = dest_dir or target / DEFAULT_SETTINGS["archive_folder"]
+
+    exts = list(EXT_MIXES[spec.mix])
+    ext_weights = list(EXT_MIXES[spec.mix].values())
+    sizes = [size for size, _ in SIZE_DISTS[spec.sizes]]
+    size_weights = [weight for _, weight in SIZE_DISTS[spec.sizes]]
+
+    target.mkdir(parents=True, exist_ok=True)
+    dirs = make_dirs(target, spec.depth, spec.fanout)
+    made_dest = set()
+    stats = {"files": 0, "bytes": 0, "hidden": 0, "dup_names": 0, "dirs": len(dirs)}
+
+    for i in range(spec.files):
+        ext = rng.choices(exts, ext_weights)[0]
+        size = rng.choices(sizes, size_weights)[0]
+        name = f"{rng.choice(NAME_PREFIXES)}_{i:07}{ext}"
+        if rng.random() < spec.hidden:
+            name = "." + name
+            stats["hidden"] += 1
+
+        write_file(rng.choice(dirs) / name, size, spec.dense, i)
+        stats["files"] += 1
+        stats["bytes"] += size
+
+        if not name.startswith(".") and rng.random() < spec.dup_names:
+            category = matcher.classify(name, size, 0.0) or OTHERS
+            category_dir = dest_dir / category
+            if category_dir not in made_dest:
+                category_dir.mkdir(parents=True, exist_ok=True)
+                made_dest.add(category_dir)
+            write_file(category_dir / name, 0, False, i)
+            stats["dup_names"] += 1
+
+    return stats
+
+
+def add_spec_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--mix", choices=list(EXT_MIXES), default="mixed")
+    parser.add_argument("--sizes", choices=list(SIZE_DISTS), default="small")
+    parser.add_argument("--dup-names", type=float, default=0.1)
+    parser.add_argument("--hidden", type=float, default=0.05)
+    parser.add_argument("--depth", type=int, default=0)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--dense", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def spec_from_args(args, files: int) -> SynthSpec:
+    return SynthSpec(
+        files=files,
+        mix=args.mix,
+        sizes=args.sizes,
+        dup_names=args.dup_names,
+        hidden=args.hidden,
+        depth=args.depth,
+        fanout=args.fanout,
+        dense=args.dense,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("target", type=Path)
+    parser.add_argument("--files", type=parse_count, default=1000)
+    parser.add_argument("--dest", type=Path, help="정리 폴더 (기본: target/Archive)")
+    add_spec_args(parser)
+    args = parser.parse_args()
+
+    stats = make_tree(args.target, spec_from_args(args, args.files), dest_dir=args.dest)
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
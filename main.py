@@ -1,16 +1,27 @@
 import sys
+import time
+
+STARTED = time.perf_counter()
+
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(BASE_DIR))
 
+# FILEORGANIZER_STARTUP_TRACE=1 이면 이후 import 시간과 첫 화면까지의 시간을 잰다
+from organizer import startup
+startup.begin(STARTED)
+
 from PySide6.QtWidgets import QApplication
 from organizer.ui import FileOrganizerUI
 
 
 def main():
+    startup.mark("imports")
     app = QApplication(sys.argv)
+    startup.mark("QApplication")
     win = FileOrganizerUI()
+    startup.mark("window built")
     win.show()
     sys.exit(app.exec())
 
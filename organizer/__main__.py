@@ -0,0 +1,4 @@
+import sys
+from organizer.cli import main
+
+sys.exit(main())
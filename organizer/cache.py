@@ -0,0 +1,111 @@
+import sqlite3
+import threading
+import time
+from organizer.platform import get_config_dir
+
+# 캐시 정리 기준 — 닫을 때 이번에 새로 쓴 것이 있으면 정리한다
+#   오래 쓰이지 않은 항목 (지워졌거나 바뀐 파일의 옛 키가 대부분) 부터 지운다
+CACHE_MAX_AGE_DAYS = 90
+CACHE_MAX_ENTRIES = 500_000
+TOUCH_INTERVAL = 86400      # 쓰인 시각은 하루에 한 번만 갱신한다 (읽을 때마다 쓰지 않도록)
+
+
+def file_key(dev: int, ino: int, size: int, mtime: float, path: str = "") -> str:
+    # 내용이 바뀌면 크기나 수정 시각이 바뀌므로 같은 키면 같은 내용으로 본다
+    # inode 를 주지 않는 파일시스템(Windows scandir 등)에서는 경로로 대신한다
+    ident = ino if ino else path
+    return f"{dev}:{ident}:{size}:{mtime!r}"
+
+
+# (dev, inode, size, mtime) → 값 을 저장하는 영구 캐시
+# 이름마다 설정 폴더 아래 sqlite 파일 하나를 쓴다
+class FileCache:
+    def __init__(
+        self,
+        name: str,
+        max_age_days: float | None = CACHE_MAX_AGE_DAYS,
+        max_entries: int | None = CACHE_MAX_ENTRIES,
+    ):
+        path = get_config_dir() / "cache"
+        path.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(
+            path / f"{name}.sqlite", check_same_thread=False
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT, used REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(cache)")}
+        if "used" not in columns:
+            # 쓰인 시각이 없던 캐시 — 지금 쓴 것으로 보고 이어서 쓴다
+            self.conn.execute("ALTER TABLE cache ADD COLUMN used REAL NOT NULL DEFAULT 0")
+            self.conn.execute("UPDATE cache SET used = ?", (time.time(),))
+        self.conn.execute("CREATE INDEX IF NOT EXISTS cache_used ON cache (used)")
+        self.conn.commit()
+        self.lock = threading.Lock()
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self.written = False
+
+    def get_many(self, keys: list[str]) -> dict:
+        found = {}
+        stale = []
+        now = time.time()
+        with self.lock:
+            # sqlite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT key, value, used FROM cache WHERE key IN ({marks})", chunk
+                )
+                for key, value, used in rows:
+                    found[key] = value
+                    if now - used > TOUCH_INTERVAL:
+                        stale.append((now, key))
+            if stale:
+                self.conn.executemany("UPDATE cache SET used = ? WHERE key = ?", stale)
+                self.conn.commit()
+        return found
+
+    def get(self, key: str) -> str | None:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: dict):
+        if not items:
+            return
+        now = time.time()
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, used) VALUES (?, ?, ?)",
+                ((key, value, now) for key, value in items.items()),
+            )
+            self.conn.commit()
+            self.written = True
+
+    def put(self, key: str, value: str):
+        self.put_many({key: value})
+
+    def prune(self):
+        # 오래 쓰이지 않은 항목, 그리고 개수 한도를 넘는 만큼 오래된 것부터 지운다
+        with self.lock:
+            if self.max_age_days is not None:
+                self.conn.execute(
+                    "DELETE FROM cache WHERE used < ?",
+                    (time.time() - self.max_age_days * 86400,),
+                )
+            if self.max_entries is not None:
+                (count,) = self.conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+                if count > self.max_entries:
+                    self.conn.execute(
+                        "DELETE FROM cache WHERE key IN "
+                        "(SELECT key FROM cache ORDER BY used LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+            self.conn.commit()
+
+    def close(self):
+        if self.written:
+            self.prune()
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,524 @@
+import argparse
+import csv
+import json
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from organizer.core import iter_plan, execute_plan
+from organizer.report import RunReport, format_report, load_latest_report
+from organizer.roots import organize_roots
+from organizer.settings import load_settings, get_plan_options, get_root_options
+from organizer.snapshot import load_snapshot
+from organizer.undo import (
+    get_undo_files, read_undo_header, undo_entry, find_root_entry, UndoFilter
+)
+from organizer.undo_store import get_latest_entry, get_entry_seq, find_entry, get_undo_dir
+
+# python -m organizer {run, preview, undo, history, report, watch}
+# Qt 를 불러오지 않으므로 화면 없는 서버/스케줄러에서도 쓸 수 있다
+EXIT_OK = 0
+EXIT_ERROR = 1          # 설정 오류, 실행 중 예외
+EXIT_USAGE = 2          # 잘못된 인자 (argparse)
+EXIT_PARTIAL = 3        # 일부만 처리됨 (충돌, 취소)
+EXIT_NOTHING = 4        # 되돌릴 기록이 없음
+EXIT_INTERRUPTED = 130  # Ctrl+C
+
+PROGRESS_INTERVAL = 1.0
+
+PLAN_FIELDS = ["root", "source", "destination", "category", "conflict", "action", "original", "size"]
+
+
+class CliError(Exception):
+    pass
+
+
+def parse_time(text: str) -> float:
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"시각은 ISO 형식이어야 합니다: {text}")
+
+
+def add_settings_args(parser: argparse.ArgumentParser):
+    # 설정 파일 값을 명령줄에서 덮어쓴다 (주지 않으면 설정 파일 값)
+    parser.add_argument("--settings", type=Path, help="설정 파일 (기본: 프로그램 설정)")
+    parser.add_argument("--target", help="정리할 폴더 (설정의 roots 대신 이 폴더 하나만)")
+    parser.add_argument("--root", action="append", help="정리할 폴더 (여러 번 지정 가능, 설정의 roots 대신)")
+    parser.add_argument("--mode", choices=["move", "inplace"])
+    parser.add_argument("--conflict", choices=["rename", "overwrite"])
+    parser.add_argument("--archive", help="정리 폴더 이름")
+    parser.add_argument("--recursive", action=argparse.BooleanOptionalAction, default=None)
+    parser.add_argument("--max-depth", type=int)
+    parser.add_argument("--sniff", action=argparse.BooleanOptionalAction, default=None)
+    parser.add_argument("--duplicates", choices=["off", "skip", "hardlink", "move"])
+    parser.add_argument("--date-folders", choices=["off", "year", "month"], help="카테고리 아래를 날짜로 나누기")
+    parser.add_argument("--incremental", action=argparse.BooleanOptionalAction, default=None)
+    parser.add_argument("--exclude", action="append", help="제외 패턴 추가 (.gitignore 형식, 여러 번 지정 가능)")
+
+
+def build_settings(args) -> dict:
+    try:
+        settings = load_settings(args.settings)
+    except FileNotFoundError:
+        raise CliError(f"설정 파일이 없습니다: {args.settings}")
+    except json.JSONDecodeError as e:
+        raise CliError(f"설정 파일을 읽을 수 없습니다: {e}")
+
+    overrides = {
+        "target_dir": args.target,
+        "mode": args.mode,
+        "on_conflict": args.conflict,
+        "archive_folder": args.archive,
+        "recursive": args.recursive,
+        "max_depth": args.max_depth,
+        "content_sniffing": args.sniff,
+        "incremental_scan": args.incremental,
+    }
+    for key, value in overrides.items():
+        if value is not None:
+            settings[key] = value
+    if args.duplicates is not None:
+        settings["duplicates"] = None if args.duplicates == "off" else args.duplicates
+    if args.date_folders is not None:
+        settings["date_folders"] = None if args.date_folders == "off" else args.date_folders
+    if args.exclude:
+        settings["exclude_patterns"] = list(settings["exclude_patterns"]) + args.exclude
+    if args.target is not None:
+        settings["roots"] = []
+    elif args.root:
+        settings["roots"] = [{"path": path} for path in args.root]
+
+    if not settings.get("mode"):
+        raise CliError("정리 방식을 정하세요 (--mode move|inplace 또는 설정 저장).")
+    if not settings.get("on_conflict"):
+        raise CliError("같은 이름 처리 방식을 정하세요 (--conflict rename|overwrite 또는 설정 저장).")
+    # 여러 폴더는 없는 폴더가 있어도 나머지를 정리하고 결과에 오류로 남긴다
+    if not settings["roots"] and not Path(settings["target_dir"]).is_dir():
+        raise CliError(f"대상 폴더가 없습니다: {settings['target_dir']}")
+    return settings
+
+
+def get_options(settings: dict) -> dict:
+    try:
+        return get_plan_options(settings)
+    except ValueError as e:
+        raise CliError(f"분류 규칙 오류: {e}")
+
+
+def get_all_options(settings: dict) -> list[dict]:
+    try:
+        return get_root_options(settings)
+    except ValueError as e:
+        raise CliError(f"대상 폴더 설정 오류: {e}")
+
+
+def write_json(data):
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+def make_progress(enabled: bool):
+    # 진행 상황은 stderr 로 (stdout 은 결과 출력용)
+    if not enabled:
+        return None
+    last = 0.0
+
+    def progress(done: int, bytes_done: int, total: int | None):
+        nonlocal last
+        now = time.monotonic()
+        if now - last < PROGRESS_INTERVAL and done != total:
+            return
+        last = now
+        suffix = f"/{total}" if total is not None else ""
+        print(f"\r{done}{suffix}개 · {bytes_done:,} bytes", end="", file=sys.stderr, flush=True)
+
+    return progress
+
+
+def install_cancel() -> threading.Event:
+    # 첫 Ctrl+C 는 현재 파일까지만 처리하고 멈춘다 (두 번째는 즉시 종료)
+    cancel = threading.Event()
+
+    def handler(signum, frame):
+        if cancel.is_set():
+            raise KeyboardInterrupt
+        cancel.set()
+        print("\n취소하는 중... (한 번 더 누르면 즉시 종료)", file=sys.stderr)
+
+    signal.signal(signal.SIGINT, handler)
+    return cancel
+
+
+def plan_record(move, root) -> dict:
+    return {
+        "root": str(root),
+        "source": str(move.source),
+        "destination": str(move.destination),
+        "category": move.category,
+        "conflict": move.conflict,
+        "action": move.action,
+        "original": move.original,
+        "size": move.size,
+    }
+
+
+def iter_root_plans(settings: dict):
+    # (대상 폴더, 계획) — 여러 폴더면 차례로
+    for options in get_all_options(settings):
+        yield options["target_dir"], iter_plan(**options)
+
+
+def cmd_preview(args) -> int:
+    settings = build_settings(args)
+    plans = iter_root_plans(settings)
+
+    if args.format == "json":
+        write_json([plan_record(move, root) for root, plan in plans for move in plan])
+    elif args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=PLAN_FIELDS)
+        writer.writeheader()
+        for root, plan in plans:
+            for move in plan:
+                writer.writerow(plan_record(move, root))
+    else:
+        count = 0
+        many = len(settings["roots"]) > 1
+        for target_dir, plan in plans:
+            if many:
+                print(f"[{target_dir}]")
+            try:
+                for move in plan:
+                    count += 1
+                    if move.action == "skip":
+                        print(f"{move.source.name}  (중복 · 건너뜀)")
+                        continue
+                    line = f"{move.source.name} → {move.destination.relative_to(target_dir)}"
+                    if move.conflict != "none":
+                        line += f"  ({move.conflict})"
+                    if move.action != "move":
+                        line += f"  (중복 · {move.action})"
+                    print(line)
+            except OSError as e:
+                if not many:
+                    raise
+                print(f"  오류: {e}", file=sys.stderr)
+        print(f"* 총 {count}개 파일", file=sys.stderr)
+    return EXIT_OK
+
+
+def cmd_run(args) -> int:
+    settings = build_settings(args)
+    if settings["roots"]:
+        return run_roots(args, settings)
+
+    options = get_options(settings)
+    cancel = install_cancel()
+
+    snapshot = None
+    if settings["incremental_scan"]:
+        snapshot = load_snapshot(options, settings["full_rescan_hours"])
+
+    report = None
+    profile = args.profile or settings["run_profile"]
+    if args.report or profile or settings["run_report"]:
+        report = RunReport(profile)
+
+    started = time.monotonic()
+    moved = execute_plan(
+        iter_plan(**options, snapshot=snapshot, report=report),
+        workers=args.workers or settings["workers"],
+        progress=make_progress(args.progress),
+        verify=settings["verify_copy"],
+        cancel=cancel,
+        durability=settings["journal_durability"],
+        retention=settings["undo_retention"],
+        compress=settings["undo_compress"],
+        snapshot=snapshot,
+        report=report,
+        root=str(options["target_dir"].absolute()),
+        keep_replaced=settings["keep_replaced"],
+        staging_retention=settings["staging_retention"],
+    )
+    elapsed = time.monotonic() - started
+    if args.progress:
+        print(file=sys.stderr)
+
+    latest = get_latest_entry() if moved else None
+    result = {
+        "moved": moved,
+        "cancelled": cancel.is_set(),
+        "seconds": round(elapsed, 3),
+        "undo_entry": str(latest) if latest else None,
+        "report_path": str(report.path) if report else None,
+    }
+    if args.json:
+        if args.report:
+            result["report"] = report.to_dict()
+        write_json(result)
+    else:
+        status = "취소됨" if cancel.is_set() else "완료"
+        print(f"{status}: {moved}개 파일 정리 ({elapsed:.2f}초)")
+        if args.report:
+            print(format_report(report.to_dict()))
+    return EXIT_PARTIAL if cancel.is_set() else EXIT_OK
+
+
+def run_roots(args, settings: dict) -> int:
+    # 설정의 roots (또는 --root) 를 드라이브별로 나눠 동시에 정리한다
+    if args.profile:
+        raise CliError("여러 폴더를 함께 정리할 때는 --profile 을 쓸 수 없습니다 (--target 으로 한 폴더만).")
+    root_options = get_all_options(settings)
+    cancel = install_cancel()
+
+    started = time.monotonic()
+    results = organize_roots(
+        root_options,
+        per_device=settings["device_concurrency"],
+        max_parallel=settings["max_parallel_roots"],
+        progress=make_progress(args.progress),
+        cancel=cancel,
+        retention=settings["undo_retention"],
+        workers=args.workers or settings["workers"],
+        verify=settings["verify_copy"],
+        durability=settings["journal_durability"],
+        compress=settings["undo_compress"],
+        incremental=settings["incremental_scan"],
+        full_rescan_hours=settings["full_rescan_hours"],
+        report=args.report or settings["run_report"],
+        keep_replaced=settings["keep_replaced"],
+        staging_retention=settings["staging_retention"],
+    )
+    elapsed = time.monotonic() - started
+    if args.progress:
+        print(file=sys.stderr)
+
+    moved = sum(r.moved for r in results)
+    failed = [r for r in results if r.error]
+    if args.json:
+        roots = []
+        for r in results:
+            row = r._asdict()
+            if args.report and r.report_path:
+                row["report"] = json.loads(Path(r.report_path).read_text(encoding="utf-8"))
+            roots.append(row)
+        write_json({
+            "moved": moved,
+            "cancelled": cancel.is_set(),
+            "seconds": round(elapsed, 3),
+            "roots": roots,
+        })
+    else:
+        for r in results:
+            if r.error:
+                state = f"오류: {r.error}"
+            else:
+                state = f"{r.moved}개 ({r.seconds:.2f}초)" + (" · 취소됨" if r.cancelled else "")
+            print(f"{r.root}  {state}")
+            if args.report and r.report_path:
+                data = json.loads(Path(r.report_path).read_text(encoding="utf-8"))
+                print(format_report(data))
+        status = "취소됨" if cancel.is_set() else "완료"
+        print(f"{status}: 폴더 {len(results)}개 · {moved}개 파일 정리 ({elapsed:.2f}초)")
+
+    if failed and len(failed) == len(results):
+        return EXIT_ERROR
+    if failed or cancel.is_set():
+        return EXIT_PARTIAL
+    return EXIT_OK
+
+
+def resolve_entry(args) -> Path | None:
+    if args.entry:
+        path = Path(args.entry)
+        if path.exists():
+            return path
+        if args.entry.isdigit():
+            return find_entry(get_undo_dir(), int(args.entry))
+        return None
+    if args.root:
+        return find_root_entry(args.root)
+    return get_latest_entry()
+
+
+def cmd_undo(args) -> int:
+    path = resolve_entry(args)
+    if path is None:
+        print("되돌릴 기록이 없습니다.", file=sys.stderr)
+        return EXIT_NOTHING
+
+    selector = None
+    if args.category or args.since or args.until or args.prefix:
+        selector = UndoFilter(
+            categories=set(args.category) if args.category else None,
+            since=args.since,
+            until=args.until,
+            path_prefix=args.prefix,
+        )
+
+    cancel = install_cancel()
+    report = undo_entry(
+        path, selector,
+        progress=make_progress(args.progress),
+        cancel=cancel,
+        workers=args.workers or load_settings()["workers"],
+    )
+    if args.progress:
+        print(file=sys.stderr)
+
+    result = {
+        "entry": str(path),
+        "restored": len(report.restored),
+        "skipped": [{"op": op, "reason": reason} for op, reason in report.skipped],
+        "conflicted": [{"op": op, "reason": reason} for op, reason in report.conflicted],
+        "remaining": len(report.remaining),
+    }
+    if args.json:
+        write_json(result)
+    else:
+        print(
+            f"복원 {result['restored']}개 · 건너뜀 {len(report.skipped)}개 · "
+            f"충돌 {len(report.conflicted)}개 · 남음 {len(report.remaining)}개"
+        )
+        for op, reason in report.conflicted:
+            print(f"  충돌: {op['to']} → {op['from']} ({reason})", file=sys.stderr)
+
+    if report.conflicted or report.remaining:
+        return EXIT_PARTIAL
+    return EXIT_OK
+
+
+def cmd_history(args) -> int:
+    rows = []
+    for path in get_undo_files()[:args.limit]:
+        try:
+            header = read_undo_header(path)
+        except (OSError, ValueError) as e:
+            header = {"error": str(e)}
+        rows.append({"seq": get_entry_seq(path), "path": str(path), **header})
+
+    if args.format == "json":
+        write_json(rows)
+        return EXIT_OK
+
+    for row in rows:
+        if "error" in row:
+            print(f"{row['seq']:>6}  읽을 수 없음: {row['error']}")
+            continue
+        state = "" if row.get("committed", True) else "  (중단됨)"
+        categories = ", ".join(f"{k or '-'} {v}" for k, v in row["categories"].items())
+        root = f"  [{row['root']}]" if row.get("root") else ""
+        print(
+            f"{row['seq']:>6}  {row['timestamp'] or '-':<26} "
+            f"{row['count']:>7}개 {row['bytes']:>14,} bytes  {categories}{state}{root}"
+        )
+    return EXIT_OK
+
+
+def cmd_report(args) -> int:
+    data = load_latest_report()
+    if data is None:
+        print("저장된 실행 보고서가 없습니다.", file=sys.stderr)
+        return EXIT_NOTHING
+    if args.format == "json":
+        write_json(data)
+    else:
+        print(format_report(data))
+    return EXIT_OK
+
+
+def cmd_watch(args) -> int:
+    from organizer.watch import watch
+
+    settings = build_settings(args)
+    if settings["roots"]:
+        raise CliError("감시 모드는 폴더 하나만 지원합니다 (--target 으로 지정).")
+    options = get_options(settings)
+
+    def report(moved: int):
+        if moved:
+            print(f"[{time.strftime('%H:%M:%S')}] {moved}개 파일 정리", flush=True)
+
+    print(f"감시 시작: {options['target_dir']} (Ctrl+C 로 종료)", file=sys.stderr, flush=True)
+    try:
+        watch(
+            options,
+            workers=settings["workers"],
+            durability=settings["journal_durability"],
+            retention=settings["undo_retention"],
+            compress=settings["undo_compress"],
+            debounce=settings["watch_debounce_seconds"],
+            settle=settings["watch_settle_seconds"],
+            batch_size=settings["watch_batch_size"],
+            poll_interval=settings["watch_poll_interval"],
+            keep_replaced=settings["keep_replaced"],
+            staging_retention=settings["staging_retention"],
+            initial=args.initial,
+            on_batch=report,
+        )
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m organizer", description="FileOrganizer (GUI 없이 실행)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="정리 실행")
+    add_settings_args(p)
+    p.add_argument("--workers", type=int)
+    p.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    p.add_argument("--progress", action="store_true", help="진행 상황을 stderr 로 출력")
+    p.add_argument("--report", action="store_true", help="실행 보고서 출력")
+    p.add_argument("--profile", choices=["cprofile", "tracemalloc"], help="보고서에 프로파일 결과 포함")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("preview", help="정리 계획만 출력")
+    add_settings_args(p)
+    p.add_argument("--format", choices=["text", "json", "csv"], default="text")
+    p.set_defaults(func=cmd_preview)
+
+    p = sub.add_parser("undo", help="정리 되돌리기 (기본: 마지막 실행)")
+    p.add_argument("--entry", help="기록 번호 또는 파일 경로 (history 참고)")
+    p.add_argument("--root", help="이 대상 폴더를 정리한 마지막 기록")
+    p.add_argument("--category", action="append", help="이 카테고리만 (여러 번 지정 가능)")
+    p.add_argument("--since", type=parse_time, help="이 시각 이후에 옮긴 파일만 (ISO)")
+    p.add_argument("--until", type=parse_time, help="이 시각 이전에 옮긴 파일만 (ISO)")
+    p.add_argument("--prefix", help="이 경로 아래의 파일만")
+    p.add_argument("--workers", type=int)
+    p.add_argument("--json", action="store_true")
+    p.add_argument("--progress", action="store_true")
+    p.set_defaults(func=cmd_undo)
+
+    p = sub.add_parser("history", help="되돌리기 기록 목록")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    p.add_argument("--limit", type=int, default=None)
+    p.set_defaults(func=cmd_history)
+
+    p = sub.add_parser("report", help="마지막 실행 보고서")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("watch", help="새 파일을 감시하며 정리")
+    add_settings_args(p)
+    p.add_argument("--initial", action="store_true", help="시작할 때 이미 있는 파일도 정리")
+    p.set_defaults(func=cmd_watch)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except CliError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_ERROR
@@ -1,72 +1,640 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from itertools import islice
 from pathlib import Path
-import shutil
-from organizer.platform import is_hidden_file
-from organizer.undo import write_undo_log
+from typing import Iterable, Iterator, NamedTuple
+from organizer.dedupe import DuplicateFinder, DUPLICATE_ACTIONS
+from organizer.dest_index import DestIndex
+from organizer.excludes import compile_excludes
+from organizer.media_date import (
+    DateExtractor, DATE_FOLDER_MODES, get_date_folder, mtime_date
+)
+from organizer.report import RunReport, save_report
+from organizer.rules import get_matcher, OTHERS
+from organizer.scanner import ScanEntry, scan_dir
+from organizer.snapshot import load_snapshot, FULL_RESCAN_HOURS
+from organizer.sniff import Sniffer
+from organizer.staging import StagingArea, start_staging_eviction
+from organizer.transfer import move_file, link_file
+from organizer.undo import open_journal, finish_journal
+from organizer.walker import walk_files
 
+# 병렬 실행 시 한 번에 스레드 풀에 올리는 작업 수 (메모리 상한)
+BATCH_SIZE = 1000
+# 내용 확인(sniff) 을 한 번에 묶어 처리하는 파일 수
+SNIFF_BATCH_SIZE = 256
+# 중복 확인을 한 번에 묶어 처리하는 파일 수 (해시 계산을 병렬로 겹치는 단위)
+DEDUPE_BATCH_SIZE = 256
+# 촬영 날짜를 한 번에 묶어 읽는 파일 수
+DATE_BATCH_SIZE = 256
 
-def resolve_conflict(dest: Path, mode: str) -> Path:
-    if not dest.exists():
-        return dest
 
-    if mode == "overwrite":
-        dest.unlink()
-        return dest
+class PlannedMove(NamedTuple):
+    entry: ScanEntry
+    destination: Path
+    category: str
+    conflict: str       # none | rename | overwrite
+    action: str = "move"        # move | skip | hardlink | duplicate
+    original: str | None = None  # 중복일 때 같은 내용의 파일 (정리 후 경로)
 
-    base = dest.stem
-    ext = dest.suffix
-    i = 1
-    while True:
-        new = dest.with_name(f"{base}_{i}{ext}")
-        if not new.exists():
-            return new
-        i += 1
+    @property
+    def source(self) -> Path:
+        return Path(self.entry.path)
 
+    @property
+    def size(self) -> int:
+        return self.entry.size
 
-def organize_desktop(
+
+def get_base_dir(target_dir: Path, mode: str, archive_folder: str) -> Path:
+    if mode == "move":
+        return target_dir / archive_folder
+    return target_dir
+
+
+def get_excluded_dirs(
+    base_dir: Path,
+    target_dir: Path,
+    rules,
+    duplicates_folder: str | None = None,
+) -> list[Path]:
+    # 재귀 모드에서 이 프로그램이 만든 정리 폴더는 다시 훑지 않는다
+    if base_dir != target_dir:
+        return [base_dir]
+    categories = set(get_matcher(rules).categories) | {OTHERS}
+    if duplicates_folder:
+        categories.add(duplicates_folder)
+    return [base_dir / category for category in categories]
+
+
+def classify_entries(
+    entries: Iterable[ScanEntry],
+    rules,
+    sniff: bool = False,
+) -> Iterator[tuple[ScanEntry, str]]:
+    # rules 는 RuleMatcher 또는 dict (settings 형식 / 예전 {확장자: 카테고리})
+    classify = get_matcher(rules).classify
+
+    if not sniff:
+        for entry in entries:
+            yield entry, classify(entry.name, entry.size, entry.mtime) or OTHERS
+        return
+
+    # 규칙에 맞지 않는 파일만 앞부분을 읽어 종류를 알아낸다
+    sniffer = Sniffer()
+    try:
+        for batch in iter_batches(entries, SNIFF_BATCH_SIZE):
+            categories = [classify(e.name, e.size, e.mtime) for e in batch]
+            unknown = [e for e, c in zip(batch, categories) if c is None]
+            sniffed = sniffer.sniff_many(unknown)
+            for entry, category in zip(batch, categories):
+                if category is None and entry.path in sniffed:
+                    # 알아낸 확장자를 붙인 이름으로 다시 분류한다
+                    category = classify(
+                        entry.name + sniffed[entry.path], entry.size, entry.mtime
+                    )
+                yield entry, category or OTHERS
+    finally:
+        sniffer.close()
+
+
+def partition_entries(
+    classified: Iterable[tuple[ScanEntry, str]],
+    date_folders: str | None = None,
+    media_dates: bool = True,
+) -> Iterator[tuple[ScanEntry, str, str]]:
+    # (파일, 카테고리, 옮길 폴더) — 옮길 폴더는 카테고리 또는 카테고리/연/월
+    if not date_folders:
+        for entry, category in classified:
+            yield entry, category, category
+        return
+
+    if date_folders not in DATE_FOLDER_MODES:
+        raise ValueError(f"알 수 없는 날짜 폴더 방식: {date_folders}")
+
+    if not media_dates:
+        # 스캔할 때 읽어 둔 수정 시각만 쓴다 (디스크를 더 읽지 않음)
+        for entry, category in classified:
+            yield entry, category, get_date_folder(
+                category, mtime_date(entry.mtime), date_folders
+            )
+        return
+
+    # 사진/동영상은 헤더의 촬영 날짜, 없으면 수정 시각
+    extractor = DateExtractor()
+    try:
+        for batch in iter_batches(classified, DATE_BATCH_SIZE):
+            found = extractor.dates_many([entry for entry, _ in batch])
+            for entry, category in batch:
+                date = found.get(entry.path) or mtime_date(entry.mtime)
+                yield entry, category, get_date_folder(category, date, date_folders)
+    finally:
+        extractor.close()
+
+
+def iter_plan(
     target_dir: Path,
-    rules: dict,
+    rules,
     exclude_extensions: list,
     mode: str,
     conflict_mode: str,
     archive_folder: str,
     exclude_hidden: bool,
-):
-    operations = []
+    exclude_patterns: list | None = None,
+    recursive: bool = False,
+    max_depth: int | None = None,
+    follow_symlinks: bool = False,
+    sniff: bool = False,
+    duplicates: str | None = None,
+    duplicates_folder: str = "Duplicates",
+    date_folders: str | None = None,
+    media_dates: bool = True,
+    entries: Iterable[ScanEntry] | None = None,
+    snapshot=None,
+    report: RunReport | None = None,
+) -> Iterator[PlannedMove]:
+    # exclude_patterns: .gitignore 형식 제외 패턴 (excludes.py)
+    # duplicates: None (중복 확인 안 함) | skip | hardlink | move
+    # date_folders: None | year | month — 카테고리 폴더 아래를 날짜로 나눈다
+    #   (media_dates 면 사진/동영상은 촬영 날짜, 아니면 수정 시각)
+    # entries 를 주면 폴더를 훑지 않고 그 파일들만 계획한다 (감시 모드)
+    # snapshot(ScanSnapshot) 을 주면 바뀌지 않은 하위 폴더는 다시 읽지 않는다
+    # report(RunReport) 를 주면 단계별 시간과 이름 충돌 수를 센다
+    index = DestIndex(snapshot)
+    rules = get_matcher(rules)
+    rules.refresh()
+    allocate = index.allocate
 
     # 기준 디렉터리 결정
-    if mode == "move":
-        base_dir = target_dir / archive_folder
-    else:
-        base_dir = target_dir
+    base_dir = get_base_dir(target_dir, mode, archive_folder)
 
-    base_dir.mkdir(exist_ok=True)
+    # 제외 패턴은 한 번만 컴파일한다 (잘못된 패턴이면 ValueError)
+    excludes = compile_excludes(exclude_patterns)
 
-    for item in target_dir.iterdir():
+    if entries is None and recursive:
+        entries = walk_files(
+            target_dir,
+            max_depth=max_depth,
+            follow_symlinks=follow_symlinks,
+            exclude_dirs=get_excluded_dirs(
+                base_dir, target_dir, rules,
+                duplicates_folder if duplicates == "move" else None,
+            ),
+            exclude_hidden=exclude_hidden,
+            exclude_extensions=exclude_extensions,
+            exclude_patterns=excludes,
+            snapshot=snapshot,
+        )
+    elif entries is None:
+        entries = scan_dir(target_dir, exclude_hidden, exclude_extensions, excludes)
 
-        if exclude_hidden and is_hidden_file(item):
-            continue
+    if report is not None:
+        report.indexes.append(index)
+        entries = report.wrap("scan", entries)
 
-        if not item.is_file():
-            continue
+    classified = classify_entries(entries, rules, sniff)
+
+    if report is not None:
+        classified = report.wrap("classify", classified)
+
+    placed_entries = partition_entries(classified, date_folders, media_dates)
+    if report is not None and date_folders:
+        placed_entries = report.wrap("date", placed_entries)
+
+    if report is not None:
+        def allocate(dest: Path, mode: str) -> tuple[Path, str]:
+            report.enter("conflict")
+            try:
+                final_dest, conflict = index.allocate(dest, mode)
+            finally:
+                report.leave()
+            report.count_plan(conflict)
+            return final_dest, conflict
+
+    if not duplicates:
+        for entry, category, folder in placed_entries:
+            dest = base_dir / folder / entry.name
+            final_dest, conflict = allocate(dest, conflict_mode)
+
+            yield PlannedMove(
+                entry=entry,
+                destination=final_dest,
+                category=category,
+                conflict=conflict,
+            )
+        return
+
+    if duplicates not in DUPLICATE_ACTIONS:
+        raise ValueError(f"알 수 없는 중복 처리 방식: {duplicates}")
+
+    # 같은 카테고리 폴더에 이미 있거나 먼저 정리될 파일과 내용이 같은지 확인한다
+    finder = DuplicateFinder()
+    placed = {}     # 원래 경로 -> 정리 후 경로 (하드링크 대상을 찾을 때 사용)
+    try:
+        for batch in iter_batches(placed_entries, DEDUPE_BATCH_SIZE):
+            if report is not None:
+                report.enter("dedupe")
+            try:
+                found = finder.find_batch(
+                    [(entry, base_dir / folder) for entry, _, folder in batch]
+                )
+            finally:
+                if report is not None:
+                    report.leave()
+
+            for entry, category, folder in batch:
+                ref = found.get(entry.path)
+                if ref is None:
+                    dest = base_dir / folder / entry.name
+                    final_dest, conflict = allocate(dest, conflict_mode)
+                    placed[entry.path] = str(final_dest)
+                    yield PlannedMove(entry, final_dest, category, conflict)
+                    continue
+
+                original = placed.get(ref.path, ref.path)
+                if duplicates == "skip":
+                    yield PlannedMove(
+                        entry, Path(entry.path), category, "none", "skip", original
+                    )
+                    continue
+
+                if duplicates == "hardlink":
+                    dest = base_dir / folder / entry.name
+                else:
+                    dest = base_dir / duplicates_folder / folder / entry.name
+                # 중복 파일은 덮어쓰기 설정과 관계없이 번호를 붙인다
+                final_dest, conflict = allocate(dest, "rename")
+                action = "hardlink" if duplicates == "hardlink" else "duplicate"
+                yield PlannedMove(
+                    entry, final_dest, category, conflict, action, original
+                )
+    finally:
+        finder.close()
+
+
+def plan_organize(**options) -> tuple[PlannedMove, ...]:
+    return tuple(iter_plan(**options))
 
-        if item.suffix.lower() in exclude_extensions:
+
+class MoveJob(NamedTuple):
+    position: int
+    entry: ScanEntry
+    destination: Path
+    category: str
+    dest_dev: int
+    overwrite: bool
+    action: str = "move"
+    original: str | None = None
+
+
+def prepare_jobs(plan: Iterable[PlannedMove], index: DestIndex) -> Iterator[MoveJob]:
+    # 이름 할당과 폴더 생성은 메인 스레드에서 순서대로 끝내 둔다
+
+    for position, move in enumerate(plan):
+        if move.action == "skip":
+            # 옮기지 않고 기록만 남긴다
+            yield MoveJob(
+                position, move.entry, move.destination, move.category,
+                move.entry.dev, False, move.action, move.original,
+            )
             continue
 
-        ext = item.suffix.lower()
-        category = rules.get(ext, "Others")
+        dest_dev = index.ensure_dir(move.destination.parent)
+
+        # 미리보기 이후에 같은 이름의 파일이 생긴 경우 다시 번호를 붙인다
+        # (덮어쓰기여도 이번 실행에서 이미 옮긴 이름이면 번호를 붙인다)
+        dest, conflict = index.allocate(
+            move.destination, "overwrite" if move.conflict == "overwrite" else "rename"
+        )
+        overwrite = conflict == "overwrite"
+
+        yield MoveJob(
+            position, move.entry, dest, move.category,
+            dest_dev, overwrite, move.action, move.original,
+        )
+
+
+def group_jobs(jobs: list[MoveJob]) -> list[list[MoveJob]]:
+    # 같은 대상 이름을 쓰는 작업은 한 그룹에서 계획 순서대로 처리하고,
+    # 그룹은 작은 파일부터 시작해서 진행 상황이 고르게 올라가도록 한다
+    # 하드링크는 원본이 자리를 잡은 뒤에 만들어야 하므로 원본과 같은 그룹에 넣는다
+    groups = {}
+    for job in jobs:
+        key = Path(job.original) if job.action == "hardlink" else job.destination
+        groups.setdefault(key, []).append(job)
+
+    return sorted(groups.values(), key=lambda g: g[0].entry.size)
+
+
+def iter_batches(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def save_dest_names(snapshot, index: DestIndex, unused: list, completed: bool):
+    # 중간에 멈춘 실행은 할당만 하고 옮기지 않은 이름이 섞여 있으므로 버린다
+    for dest in unused:
+        index.discard(dest)
+    for dest_dir, names in index.names.items():
+        if completed:
+            snapshot.record_dest(dest_dir, names)
+        else:
+            snapshot.forget_dest(dest_dir)
+    snapshot.save()
+
+
+def execute_plan(
+    plan: Iterable[PlannedMove],
+    workers: int = 1,
+    progress=None,
+    verify: bool = False,
+    cancel=None,
+    durability: str = "batch",
+    retention: dict | None = None,
+    compress: bool = True,
+    snapshot=None,
+    report: RunReport | None = None,
+    root: str | None = None,
+    on_entry=None,
+    keep_replaced: bool = True,
+    staging_retention: dict | None = None,
+) -> int:
+    # plan 은 튜플이어도, iter_plan 제너레이터여도 된다
+    # 제너레이터면 스캔 → 분류 → 이동이 BATCH_SIZE 단위로 흘러간다
+    # progress(처리한 파일 수, 옮긴 바이트, 전체 파일 수 | None)
+    # cancel 은 threading.Event — 설정되면 파일 사이에서 멈춘다
+    # 반환값은 실제로 옮긴 파일 수 (중복이라 건너뛴 파일은 기록만 남고 세지 않는다)
+    # snapshot 을 주면 끝난 뒤 카테고리 폴더의 이름 집합을 저장해 둔다
+    # report 를 주면 단계별 시간 등을 모아 끝난 뒤 저장한다 (report.path)
+    # root 는 되돌리기 기록에 남길 대상 폴더, on_entry(기록 경로) 는 기록을 마친 뒤 호출
+    # keep_replaced 면 덮어쓸 파일을 지우지 않고 보관 폴더로 옮긴다 (되돌리기로 복원)
+    total = len(plan) if hasattr(plan, "__len__") else None
+    finished = 0
+    moved_bytes = 0
+    moved = 0
+    journal = None
+    journal_lock = threading.Lock()
+    index = DestIndex(snapshot)
+    unused = []         # 이름은 할당했지만 옮기지 못한 대상
+    completed = False
+    staging = StagingArea() if keep_replaced else None
+    staged = {}         # 작업 위치 -> 덮어쓰기 전 파일을 보관한 경로
+    skipped = []        # 저널을 열기 전에 건너뛴 중복
+
+    def cancelled() -> bool:
+        return cancel is not None and cancel.is_set()
 
-        dest_dir = base_dir / category
-        dest_dir.mkdir(exist_ok=True)
+    def append(job: MoveJob, action: str):
+        journal.append(
+            job.entry.path,
+            str(job.destination),
+            size=job.entry.size,
+            category=job.category,
+            action=action,
+            original=staged.pop(job.position, job.original),
+        )
 
-        dest = dest_dir / item.name
-        final_dest = resolve_conflict(dest, conflict_mode)
+    def record(job: MoveJob, action: str):
+        # 이동이 끝날 때마다 저널에 바로 남긴다 (저널은 첫 이동 때 생성)
+        # 같은 대상 이름을 쓰는 작업은 한 그룹 안에서 순서대로 끝나므로
+        # 완료 순서대로 적어도 되돌릴 때의 의존 순서가 유지된다
+        # 건너뛴 중복은 되돌릴 것이 없으므로 실제로 옮긴 파일이 생길 때까지 모아 둔다
+        # (건너뛰기만 한 실행은 되돌리기 기록을 남기지 않는다)
+        nonlocal journal, moved
+        with journal_lock:
+            if journal is None:
+                if action == "skip":
+                    skipped.append(job)
+                    return
+                journal = open_journal(durability, retention, root)
+                for earlier in skipped:
+                    append(earlier, "skip")
+                skipped.clear()
+            if action != "skip":
+                moved += 1
+        append(job, action)
 
-        operations.append({
-            "from": str(item),
-            "to": str(final_dest)
-        })
+    def move_one(job: MoveJob) -> str | None:
+        # 반환: 실제로 한 동작, None 이면 옮기지 않음
+        overwrote = None
+        if job.overwrite and staging is not None:
+            try:
+                overwrote = staging.stage(job.destination)
+            except OSError:
+                # 보관할 곳이 없으면 덮어쓰지 않고 남겨 둔다
+                with journal_lock:
+                    unused.append(job.destination)
+                return None
+        elif not job.overwrite and os.path.lexists(job.destination):
+            # 계획 이후 같은 이름이 생겼다 (다른 프로그램, 오래된 스냅샷)
+            # 덮어쓰지 않고 남겨 두었다가 다음 실행에서 처리한다
+            with journal_lock:
+                unused.append(job.destination)
+            if snapshot is not None:
+                snapshot.mark_inconsistent()
+            return None
 
-        shutil.move(str(item), str(final_dest))
+        action = job.action
+        try:
+            if job.overwrite and staging is None:
+                job.destination.unlink(missing_ok=True)
+            if action == "hardlink":
+                # 원본이 없어졌거나 링크를 지원하지 않으면 그냥 옮긴다
+                if not link_file(job.original, job.entry.path, job.destination):
+                    action = "move"
+            if action != "hardlink":
+                move_file(
+                    job.entry.path,
+                    job.destination,
+                    same_device=job.entry.dev == job.dest_dev,
+                    size=job.entry.size,
+                    mtime=job.entry.mtime,
+                    verify=verify,
+                )
+        except (OSError, RuntimeError):
+            # 계획 이후 원본이 사라졌거나 바뀌었거나, 링크 자리에 다른 파일이 생겼거나,
+            # 잠긴 파일, 디스크 부족, 복사/검증 실패 — 이 파일만 건너뛰고
+            # 보관한 파일은 제자리로 돌려 둔다 (.part 는 transfer 에서 지운다)
+            if overwrote is not None:
+                os.rename(overwrote, job.destination)
+            with journal_lock:
+                unused.append(job.destination)
+            return None
+        if overwrote is not None:
+            staged[job.position] = overwrote
+            return "overwrite"
+        return action
 
-    if operations:
-        write_undo_log(operations)
+    if report is not None:
+        # 보고서를 켰을 때만 감싼다 (끄면 파일마다 드는 비용 없음)
+        plain_record, plain_move = record, move_one
+
+        def record(job: MoveJob, action: str):
+            report.enter("journal")
+            try:
+                plain_record(job, action)
+            finally:
+                report.leave()
+            if action == "skip":
+                report.count_move(job.entry.path, job.category, job.entry.size, "skip", True, 0.0)
+
+        def move_one(job: MoveJob) -> str | None:
+            report.enter("move")
+            started = time.perf_counter()
+            try:
+                action = plain_move(job)
+            finally:
+                report.leave()
+            if action is None:
+                report.count_skipped()
+            else:
+                report.count_move(
+                    job.entry.path, job.category, job.entry.size, action,
+                    job.entry.dev == job.dest_dev, time.perf_counter() - started,
+                )
+            return action
+
+    def run_group(group: list[MoveJob]) -> tuple[int, int]:
+        # 반환: (처리한 작업 수, 옮긴 바이트) — 취소로 손대지 않은 작업은 세지 않는다
+        done = 0
+        size = 0
+        for job in group:
+            if cancelled():
+                break
+            done += 1
+            if job.action == "skip":
+                record(job, "skip")
+                continue
+            action = move_one(job)
+            if action is None:
+                continue
+            record(job, action)
+            size += job.entry.size
+        return done, size
+
+    if report is not None:
+        report.workers = workers
+        report.start()
+        report.indexes.append(index)
+        plan = report.wrap("plan", plan)
+    jobs = prepare_jobs(plan, index)
+    if report is not None:
+        jobs = report.wrap("mkdir", jobs)
+
+    try:
+        if workers <= 1:
+            for job in jobs:
+                if cancelled():
+                    break
+                done, size = run_group([job])
+                finished += done
+                moved_bytes += size
+                if progress and done:
+                    progress(finished, moved_bytes, total)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for batch in iter_batches(jobs, BATCH_SIZE):
+                    if cancelled():
+                        break
+                    futures = [pool.submit(run_group, g) for g in group_jobs(batch)]
+                    try:
+                        for future in as_completed(futures):
+                            done, size = future.result()
+                            finished += done
+                            moved_bytes += size
+                            if progress and done:
+                                progress(finished, moved_bytes, total)
+                    except BaseException:
+                        # 남은 작업은 취소하고, 실행 중인 이동은 끝날 때까지 기다린다
+                        for future in futures:
+                            future.cancel()
+                        wait(futures)
+                        raise
+        completed = not cancelled()
+    finally:
+        if journal is not None:
+            if report is not None:
+                report.enter("journal")
+            try:
+                entry = finish_journal(journal, compress)
+            finally:
+                if report is not None:
+                    report.leave()
+            if on_entry is not None:
+                on_entry(entry)
+        if staging is not None and staging.staged:
+            start_staging_eviction(staging_retention)
+        if snapshot is not None:
+            save_dest_names(snapshot, index, unused, completed)
+        if report is not None:
+            report.finish()
+            report.path = save_report(report.to_dict())
+
+    return moved
+
+
+def organize_desktop(
+    target_dir: Path,
+    rules,
+    exclude_extensions: list,
+    mode: str,
+    conflict_mode: str,
+    archive_folder: str,
+    exclude_hidden: bool,
+    workers: int = 1,
+    verify: bool = False,
+    durability: str = "batch",
+    retention: dict | None = None,
+    compress: bool = True,
+    exclude_patterns: list | None = None,
+    recursive: bool = False,
+    max_depth: int | None = None,
+    follow_symlinks: bool = False,
+    sniff: bool = False,
+    duplicates: str | None = None,
+    duplicates_folder: str = "Duplicates",
+    date_folders: str | None = None,
+    media_dates: bool = True,
+    incremental: bool = False,
+    full_rescan_hours: float | None = FULL_RESCAN_HOURS,
+    report: RunReport | None = None,
+    keep_replaced: bool = True,
+    staging_retention: dict | None = None,
+):
+    # report(RunReport) 를 주면 실행이 끝난 뒤 채워지고 저장된다
+    options = dict(
+        target_dir=target_dir,
+        rules=rules,
+        exclude_extensions=exclude_extensions,
+        mode=mode,
+        conflict_mode=conflict_mode,
+        archive_folder=archive_folder,
+        exclude_hidden=exclude_hidden,
+        exclude_patterns=exclude_patterns,
+        recursive=recursive,
+        max_depth=max_depth,
+        follow_symlinks=follow_symlinks,
+        sniff=sniff,
+        duplicates=duplicates,
+        duplicates_folder=duplicates_folder,
+        date_folders=date_folders,
+        media_dates=media_dates,
+    )
+    snapshot = load_snapshot(options, full_rescan_hours) if incremental else None
+    plan = iter_plan(**options, snapshot=snapshot, report=report)
+    return execute_plan(
+        plan,
+        workers=workers,
+        verify=verify,
+        durability=durability,
+        retention=retention,
+        compress=compress,
+        snapshot=snapshot,
+        report=report,
+        root=str(Path(target_dir).absolute()),
+        keep_replaced=keep_replaced,
+        staging_retention=staging_retention,
+    )
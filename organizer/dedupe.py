@@ -0,0 +1,174 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+from organizer.cache import FileCache, file_key
+from organizer.scanner import ScanEntry
+
+# 중복 확인 단계: 크기 → 앞/뒤 블록 해시 → 전체 해시
+EDGE_SIZE = 64 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+HASH_WORKERS = 4
+
+DUPLICATE_ACTIONS = ("skip", "hardlink", "move")
+
+
+class FileRef(NamedTuple):
+    path: str           # 지금 내용을 읽을 수 있는 위치 (정리 전 경로일 수 있다)
+    dev: int
+    ino: int
+    size: int
+    mtime: float
+
+
+def edge_hash(path: str, size: int) -> str:
+    # 크기 + 앞/뒤 블록만 읽는다
+    h = hashlib.blake2b(str(size).encode())
+    with open(path, "rb") as f:
+        h.update(f.read(EDGE_SIZE))
+        if size > EDGE_SIZE * 2:
+            f.seek(size - EDGE_SIZE)
+            h.update(f.read(EDGE_SIZE))
+        elif size > EDGE_SIZE:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def full_hash(path: str) -> str:
+    h = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def get_ref(entry: ScanEntry) -> FileRef:
+    return FileRef(entry.path, entry.dev, entry.ino, entry.size, entry.mtime)
+
+
+class DuplicateFinder:
+    # 카테고리 폴더별로 (크기 → 파일 목록) 을 들고 있다가
+    # 같은 크기의 파일이 들어올 때만 해시를 계산한다
+    def __init__(self, workers: int = HASH_WORKERS):
+        self.known = {}         # dest_dir -> {size: [FileRef]}
+        self.memo = {}          # (kind, path) -> hash
+        self.cache = FileCache("hash")
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def sizes_in(self, dest_dir: Path) -> dict:
+        sizes = self.known.get(dest_dir)
+        if sizes is None:
+            sizes = {}
+            try:
+                with os.scandir(dest_dir) as it:
+                    for entry in it:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        sizes.setdefault(st.st_size, []).append(FileRef(
+                            entry.path, st.st_dev, st.st_ino, st.st_size, st.st_mtime,
+                        ))
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+            self.known[dest_dir] = sizes
+        return sizes
+
+    def hashes(self, kind: str, refs: list[FileRef]) -> dict:
+        # kind: "edge" | "full" — 메모 → 영구 캐시 → 디스크(병렬) 순서로 찾는다
+        todo = {ref.path: ref for ref in refs if (kind, ref.path) not in self.memo}
+        if todo:
+            keys = {
+                path: file_key(ref.dev, ref.ino, ref.size, ref.mtime, path) + ":" + kind
+                for path, ref in todo.items()
+            }
+            cached = self.cache.get_many(list(keys.values()))
+
+            misses = []
+            for path, key in keys.items():
+                if key in cached:
+                    self.memo[(kind, path)] = cached[key]
+                else:
+                    misses.append(path)
+
+            def compute(path):
+                try:
+                    if kind == "edge":
+                        return edge_hash(path, todo[path].size)
+                    return full_hash(path)
+                except OSError:
+                    return None
+
+            new = {}
+            for path, value in zip(misses, self.pool.map(compute, misses)):
+                self.memo[(kind, path)] = value
+                if value is not None:
+                    new[keys[path]] = value
+            self.cache.put_many(new)
+
+        return {ref.path: self.memo[(kind, ref.path)] for ref in refs}
+
+    def find_batch(self, items: list[tuple[ScanEntry, Path]]) -> dict:
+        # items: [(entry, 대상 폴더)] — 순서대로 처리한다
+        # 반환: {entry.path: 같은 내용의 FileRef}
+        # 중복이 아닌 파일은 이후 비교 대상으로 추가된다
+        # (FileRef.path 는 아직 옮기기 전의 원래 경로일 수 있다)
+        refs = {entry.path: get_ref(entry) for entry, _ in items}
+
+        # 1단계: 크기가 같은 후보만 추린다 (배치 안에서 먼저 나온 파일 포함)
+        pending = {}
+        candidates = {}
+        for entry, dest_dir in items:
+            if entry.size == 0:
+                continue
+            key = (dest_dir, entry.size)
+            known = self.sizes_in(dest_dir).get(entry.size, [])
+            earlier = pending.setdefault(key, [])
+            if known or earlier:
+                candidates[entry.path] = known + earlier
+            earlier.append(refs[entry.path])
+
+        if not candidates:
+            self.remember(items, {})
+            return {}
+
+        # 2단계: 앞/뒤 블록 해시 (후보 전체를 한 번에 병렬 계산)
+        involved = {}
+        for path, cands in candidates.items():
+            involved[path] = refs[path]
+            for ref in cands:
+                involved[ref.path] = ref
+        edge = self.hashes("edge", list(involved.values()))
+
+        # 3단계: 앞/뒤가 같은 쌍만 전체 해시
+        need_full = {}
+        for path, cands in candidates.items():
+            same = [ref for ref in cands if edge[ref.path] and edge[ref.path] == edge[path]]
+            candidates[path] = same
+            if same:
+                need_full[path] = refs[path]
+                for ref in same:
+                    need_full[ref.path] = ref
+        full = self.hashes("full", list(need_full.values())) if need_full else {}
+
+        duplicates = {}
+        for entry, _ in items:
+            for ref in candidates.get(entry.path, ()):
+                if ref.path in duplicates:
+                    # 이미 중복으로 처리된 파일은 비교 대상이 아니다
+                    continue
+                if full.get(ref.path) and full[ref.path] == full.get(entry.path):
+                    duplicates[entry.path] = ref
+                    break
+
+        self.remember(items, duplicates)
+        return duplicates
+
+    def remember(self, items: list[tuple[ScanEntry, Path]], duplicates: dict):
+        for entry, dest_dir in items:
+            if entry.path not in duplicates:
+                self.sizes_in(dest_dir).setdefault(entry.size, []).append(get_ref(entry))
+
+    def close(self):
+        self.pool.shutdown()
+        self.cache.close()
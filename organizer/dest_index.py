@@ -0,0 +1,102 @@
+import os
+from pathlib import Path
+from organizer.platform import is_windows, is_macos
+
+
+def name_key(name: str) -> str:
+    # Windows / macOS 기본 파일시스템은 대소문자를 구분하지 않는다
+    if is_windows() or is_macos():
+        return name.lower()
+    return name
+
+
+# 한 번의 실행 동안 카테고리 폴더별 파일 이름 집합을 들고 있는 인덱스
+# 폴더마다 scandir 는 한 번만, 이후 충돌 검사/이름 할당은 메모리에서 처리
+# snapshot 이 있으면 수정 시각이 그대로인 폴더는 저장해 둔 이름을 쓴다
+class DestIndex:
+    def __init__(self, snapshot=None):
+        self.snapshot = snapshot
+        self.names = {}         # dir -> {name_key}
+        self.counters = {}      # (dir, stem, ext) -> 다음 번호
+        self.claimed = set()    # 이번 실행에서 내준 (dir, name_key) — 덮어쓰기 모드에서도 두 번 내주지 않는다
+        self.devices = {}       # 생성(확인)된 dir -> st_dev
+        self.scans = 0          # 실행 보고서용: 폴더 목록을 읽은 횟수
+        self.probes = 0         # 실행 보고서용: 번호 붙일 이름을 확인한 횟수
+
+    def names_in(self, dest_dir: Path) -> set:
+        names = self.names.get(dest_dir)
+        if names is None and self.snapshot is not None:
+            names = self.snapshot.dest_names(dest_dir)
+            if names is not None:
+                self.names[dest_dir] = names
+        if names is None:
+            names = set()
+            self.scans += 1
+            try:
+                with os.scandir(dest_dir) as it:
+                    for entry in it:
+                        names.add(name_key(entry.name))
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+            self.names[dest_dir] = names
+        return names
+
+    def exists(self, dest: Path) -> bool:
+        return name_key(dest.name) in self.names_in(dest.parent)
+
+    def allocate(self, dest: Path, mode: str) -> tuple[Path, str]:
+        # 최종 경로와 충돌 처리 방식(none | rename | overwrite) 결정
+        dest_dir = dest.parent
+        names = self.names_in(dest_dir)
+        key = name_key(dest.name)
+
+        if key not in names:
+            names.add(key)
+            self.claimed.add((dest_dir, key))
+            return dest, "none"
+
+        # 덮어쓰기는 실행 전부터 있던 파일만 — 같은 실행에서 먼저 옮긴 파일은 덮어쓰지 않고 번호를 붙인다
+        # (재귀 정리에서 s1/b.jpg 와 s2/b.jpg 가 같은 Images/b.jpg 로 가는 경우)
+        if mode == "overwrite" and (dest_dir, key) not in self.claimed:
+            self.claimed.add((dest_dir, key))
+            return dest, "overwrite"
+
+        base = dest.stem
+        ext = dest.suffix
+        counter_key = (dest_dir, name_key(base), name_key(ext))
+        i = self.counters.get(counter_key, 1)
+        while True:
+            name = f"{base}_{i}{ext}"
+            i += 1
+            self.probes += 1
+            if name_key(name) not in names:
+                break
+
+        self.counters[counter_key] = i
+        names.add(name_key(name))
+        self.claimed.add((dest_dir, name_key(name)))
+        return dest.with_name(name), "rename"
+
+    def add(self, dest: Path):
+        # 이미 내준 이름으로 등록한다
+        key = name_key(dest.name)
+        self.names_in(dest.parent).add(key)
+        self.claimed.add((dest.parent, key))
+
+    def release(self, dest: Path):
+        # 덮어쓰기로 내준 이름을 돌려받는다 (원래 있던 파일이라 이름은 남는다)
+        self.claimed.discard((dest.parent, name_key(dest.name)))
+
+    def discard(self, dest: Path):
+        key = name_key(dest.name)
+        self.names_in(dest.parent).discard(key)
+        self.claimed.discard((dest.parent, key))
+
+    def ensure_dir(self, dest_dir: Path) -> int:
+        # 카테고리 폴더는 실행당 한 번만 만든다
+        dev = self.devices.get(dest_dir)
+        if dev is None:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            dev = os.stat(dest_dir).st_dev
+            self.devices[dest_dir] = dev
+        return dev
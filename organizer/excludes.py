@@ -0,0 +1,180 @@
+import re
+from typing import NamedTuple
+
+# 제외 패턴 (settings["exclude_patterns"]) — .gitignore 형식
+#   node_modules/    이 이름의 폴더 (어느 깊이든) — 폴더째 건너뛰어 안을 읽지 않는다
+#   *.part  ~$*      파일/폴더 이름 glob (* ? [abc])
+#   /build           '/' 로 시작하거나 가운데에 '/' 가 있으면 대상 폴더 기준 경로
+#   docs/*.tmp
+#   **/cache/  a/**/b    ** 는 여러 단계의 폴더
+#   !keep.part       앞의 패턴으로 제외된 것을 다시 포함 (제외된 폴더 안은 되살리지 않는다)
+#   # 주석           빈 줄과 # 로 시작하는 줄은 무시 (\# \! 로 글자 그대로)
+# 대소문자는 구분하지 않는다 (분류 규칙의 name: 과 같음)
+#
+# 패턴은 한 번 컴파일한다 — 글자 그대로의 이름은 set, *.확장자 / 접두어* 는
+# endswith / startswith, 나머지는 정규식 하나로 합친다 (! 가 있으면 순서대로 검사)
+GLOB_CHARS = frozenset("*?[")
+
+
+class ExcludePattern(NamedTuple):
+    glob: str           # 소문자, '/' 구분 (앞뒤 '/' 는 뗀 것)
+    negate: bool = False
+    dir_only: bool = False
+    anchored: bool = False      # 이름이 아니라 대상 폴더 기준 경로와 비교
+
+
+def parse_pattern(line: str) -> ExcludePattern | None:
+    # 한 줄 → ExcludePattern (빈 줄, 주석이면 None)
+    text = line.strip()
+    if not text or text.startswith("#"):
+        return None
+
+    negate = text.startswith("!")
+    if negate:
+        text = text[1:]
+    elif text.startswith(("\\#", "\\!")):
+        text = text[1:]
+
+    # 윈도우에서 적은 경로 구분자도 받는다
+    text = text.replace("\\", "/").lower()
+    dir_only = text.endswith("/")
+    text = text.rstrip("/")
+    anchored = "/" in text
+    text = text.lstrip("/")
+    if not text:
+        raise ValueError(f"제외 패턴이 비어 있습니다: {line}")
+
+    # **/이름 은 어느 깊이든 그 이름 — 경로를 만들지 않도록 이름 패턴으로 바꾼다
+    while text.startswith("**/"):
+        text = text[3:]
+        if "/" not in text:
+            anchored = False
+    return ExcludePattern(text, negate, dir_only, anchored)
+
+
+def translate(glob: str) -> str:
+    # glob → 정규식 (* ? 는 '/' 를 넘지 않고, ** 만 여러 단계)
+    parts = []
+    i, n = 0, len(glob)
+    while i < n:
+        c = glob[i]
+        if c == "*":
+            if glob.startswith("**", i) and (i == 0 or glob[i - 1] == "/"):
+                if glob.startswith("/", i + 2):
+                    parts.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if i + 2 == n:
+                    parts.append(".*")
+                    i += 2
+                    continue
+            while glob.startswith("*", i + 1):
+                i += 1
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            end = glob.find("]", i + 2)
+            if end < 0:
+                parts.append(re.escape(c))
+            else:
+                body = glob[i + 1:end]
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                parts.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end + 1
+                continue
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return "".join(parts)
+
+
+class GlobSet:
+    # 패턴 묶음 — 하나라도 맞으면 True
+    # names=True 면 이름만 비교하므로 *.확장자 / 접두어* 를 문자열 비교로 처리한다
+    # (경로에서는 * 가 '/' 를 넘으면 안 되므로 정규식으로)
+    def __init__(self, globs: list[str], names: bool = True):
+        literals = set()
+        prefixes = []
+        suffixes = []
+        regexes = []
+        for glob in globs:
+            wild = [i for i, c in enumerate(glob) if c in GLOB_CHARS]
+            if not wild:
+                literals.add(glob)
+            elif names and wild == [0] and glob[0] == "*":
+                suffixes.append(glob[1:])
+            elif names and wild == [len(glob) - 1] and glob[-1] == "*":
+                prefixes.append(glob[:-1])
+            else:
+                regexes.append(translate(glob))
+
+        self.literals = literals
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+        self.regex = re.compile("|".join(f"(?:{r})" for r in regexes)) if regexes else None
+        self.empty = not globs
+
+    def match(self, text: str) -> bool:
+        return (
+            text in self.literals
+            or text.endswith(self.suffixes)
+            or text.startswith(self.prefixes)
+            or (self.regex is not None and self.regex.fullmatch(text) is not None)
+        )
+
+
+class ExcludeMatcher:
+    def __init__(self, patterns: list[ExcludePattern]):
+        self.patterns = patterns
+        # 경로 패턴이 없으면 폴더를 훑는 쪽에서 상대 경로를 만들 필요가 없다
+        self.needs_path = any(p.anchored for p in patterns)
+        # ! 가 있으면 마지막으로 맞은 패턴이 정한다 (gitignore 와 같음)
+        self.ordered = any(p.negate for p in patterns)
+
+        if self.ordered:
+            self.compiled = [
+                (p, re.compile(translate(p.glob))) for p in reversed(patterns)
+            ]
+            return
+
+        def group(anchored: bool, dir_only: bool) -> GlobSet:
+            return GlobSet(
+                [p.glob for p in patterns if p.anchored == anchored and p.dir_only == dir_only],
+                names=not anchored,
+            )
+
+        self.names = group(False, False)
+        self.dir_names = group(False, True)
+        self.paths = group(True, False)
+        self.dir_paths = group(True, True)
+
+    def match(self, name: str, rel_dir: str = "", is_dir: bool = False) -> bool:
+        # name: 파일/폴더 이름, rel_dir: 대상 폴더 기준 부모 경로 ("" 또는 "a/b/")
+        # 제외된 폴더 안은 부르는 쪽에서 훑지 않으므로 조상 폴더는 다시 보지 않는다
+        name = name.lower()
+        if self.ordered:
+            path = rel_dir.lower() + name if self.needs_path else name
+            for pattern, regex in self.compiled:
+                if pattern.dir_only and not is_dir:
+                    continue
+                if regex.fullmatch(path if pattern.anchored else name):
+                    return not pattern.negate
+            return False
+
+        if self.names.match(name) or (is_dir and self.dir_names.match(name)):
+            return True
+        if self.needs_path:
+            path = rel_dir.lower() + name
+            return self.paths.match(path) or (is_dir and self.dir_paths.match(path))
+        return False
+
+
+def compile_excludes(lines) -> ExcludeMatcher | None:
+    # settings["exclude_patterns"] → ExcludeMatcher (패턴이 없으면 None — 검사 자체를 건너뛴다)
+    # 이미 컴파일된 것이면 그대로
+    if lines is None or isinstance(lines, ExcludeMatcher):
+        return lines
+    patterns = [p for p in (parse_pattern(line) for line in lines) if p is not None]
+    return ExcludeMatcher(patterns) if patterns else None
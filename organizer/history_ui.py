@@ -0,0 +1,186 @@
+from PySide6.QtWidgets import (
+    QDialog, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QLineEdit,
+    QListWidget, QListWidgetItem, QTableView, QHeaderView,
+    QComboBox, QCheckBox, QDateTimeEdit, QMessageBox
+)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QDateTime
+
+from organizer.formatting import format_bytes
+from organizer.undo import (
+    get_undo_files, read_undo_header, open_undo_reader, UndoFilter
+)
+
+
+class UndoLogModel(QAbstractTableModel):
+    # 화면에 보이는 줄만 reader 에서 꺼내 온다 (기록 전체를 올리지 않음)
+    HEADERS = ["Category", "원래 위치", "정리된 위치", "크기"]
+
+    def __init__(self, reader=None):
+        super().__init__()
+        self.reader = reader
+
+    def set_reader(self, reader):
+        self.beginResetModel()
+        if self.reader is not None:
+            self.reader.close()
+        self.reader = reader
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.reader is None:
+            return 0
+        return len(self.reader)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+
+        op = self.reader.get(index.row())
+        column = index.column()
+        if column == 0:
+            return op.get("category") or "-"
+        if column == 1:
+            return op["from"]
+        if column == 2:
+            return op["to"]
+        size = op.get("size")
+        return format_bytes(size) if size is not None else "-"
+
+
+class HistoryDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("정리 기록")
+        self.resize(900, 560)
+        self.selected = None
+
+        layout = QHBoxLayout(self)
+
+        # 왼쪽: 실행 목록 (각 기록의 헤더만 읽는다)
+        left = QVBoxLayout()
+        left.addWidget(QLabel("실행 기록 (최신 순)"))
+        self.list = QListWidget()
+        self.list.currentItemChanged.connect(self.show_entry)
+        left.addWidget(self.list)
+        layout.addLayout(left, 1)
+
+        # 오른쪽: 선택한 실행의 작업 목록
+        right = QVBoxLayout()
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet("color: gray;")
+        right.addWidget(self.summary_label)
+
+        self.model = UndoLogModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setDefaultSectionSize(20)
+        right.addWidget(self.table)
+
+        # 일부만 되돌리기 조건
+        filters = QHBoxLayout()
+        self.category_combo = QComboBox()
+        filters.addWidget(QLabel("Category"))
+        filters.addWidget(self.category_combo)
+
+        self.prefix_input = QLineEdit()
+        self.prefix_input.setPlaceholderText("경로 (이 경로로 시작하는 파일만)")
+        filters.addWidget(self.prefix_input, 1)
+        right.addLayout(filters)
+
+        time_row = QHBoxLayout()
+        self.time_check = QCheckBox("이동 시각")
+        self.since_input = QDateTimeEdit(QDateTime.currentDateTime().addDays(-1))
+        self.until_input = QDateTimeEdit(QDateTime.currentDateTime())
+        self.since_input.setCalendarPopup(True)
+        self.until_input.setCalendarPopup(True)
+        time_row.addWidget(self.time_check)
+        time_row.addWidget(self.since_input)
+        time_row.addWidget(QLabel("~"))
+        time_row.addWidget(self.until_input)
+        time_row.addStretch()
+
+        undo_btn = QPushButton("이 기록 되돌리기")
+        undo_btn.clicked.connect(self.accept_selection)
+        time_row.addWidget(undo_btn)
+        right.addLayout(time_row)
+
+        layout.addLayout(right, 3)
+
+        self.load_entries()
+
+    def load_entries(self):
+        for path in get_undo_files():
+            try:
+                header = read_undo_header(path)
+            except Exception:
+                continue
+
+            text = f"{header['timestamp'] or '-'} · {header['count']:,}개 · {format_bytes(header['bytes'])}"
+            if header.get("root"):
+                text += f" · {header['root']}"
+            if not header.get("committed", True):
+                text += " (중단됨)"
+
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, (path, header))
+            self.list.addItem(item)
+
+    def show_entry(self, item, _previous=None):
+        if item is None:
+            self.model.set_reader(None)
+            self.summary_label.setText("")
+            return
+
+        path, header = item.data(Qt.UserRole)
+        categories = " · ".join(
+            f"{cat or 'Unknown'} {count:,}"
+            for cat, count in header["categories"].items()
+        )
+        self.summary_label.setText(categories)
+        self.model.set_reader(open_undo_reader(path))
+
+        self.category_combo.clear()
+        self.category_combo.addItem("전체", None)
+        for cat in header["categories"]:
+            self.category_combo.addItem(cat or "Unknown", cat)
+
+    def build_filter(self) -> UndoFilter | None:
+        category = self.category_combo.currentData()
+        prefix = self.prefix_input.text().strip() or None
+        since = until = None
+        if self.time_check.isChecked():
+            since = self.since_input.dateTime().toSecsSinceEpoch()
+            until = self.until_input.dateTime().toSecsSinceEpoch()
+
+        if category is None and prefix is None and since is None:
+            return None
+        return UndoFilter(
+            categories={category} if category is not None else None,
+            since=since,
+            until=until,
+            path_prefix=prefix,
+        )
+
+    def accept_selection(self):
+        item = self.list.currentItem()
+        if item is None:
+            QMessageBox.warning(self, "오류", "되돌릴 기록을 선택하세요.")
+            return
+
+        path, _ = item.data(Qt.UserRole)
+        self.selected = (path, self.build_filter())
+        self.accept()
+
+    def done(self, result):
+        self.model.set_reader(None)
+        super().done(result)
@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# fsync 정책
+#   off   : 줄마다 OS 로만 flush (프로그램이 죽어도 안전, 정전에는 취약)
+#   batch : SYNC_EVERY 개 또는 SYNC_INTERVAL 초마다 fsync
+#   full  : 작업 하나마다 fsync
+DURABILITY_LEVELS = ("off", "batch", "full")
+SYNC_EVERY = 256
+SYNC_INTERVAL = 1.0
+
+
+# 한 줄에 작업 하나씩 추가만 하는 JSON Lines 저널
+#   {"type": "begin", "timestamp": ..., "pid": ..., "root": ...}   ← root 는 정리한 대상 폴더
+#   {"from": ..., "to": ...}
+#   {"from": ..., "to": ..., "action": "skip", "original": ...}   ← 중복 처리
+#   {"from": ..., "to": ..., "action": "overwrite", "original": ...}   ← 덮어쓴 파일의 보관 경로
+#   ...
+#   {"type": "commit", "count": ...}
+# commit 줄이 없으면 중간에 비정상 종료된 실행이다
+class UndoJournal:
+    def __init__(
+        self,
+        path: Path,
+        durability: str = "batch",
+        timestamp: str | None = None,
+        root: str | None = None,
+    ):
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"알 수 없는 durability: {durability}")
+
+        self.path = path
+        self.durability = durability
+        self.count = 0
+        self.pending = 0
+        self.last_sync = time.monotonic()
+        self.lock = threading.Lock()
+
+        self.file = open(path, "a", encoding="utf-8")
+        begin = {
+            "type": "begin",
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "pid": os.getpid(),
+        }
+        if root is not None:
+            begin["root"] = root
+        self.write_line(begin)
+        self.sync()
+
+    def write_line(self, data: dict):
+        self.file.write(json.dumps(data, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+        self.pending = 0
+        self.last_sync = time.monotonic()
+
+    def append(
+        self,
+        src: str,
+        dst: str,
+        size: int | None = None,
+        category: str | None = None,
+        action: str = "move",
+        original: str | None = None,
+    ):
+        # 이동이 끝난 직후 호출 (여러 스레드에서 불려도 된다)
+        # action: move | skip | hardlink | duplicate | overwrite (move 는 적지 않는다)
+        record = {"from": src, "to": dst, "time": time.time()}
+        if size is not None:
+            record["size"] = size
+        if category is not None:
+            record["category"] = category
+        if action != "move":
+            record["action"] = action
+        if original is not None:
+            record["original"] = original
+
+        with self.lock:
+            self.write_line(record)
+            self.count += 1
+            self.pending += 1
+
+            if self.durability == "full":
+                self.sync()
+            elif self.durability == "batch" and (
+                self.pending >= SYNC_EVERY
+                or time.monotonic() - self.last_sync >= SYNC_INTERVAL
+            ):
+                self.sync()
+
+    def commit(self):
+        with self.lock:
+            self.write_line({"type": "commit", "count": self.count})
+            if self.durability != "off":
+                self.sync()
+            self.file.close()
+
+    def close(self):
+        # commit 없이 닫기 (실패 시) — 다음 실행에서 복구 대상이 된다
+        with self.lock:
+            if not self.file.closed:
+                if self.durability != "off":
+                    self.sync()
+                self.file.close()
+
+
+def read_journal(path: Path) -> dict:
+    # 마지막 줄이 쓰다 만 상태여도 읽을 수 있는 만큼 읽는다
+    data = {"timestamp": None, "pid": None, "root": None, "operations": [], "committed": False}
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+
+            kind = record.get("type")
+            if kind == "begin":
+                data["timestamp"] = record.get("timestamp")
+                data["pid"] = record.get("pid")
+                data["root"] = record.get("root")
+            elif kind == "commit":
+                data["committed"] = True
+            else:
+                data["operations"].append(record)
+
+    return data
+
@@ -0,0 +1,275 @@
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from organizer.cache import FileCache, file_key
+from organizer.scanner import ScanEntry
+
+# 사진/동영상의 촬영 날짜를 파일 헤더만 읽어서 알아낸다 (파일 전체를 읽지 않는다)
+#   JPEG     : APP1 Exif 세그먼트 → DateTimeOriginal (없으면 DateTimeDigitized, DateTime)
+#   TIFF/RAW : 파일 앞의 TIFF 헤더에서 같은 태그
+#   MP4/MOV  : moov/mvhd 의 creation_time — 상자 머리만 읽고 mdat 등은 건너뛴다
+# 결과는 (inode, 크기, 수정 시각) 키로 캐시하고, 알아내지 못하면 수정 시각을 쓴다
+DATE_WORKERS = 8
+
+# 날짜 폴더 방식 (settings["date_folders"])
+#   year  : Images/2026
+#   month : Images/2026/10
+DATE_FOLDER_MODES = (None, "year", "month")
+
+JPEG_SUFFIXES = {".jpg", ".jpeg", ".jpe"}
+TIFF_SUFFIXES = {".tif", ".tiff", ".dng", ".cr2", ".nef", ".arw", ".orf", ".rw2", ".pef", ".srw"}
+MP4_SUFFIXES = {".mp4", ".m4v", ".mov", ".3gp", ".3g2"}
+MEDIA_SUFFIXES = JPEG_SUFFIXES | TIFF_SUFFIXES | MP4_SUFFIXES
+
+TIFF_HEAD_SIZE = 64 * 1024     # TIFF/RAW 는 IFD0 과 Exif IFD 가 보통 앞 64KB 안에 있다
+MAX_JPEG_SEGMENTS = 32          # APP1 앞에 이만큼 세그먼트가 있으면 포기
+MAX_BOXES = 64                  # 한 단계에서 살펴볼 MP4 상자 수
+
+# TIFF 태그
+TAG_DATETIME = 0x0132
+TAG_EXIF_IFD = 0x8769
+TAG_DATETIME_ORIGINAL = 0x9003
+TAG_DATETIME_DIGITIZED = 0x9004
+TYPE_ASCII = 2
+TIFF_MAGICS = {42, 0x4F52, 0x5352, 0x55}    # 표준, ORF, ORF, RW2
+
+MP4_EPOCH_OFFSET = 2082844800   # 1904-01-01 → 1970-01-01 (초)
+
+# 알아내지 못했을 때 캐시에 넣는 값 (다시 열지 않도록)
+UNKNOWN = ""
+
+
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    return 1970 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31
+
+
+def parse_exif_datetime(value) -> str | None:
+    # b"2026:10:18 12:34:56" → "2026-10-18" ("0000:00:00 ..." 같은 빈 값은 None)
+    if not isinstance(value, bytes) or len(value) < 10:
+        return None
+    try:
+        year, month, day = int(value[0:4]), int(value[5:7]), int(value[8:10])
+    except ValueError:
+        return None
+    if not is_valid_date(year, month, day):
+        return None
+    return f"{year:04}-{month:02}-{day:02}"
+
+
+def read_ifd(buf: bytes, order: str, offset: int, wanted: set) -> dict:
+    # IFD 하나에서 wanted 태그만 꺼낸다 — ASCII 는 bytes, 나머지는 정수
+    (count,) = struct.unpack_from(order + "H", buf, offset)
+    tags = {}
+    for i in range(count):
+        tag, kind, n, value = struct.unpack_from(order + "HHII", buf, offset + 2 + i * 12)
+        if tag not in wanted:
+            continue
+        if kind == TYPE_ASCII:
+            if n <= 4:
+                start = offset + 2 + i * 12 + 8
+            else:
+                start = value
+            tags[tag] = buf[start:start + n]
+        else:
+            tags[tag] = value
+    return tags
+
+
+def parse_tiff_date(buf: bytes) -> str | None:
+    # buf 는 TIFF 헤더("II*\0" / "MM\0*")로 시작한다 — 오프셋은 buf 기준
+    if buf[:2] == b"II":
+        order = "<"
+    elif buf[:2] == b"MM":
+        order = ">"
+    else:
+        return None
+    try:
+        magic, ifd0 = struct.unpack_from(order + "HI", buf, 2)
+        if magic not in TIFF_MAGICS:
+            return None
+        tags = read_ifd(buf, order, ifd0, {TAG_DATETIME, TAG_EXIF_IFD})
+        exif = {}
+        if TAG_EXIF_IFD in tags:
+            exif = read_ifd(
+                buf, order, tags[TAG_EXIF_IFD],
+                {TAG_DATETIME_ORIGINAL, TAG_DATETIME_DIGITIZED},
+            )
+    except struct.error:
+        # IFD 가 읽은 범위 밖에 있다
+        return None
+
+    for value in (
+        exif.get(TAG_DATETIME_ORIGINAL),
+        exif.get(TAG_DATETIME_DIGITIZED),
+        tags.get(TAG_DATETIME),
+    ):
+        date = parse_exif_datetime(value)
+        if date:
+            return date
+    return None
+
+
+def read_jpeg_date(f) -> str | None:
+    # SOI 다음 세그먼트를 차례로 건너뛰며 APP1(Exif) 만 읽는다
+    if f.read(2) != b"\xff\xd8":
+        return None
+    for _ in range(MAX_JPEG_SEGMENTS):
+        head = f.read(4)
+        if len(head) < 4 or head[0] != 0xFF:
+            return None
+        marker = head[1]
+        (length,) = struct.unpack(">H", head[2:])
+        if marker in (0xDA, 0xD9) or length < 2:
+            # 이미지 데이터 시작 / 끝 — 더 앞에 Exif 가 없었다
+            return None
+        if marker == 0xE1:
+            segment = f.read(length - 2)
+            if segment.startswith(b"Exif\x00\x00"):
+                return parse_tiff_date(segment[6:])
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+    return None
+
+
+def read_tiff_date(f) -> str | None:
+    return parse_tiff_date(f.read(TIFF_HEAD_SIZE))
+
+
+def find_box(f, start: int, end: int, kind: bytes) -> tuple[int, int] | None:
+    # [start, end) 범위에서 kind 상자를 찾는다 — 반환: (내용 시작, 끝)
+    pos = start
+    for _ in range(MAX_BOXES):
+        if pos + 8 > end:
+            return None
+        f.seek(pos)
+        head = f.read(16)
+        if len(head) < 8:
+            return None
+        size, name = struct.unpack(">I4s", head[:8])
+        header = 8
+        if size == 1:
+            if len(head) < 16:
+                return None
+            (size,) = struct.unpack(">Q", head[8:16])
+            header = 16
+        elif size == 0:
+            # 파일 끝까지
+            size = end - pos
+        if size < header:
+            return None
+        if name == kind:
+            return pos + header, min(pos + size, end)
+        pos += size
+    return None
+
+
+def read_mp4_date(f) -> str | None:
+    end = os.fstat(f.fileno()).st_size
+    moov = find_box(f, 0, end, b"moov")
+    if moov is None:
+        return None
+    mvhd = find_box(f, moov[0], moov[1], b"mvhd")
+    if mvhd is None:
+        return None
+
+    f.seek(mvhd[0])
+    data = f.read(12)
+    if len(data) < 8:
+        return None
+    if data[0] == 1:
+        if len(data) < 12:
+            return None
+        (created,) = struct.unpack(">Q", data[4:12])
+    else:
+        (created,) = struct.unpack(">I", data[4:8])
+    if created == 0:
+        return None
+    try:
+        moment = datetime.fromtimestamp(created - MP4_EPOCH_OFFSET)
+    except (OverflowError, OSError, ValueError):
+        return None
+    if not is_valid_date(moment.year, moment.month, moment.day):
+        return None
+    return moment.strftime("%Y-%m-%d")
+
+
+def read_media_date(path: str, suffix: str) -> str:
+    # 반환: "YYYY-MM-DD" 또는 UNKNOWN
+    if suffix in JPEG_SUFFIXES:
+        reader = read_jpeg_date
+    elif suffix in TIFF_SUFFIXES:
+        reader = read_tiff_date
+    elif suffix in MP4_SUFFIXES:
+        reader = read_mp4_date
+    else:
+        return UNKNOWN
+    try:
+        # 작은 조각만 읽으므로 버퍼를 크게 잡지 않는다
+        with open(path, "rb", buffering=4096) as f:
+            return reader(f) or UNKNOWN
+    except OSError:
+        return UNKNOWN
+
+
+def mtime_date(mtime: float) -> str | None:
+    try:
+        return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def get_date_folder(category: str, date: str | None, mode: str) -> str:
+    # "Images", "2026-10-18", month → "Images/2026/10"
+    if date is None:
+        return category
+    if mode == "year":
+        return f"{category}/{date[:4]}"
+    return f"{category}/{date[:4]}/{date[5:7]}"
+
+
+def get_entry_key(entry: ScanEntry) -> str:
+    return file_key(entry.dev, entry.ino, entry.size, entry.mtime, entry.path)
+
+
+class DateExtractor:
+    def __init__(self, workers: int = DATE_WORKERS):
+        self.cache = FileCache("media_date")
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def dates_many(self, entries: list[ScanEntry]) -> dict:
+        # 반환: {경로: "YYYY-MM-DD"} (헤더에 날짜가 없는 파일은 빠진다)
+        entries = [e for e in entries if e.suffix in MEDIA_SUFFIXES]
+        if not entries:
+            return {}
+
+        keys = [get_entry_key(e) for e in entries]
+        cached = self.cache.get_many(keys)
+
+        result = {}
+        misses = []
+        for entry, key in zip(entries, keys):
+            if key in cached:
+                if cached[key]:
+                    result[entry.path] = cached[key]
+            else:
+                misses.append((entry, key))
+
+        # 바뀐 파일만 디스크에서 읽는다 (스레드 풀로 지연 시간 겹치기)
+        found = self.pool.map(
+            read_media_date,
+            [e.path for e, _ in misses],
+            [e.suffix for e, _ in misses],
+        )
+        new = {}
+        for (entry, key), date in zip(misses, found):
+            new[key] = date
+            if date:
+                result[entry.path] = date
+        self.cache.put_many(new)
+
+        return result
+
+    def close(self):
+        self.pool.shutdown()
+        self.cache.close()
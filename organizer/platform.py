@@ -29,6 +29,36 @@ def is_hidden_file(path: Path) -> bool:
         return False
 
 
+def is_hidden_entry(name: str, st: os.stat_result) -> bool:
+    # scandir 로 이미 얻은 stat 결과를 재사용 (추가 syscall 없음)
+    if is_windows():
+        return bool(
+            getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_HIDDEN
+        )
+    return name.startswith(".")
+
+
+def is_process_alive(pid: int) -> bool:
+    if is_windows():
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        handle = ctypes.windll.kernel32.OpenProcess(
+            PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+        )
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
 def get_config_dir() -> Path:
     if is_windows():
         return Path(os.getenv("APPDATA")) / "FileOrganizer"
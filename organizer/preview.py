@@ -0,0 +1,128 @@
+from itertools import chain
+from organizer.core import PlannedMove, get_base_dir
+from organizer.dest_index import DestIndex
+from organizer.rules import get_matcher, changed_suffixes, OTHERS
+
+
+# 미리보기 결과를 들고 있는 인덱스 (Qt 없음 — 화면 모델은 preview_ui.PreviewModel)
+#   moves     : 스캔한 순서대로의 계획 (행 번호 = 위치)
+#   by_suffix : 확장자 → 행 번호 — 규칙/제외 확장자를 바꾸면 해당 행만 다시 분류한다
+#   visible   : 화면에 보이는 행 (제외 확장자 행은 빠진다)
+#   totals    : 카테고리 → [개수, 바이트]
+# 중복 확인이나 내용 확인을 켠 미리보기는 디스크를 다시 읽어야 하므로 부분 갱신하지 않는다
+class PreviewIndex:
+    def __init__(self, options: dict):
+        # options 는 iter_plan 인자
+        self.options = options
+        self.matcher = get_matcher(options["rules"])
+        self.exclude = set(options["exclude_extensions"])
+        self.incremental = not options.get("sniff") and not options.get("duplicates")
+        self.base_dir = get_base_dir(
+            options["target_dir"], options["mode"], options["archive_folder"]
+        )
+        self.moves = []
+        self.by_suffix = {}
+        self.visible = []
+        self.totals = {}
+        self.dest_index = None
+        self.complete = False       # 백그라운드 스캔이 끝까지 돌았는지
+
+    def scan_options(self) -> dict:
+        # 제외 확장자를 바꿔도 다시 스캔하지 않도록 전부 읽어 두고 여기서 거른다
+        if self.incremental:
+            return dict(self.options, exclude_extensions=[])
+        return self.options
+
+    def is_excluded(self, move: PlannedMove, exclude: set | None = None) -> bool:
+        if not self.incremental:
+            return False
+        return move.entry.suffix in (self.exclude if exclude is None else exclude)
+
+    def count(self, move: PlannedMove, sign: int):
+        totals = self.totals.setdefault(move.category, [0, 0])
+        totals[0] += sign
+        totals[1] += sign * move.size
+        if totals[0] == 0:
+            del self.totals[move.category]
+
+    def add(self, moves: list[PlannedMove]) -> int:
+        # 스캔 결과 한 묶음을 붙인다 — 반환: 새로 보이는 행 수
+        start = len(self.visible)
+        for move in moves:
+            row = len(self.moves)
+            self.moves.append(move)
+            self.by_suffix.setdefault(move.entry.suffix, []).append(row)
+            if not self.is_excluded(move):
+                self.visible.append(row)
+                self.count(move, 1)
+        return len(self.visible) - start
+
+    def can_update(self, options: dict) -> bool:
+        # 규칙과 제외 확장자 말고는 그대로여야 스캔 결과를 재사용할 수 있다
+        if not self.incremental:
+            return False
+        keys = (set(options) | set(self.options)) - {"rules", "exclude_extensions"}
+        return all(options.get(key) == self.options.get(key) for key in keys)
+
+    def reallocate(self, move: PlannedMove, category: str) -> PlannedMove:
+        # 카테고리가 바뀐 행만 새 폴더에서 이름을 다시 받는다
+        # (다른 행의 번호는 그대로 — 빈 번호가 생길 수 있지만 겹치지는 않는다)
+        if self.dest_index is None:
+            self.dest_index = DestIndex()
+            for other in self.moves:
+                self.dest_index.add(other.destination)
+        if move.conflict == "overwrite":
+            self.dest_index.release(move.destination)
+        else:
+            self.dest_index.discard(move.destination)
+
+        # 날짜 폴더(카테고리/연/월)는 파일에 딸린 것이라 그대로 둔다
+        partition = move.destination.parent.relative_to(self.base_dir / move.category)
+        dest = self.base_dir / category / partition / move.entry.name
+        final_dest, conflict = self.dest_index.allocate(dest, self.options["conflict_mode"])
+        return move._replace(destination=final_dest, category=category, conflict=conflict)
+
+    def update(self, options: dict) -> tuple[bool, list[int]]:
+        # 반환: (보이는 행 목록이 바뀌었는지, 다시 분류한 행 번호)
+        matcher = get_matcher(options["rules"])
+        exclude = set(options["exclude_extensions"])
+
+        suffixes = changed_suffixes(self.matcher, matcher)
+        toggled = self.exclude ^ exclude
+        if suffixes is None:
+            rows = range(len(self.moves))
+        else:
+            rows = sorted(chain.from_iterable(
+                self.by_suffix.get(suffix, ()) for suffix in suffixes | toggled
+            ))
+
+        changed = []
+        for row in rows:
+            move = self.moves[row]
+            entry = move.entry
+            category = matcher.classify(entry.name, entry.size, entry.mtime) or OTHERS
+            was_visible = not self.is_excluded(move)
+            now_visible = not self.is_excluded(move, exclude)
+            if category == move.category and was_visible == now_visible:
+                continue
+
+            if was_visible:
+                self.count(move, -1)
+            if category != move.category:
+                move = self.moves[row] = self.reallocate(move, category)
+            if now_visible:
+                self.count(move, 1)
+            changed.append(row)
+
+        visible_changed = any(suffix in self.by_suffix for suffix in toggled)
+        self.options = options
+        self.matcher = matcher
+        self.exclude = exclude
+        if visible_changed:
+            self.visible = [
+                row for row, move in enumerate(self.moves) if not self.is_excluded(move)
+            ]
+        return visible_changed, changed
+
+    def to_plan(self) -> tuple[PlannedMove, ...]:
+        return tuple(self.moves[row] for row in self.visible)
@@ -0,0 +1,92 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from organizer.formatting import format_bytes
+
+# 비고 열에 보여 줄 내용
+NOTES = {
+    "rename": "이름 변경",
+    "overwrite": "덮어쓰기",
+    "skip": "중복 · 건너뜀",
+    "hardlink": "중복 · 하드링크",
+    "duplicate": "중복",
+}
+
+
+class PreviewModel(QAbstractTableModel):
+    # PreviewIndex 의 보이는 행만 화면에 내보낸다 (QTableView 가 보이는 줄만 요청한다)
+    HEADERS = ["파일", "정리될 위치", "Category", "크기", "비고"]
+
+    def __init__(self):
+        super().__init__()
+        self.preview = None
+
+    def set_preview(self, preview):
+        self.beginResetModel()
+        self.preview = preview
+        self.endResetModel()
+
+    def append(self, moves: list):
+        # 스캔 결과 한 묶음 — 새로 보이는 행만 끝에 붙인다
+        preview = self.preview
+        start = len(preview.visible)
+        added = sum(1 for move in moves if not preview.is_excluded(move))
+        if added:
+            self.beginInsertRows(QModelIndex(), start, start + added - 1)
+        preview.add(moves)
+        if added:
+            self.endInsertRows()
+
+    def refresh(self, visible_changed: bool):
+        # 규칙/제외 확장자를 바꾼 뒤 (PreviewIndex.update 다음에 부른다)
+        if visible_changed:
+            self.beginResetModel()
+            self.endResetModel()
+        elif self.rowCount():
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.rowCount() - 1, len(self.HEADERS) - 1),
+            )
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.preview is None:
+            return 0
+        return len(self.preview.visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        move = self.preview.moves[self.preview.visible[index.row()]]
+        note = NOTES.get(move.action) or NOTES.get(move.conflict, "")
+        if role == Qt.ForegroundRole:
+            return QColor("gray") if move.action == "skip" else None
+        if role == Qt.ToolTipRole:
+            return str(move.source)
+        if role != Qt.DisplayRole:
+            return None
+
+        column = index.column()
+        if column == 0:
+            return move.source.name
+        if column == 1:
+            if move.action == "skip":
+                return "-"
+            try:
+                return str(move.destination.relative_to(self.preview.options["target_dir"]))
+            except ValueError:
+                # 정리 폴더가 대상 폴더 밖(절대 경로)에 있을 때
+                return str(move.destination)
+        if column == 2:
+            return move.category
+        if column == 3:
+            return format_bytes(move.size)
+        return note
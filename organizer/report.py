@@ -0,0 +1,251 @@
+import heapq
+import io
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from organizer.formatting import format_bytes
+from organizer.platform import get_config_dir
+
+# 실행 보고서
+#   단계별 시간, 카테고리별 개수/크기, 같은/다른 드라이브 이동 수, 이름 충돌 확인 횟수,
+#   가장 오래 걸린 파일들을 모은다
+#   report 를 넘기지 않으면 (None) 각 단계에서 is None 확인 한 번 외에는 비용이 없다
+#
+# 단계 시간은 겹치지 않게 센다 — 파이프라인이 제너레이터로 엮여 있어서
+# 예를 들어 이름 할당 중에 다음 파일을 스캔하면 그 시간은 scan 으로 간다
+# 병렬 실행에서 move / journal 은 작업 스레드 시간을 합친 값이다 (전체 시간보다 클 수 있음)
+#   — 보고서에는 "스레드 합계" 로 표시하고 전체 시간 대비 비율은 적지 않는다
+PHASES = ("scan", "classify", "date", "dedupe", "plan", "conflict", "mkdir", "move", "journal")
+THREAD_PHASES = ("move", "journal")
+SLOWEST_COUNT = 10
+KEEP_REPORTS = 20
+
+PROFILERS = (None, "cprofile", "tracemalloc")
+PROFILE_TOP = 25
+
+
+class RunReport:
+    def __init__(self, profile: str | None = None):
+        if profile not in PROFILERS:
+            raise ValueError(f"알 수 없는 프로파일러: {profile}")
+        self.profile = profile
+        self.profiler = None
+        self.profile_text = None
+        self.path = None            # 저장된 보고서 파일 (execute_plan 이 끝나면)
+        self.started_at = None
+        self.started = None
+        self.wall = 0.0
+        self.workers = 1            # execute_plan 의 동시 작업 수
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.categories = {}        # 카테고리 -> [개수, 바이트]
+        self.actions = {}           # move / skip / hardlink / duplicate -> 개수
+        self.bytes_moved = 0
+        self.same_device = 0
+        self.cross_device = 0
+        self.conflicts = {}         # none / rename / overwrite -> 개수
+        self.skipped = 0            # 계획 이후 원본이 사라졌거나 대상이 생긴 파일
+        self.slowest = []           # (초, 경로, 크기) 최소 힙
+        self.indexes = []           # 이름 충돌 확인 횟수를 읽을 DestIndex 들
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    # ---------- 단계 시간 ----------
+
+    def enter(self, phase: str):
+        # 스레드마다 단계 스택을 두고, 안쪽 단계에 들어가면 바깥 단계 시간을 멈춘다
+        stack = self.local.__dict__.setdefault("stack", [])
+        now = time.perf_counter()
+        if stack:
+            outer, since = stack[-1]
+            self.add_time(outer, now - since)
+        stack.append((phase, now))
+
+    def leave(self):
+        stack = self.local.stack
+        now = time.perf_counter()
+        phase, since = stack.pop()
+        self.add_time(phase, now - since)
+        if stack:
+            stack[-1] = (stack[-1][0], now)
+
+    def add_time(self, phase: str, seconds: float):
+        with self.lock:
+            self.phases[phase] += seconds
+
+    def wrap(self, phase: str, iterable):
+        # 제너레이터의 next() 안에서 쓴 시간을 phase 로 센다
+        it = iter(iterable)
+        while True:
+            self.enter(phase)
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            finally:
+                self.leave()
+            yield item
+
+    # ---------- 파일별 기록 ----------
+
+    def count_plan(self, conflict: str):
+        self.conflicts[conflict] = self.conflicts.get(conflict, 0) + 1
+
+    def count_move(self, path: str, category: str, size: int, action: str, same_device: bool, seconds: float):
+        with self.lock:
+            counts = self.categories.setdefault(category, [0, 0])
+            counts[0] += 1
+            self.actions[action] = self.actions.get(action, 0) + 1
+            if action == "skip":
+                return
+            counts[1] += size
+            self.bytes_moved += size
+            if action == "hardlink" or same_device:
+                self.same_device += 1
+            else:
+                self.cross_device += 1
+
+            item = (seconds, path, size)
+            if len(self.slowest) < SLOWEST_COUNT:
+                heapq.heappush(self.slowest, item)
+            elif seconds > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, item)
+
+    def count_skipped(self):
+        with self.lock:
+            self.skipped += 1
+
+    # ---------- 시작 / 끝 ----------
+
+    def start(self):
+        self.started_at = datetime.now().isoformat()
+        self.started = time.perf_counter()
+        if self.profile == "cprofile":
+            # 호출한 스레드만 잰다 (workers 가 1 일 때 가장 정확)
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        elif self.profile == "tracemalloc":
+            import tracemalloc
+            tracemalloc.start()
+
+    def finish(self):
+        self.wall = time.perf_counter() - self.started
+        if self.profile == "cprofile":
+            import pstats
+            self.profiler.disable()
+            out = io.StringIO()
+            stats = pstats.Stats(self.profiler, stream=out)
+            stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+            self.profile_text = out.getvalue()
+        elif self.profile == "tracemalloc":
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            lines = [f"peak {format_bytes(peak)}"]
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP]:
+                lines.append(str(stat))
+            self.profile_text = "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        files = sum(count for count, _ in self.categories.values())
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": round(self.wall, 4),
+            "files": files,
+            "files_per_sec": round(files / self.wall, 1) if self.wall > 0 else None,
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            "workers": self.workers,
+            "thread_phases": list(THREAD_PHASES) if self.workers > 1 else [],
+            "categories": {
+                name: {"files": count, "bytes": size}
+                for name, (count, size) in sorted(self.categories.items())
+            },
+            "actions": self.actions,
+            "bytes_moved": self.bytes_moved,
+            "same_device_moves": self.same_device,
+            "cross_device_moves": self.cross_device,
+            "conflicts": self.conflicts,
+            "conflict_probes": sum(index.probes for index in self.indexes),
+            "dest_dir_scans": sum(index.scans for index in self.indexes),
+            "skipped": self.skipped,
+            "slowest": [
+                {"path": path, "size": size, "seconds": round(seconds, 4)}
+                for seconds, path, size in sorted(self.slowest, reverse=True)
+            ],
+            "profile": self.profile,
+            "profile_text": self.profile_text,
+        }
+
+
+def get_report_dir() -> Path:
+    report_dir = get_config_dir() / "reports"
+    report_dir.mkdir(parents=True, exist_ok=True)
+    return report_dir
+
+
+def save_report(data: dict) -> Path:
+    # 최근 KEEP_REPORTS 개만 남긴다
+    report_dir = get_report_dir()
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    path = report_dir / f"run_{stamp}.json"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+    for old in sorted(report_dir.glob("run_*.json"), reverse=True)[KEEP_REPORTS:]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def load_latest_report() -> dict | None:
+    paths = sorted(get_report_dir().glob("run_*.json"), reverse=True)
+    if not paths:
+        return None
+    return json.loads(paths[0].read_text(encoding="utf-8"))
+
+
+def format_report(data: dict) -> str:
+    wall = data["wall_seconds"]
+    lines = [
+        f"실행 시각: {data['started_at']}",
+        f"전체 {wall:.3f}초 · {data['files']:,}개 · {format_bytes(data['bytes_moved'])}"
+        + (f" · {data['files_per_sec']:,.0f}개/초" if data["files_per_sec"] else ""),
+        f"같은 드라이브 {data['same_device_moves']:,}개 · 다른 드라이브 {data['cross_device_moves']:,}개"
+        + (f" · 건너뜀 {data['skipped']:,}개" if data["skipped"] else ""),
+        "",
+        "[단계별 시간]",
+    ]
+    thread_phases = data.get("thread_phases", ())
+    for name, seconds in data["phases"].items():
+        if not seconds:
+            continue
+        if name in thread_phases:
+            # 작업 스레드 시간을 합친 값이라 전체 시간과 비교할 수 없다
+            lines.append(f"  {name:<10} {seconds:9.3f}초  (스레드 {data['workers']}개 합계)")
+        else:
+            share = seconds / wall * 100 if wall else 0
+            lines.append(f"  {name:<10} {seconds:9.3f}초  {share:5.1f}%")
+
+    lines += ["", "[카테고리]"]
+    for name, counts in data["categories"].items():
+        lines.append(f"  {name:<16} {counts['files']:>8,}개  {format_bytes(counts['bytes']):>12}")
+
+    conflicts = ", ".join(f"{k} {v:,}" for k, v in data["conflicts"].items())
+    lines += [
+        "",
+        f"[이름 충돌] {conflicts or '-'} · 번호 확인 {data['conflict_probes']:,}번"
+        f" · 폴더 목록 읽기 {data['dest_dir_scans']:,}번",
+    ]
+
+    if data["slowest"]:
+        lines += ["", "[오래 걸린 파일]"]
+        for item in data["slowest"]:
+            lines.append(f"  {item['seconds']:8.3f}초  {format_bytes(item['size']):>10}  {item['path']}")
+
+    if data.get("profile_text"):
+        lines += ["", f"[{data['profile']}]", data["profile_text"]]
+    return "\n".join(lines)
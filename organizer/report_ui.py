@@ -0,0 +1,29 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit
+)
+from PySide6.QtGui import QFontDatabase
+
+from organizer.report import format_report
+
+
+class ReportDialog(QDialog):
+    # 실행 보고서(단계별 시간, 카테고리, 오래 걸린 파일)를 글자로 보여 준다
+    def __init__(self, data: dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("실행 보고서")
+        self.resize(760, 560)
+
+        layout = QVBoxLayout(self)
+        text = QTextEdit()
+        text.setReadOnly(True)
+        # 숫자 열이 맞도록 고정폭 글꼴
+        text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        text.setPlainText(format_report(data))
+        layout.addWidget(text)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.accept)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
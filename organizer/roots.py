@@ -0,0 +1,190 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import NamedTuple
+from organizer.core import iter_plan, execute_plan
+from organizer.report import RunReport
+from organizer.snapshot import load_snapshot, FULL_RESCAN_HOURS
+
+# 여러 대상 폴더를 드라이브(st_dev)별로 나눠 정리한다
+#   드라이브끼리는 동시에, 한 드라이브 안에서는 per_device 개까지만 (디스크 탐색 경합 방지)
+#   폴더마다 따로 실행하므로 되돌리기 기록, 보고서, 결과도 폴더별로 남는다
+#   느린 마운트는 그 드라이브 자리만 차지하고 다른 드라이브는 계속 진행한다
+DEVICE_TIMEOUT = 30.0   # 폴더 stat 이 이 시간 안에 끝나지 않으면 그 폴더는 건너뛴다
+
+
+class RootResult(NamedTuple):
+    root: str
+    moved: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+    undo_entry: str | None = None   # 되돌리기 기록 경로 (옮긴 파일이 없으면 None)
+    report_path: str | None = None
+    cancelled: bool = False
+
+
+def lookup_device(path) -> Future:
+    # 응답 없는 마운트에서 stat 이 멈춰도 프로그램 종료를 막지 않도록 데몬 스레드에서
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(os.stat(path).st_dev)
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def run_root(
+    options: dict,
+    incremental: bool = False,
+    full_rescan_hours: float | None = FULL_RESCAN_HOURS,
+    report: bool = False,
+    progress=None,
+    cancel=None,
+    **execute_options,
+) -> RootResult:
+    # 폴더 하나를 정리한다 — 예외는 결과에 담아 다른 폴더에 영향을 주지 않는다
+    root = str(options["target_dir"])
+    started = time.monotonic()
+    entries = []
+    run_report = RunReport() if report else None
+    try:
+        snapshot = load_snapshot(options, full_rescan_hours) if incremental else None
+        moved = execute_plan(
+            iter_plan(**options, snapshot=snapshot, report=run_report),
+            progress=progress,
+            cancel=cancel,
+            snapshot=snapshot,
+            report=run_report,
+            root=os.path.abspath(root),
+            on_entry=entries.append,
+            **execute_options,
+        )
+        error = None
+    except Exception as e:
+        moved = 0
+        error = str(e)
+
+    return RootResult(
+        root=root,
+        moved=moved,
+        seconds=round(time.monotonic() - started, 3),
+        error=error,
+        undo_entry=str(entries[0]) if entries else None,
+        report_path=str(run_report.path) if run_report and run_report.path else None,
+        cancelled=cancel is not None and cancel.is_set(),
+    )
+
+
+def organize_roots(
+    root_options: list[dict],
+    per_device: int = 1,
+    max_parallel: int = 8,
+    progress=None,
+    cancel=None,
+    on_result=None,
+    retention: dict | None = None,
+    **run_options,
+) -> list[RootResult]:
+    # root_options: 폴더별 iter_plan 인자 (settings.get_root_options)
+    # run_options: run_root 인자 (workers, verify, durability, compress, incremental, report ...)
+    # progress(처리한 파일 수, 옮긴 바이트, None) — 모든 폴더를 합친 값
+    # on_result(RootResult) 는 폴더 하나가 끝날 때마다 (작업 스레드에서) 호출된다
+    # 반환: root_options 순서대로의 결과
+    if per_device < 1 or max_parallel < 1:
+        raise ValueError("동시 실행 수는 1 이상이어야 합니다.")
+
+    if retention and retention.get("max_count") is not None:
+        # 한 번에 정리한 폴더들의 기록이 서로를 지우지 않도록
+        retention = dict(retention, max_count=max(retention["max_count"], len(root_options)))
+
+    results = [None] * len(root_options)
+    lock = threading.Lock()
+    counts = {}         # 폴더 번호 -> (처리한 수, 바이트)
+    totals = [0, 0]
+
+    def cancelled() -> bool:
+        return cancel is not None and cancel.is_set()
+
+    def finish(i: int, result: RootResult):
+        results[i] = result
+        if on_result is not None:
+            on_result(result)
+
+    def root_progress(i: int):
+        if progress is None:
+            return None
+
+        def update(done: int, bytes_done: int, total: int | None):
+            with lock:
+                old_done, old_bytes = counts.get(i, (0, 0))
+                counts[i] = (done, bytes_done)
+                totals[0] += done - old_done
+                totals[1] += bytes_done - old_bytes
+                progress(totals[0], totals[1], None)
+
+        return update
+
+    def start(i: int):
+        return pool.submit(
+            run_root, root_options[i],
+            progress=root_progress(i), cancel=cancel,
+            retention=retention, **run_options,
+        )
+
+    queues = {}         # 드라이브 -> 기다리는 폴더 번호
+    running = {}        # 드라이브 -> 실행 중인 폴더 수
+    futures = {}        # Future -> (폴더 번호, 드라이브 | None — stat 중)
+    deadline = time.monotonic() + DEVICE_TIMEOUT
+
+    for i, options in enumerate(root_options):
+        futures[lookup_device(options["target_dir"])] = (i, None)
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        while futures:
+            lookups = [f for f, (_, dev) in futures.items() if dev is None]
+            timeout = max(deadline - time.monotonic(), 0) if lookups else None
+            done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # 응답 없는 마운트 — stat 스레드는 그대로 두고 결과만 남긴다
+                for future in lookups:
+                    i, _ = futures.pop(future)
+                    finish(i, RootResult(
+                        str(root_options[i]["target_dir"]),
+                        error=f"{DEVICE_TIMEOUT:.0f}초 안에 응답이 없습니다.",
+                    ))
+                continue
+
+            for future in done:
+                i, dev = futures.pop(future)
+                if dev is not None:
+                    running[dev] -= 1
+                    finish(i, future.result())
+                    continue
+                try:
+                    dev = future.result()
+                except OSError as e:
+                    finish(i, RootResult(str(root_options[i]["target_dir"]), error=str(e)))
+                    continue
+                queues.setdefault(dev, deque()).append(i)
+
+            # 자리가 빈 드라이브에서 다음 폴더를 시작한다
+            for dev, queue in queues.items():
+                while queue:
+                    if cancelled():
+                        i = queue.popleft()
+                        finish(i, RootResult(str(root_options[i]["target_dir"]), cancelled=True))
+                        continue
+                    if running.get(dev, 0) >= per_device or sum(running.values()) >= max_parallel:
+                        break
+                    i = queue.popleft()
+                    running[dev] = running.get(dev, 0) + 1
+                    futures[start(i)] = (i, dev)
+
+    return results
@@ -0,0 +1,421 @@
+import fnmatch
+import re
+import time
+from typing import NamedTuple
+
+# 분류 규칙
+#   settings["rules"] = {카테고리: [토큰, ...]} — 표의 한 행이 규칙 하나
+#
+#   .jpg  .tar.gz     확장자 (여러 단계 확장자 가능, 대소문자 무시)
+#   name:IMG_*.jpg    파일 이름 glob (대소문자 무시)
+#   re:^\d{8}_        파일 이름 정규식 (search)
+#   size:>10MB        크기 조건 (size:<1GB, size:10MB-1GB)
+#   age:>30d          수정된 지 지난 시간 (age:<2h, age:7d-30d / s m h d w)
+#   priority:10       높은 것부터 검사 (같으면 표 순서대로)
+#
+# 이름 조건(확장자, name, re)은 하나만 맞으면 되고, 없으면 모든 이름에 맞는다
+# 크기/시간 조건은 모두 맞아야 한다
+# 규칙은 우선순위 → 표 순서로 검사해서 처음 맞는 규칙의 카테고리를 쓴다
+OTHERS = "Others"
+
+SIZE_UNITS = {"b": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4}
+AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+SIZE_VALUE = re.compile(r"(\d+(?:\.\d+)?)\s*(b|kb|mb|gb|tb)?$", re.IGNORECASE)
+AGE_VALUE = re.compile(r"(\d+(?:\.\d+)?)\s*(s|m|h|d|w)?$", re.IGNORECASE)
+
+
+class Rule(NamedTuple):
+    category: str
+    suffixes: tuple = ()
+    globs: tuple = ()
+    regexes: tuple = ()
+    min_size: int | None = None
+    max_size: int | None = None
+    min_age: float | None = None     # 초
+    max_age: float | None = None
+    priority: int = 0
+    order: int = 0
+
+    @property
+    def has_name_matchers(self) -> bool:
+        return bool(self.suffixes or self.globs or self.regexes)
+
+    @property
+    def has_conditions(self) -> bool:
+        return (
+            self.min_size is not None or self.max_size is not None
+            or self.min_age is not None or self.max_age is not None
+        )
+
+
+def parse_amount(text: str, pattern: re.Pattern, units: dict, default_unit: str) -> float:
+    m = pattern.match(text.strip())
+    if not m:
+        raise ValueError(f"값을 읽을 수 없습니다: {text}")
+    return float(m.group(1)) * units[(m.group(2) or default_unit).lower()]
+
+
+def parse_range(token: str, pattern: re.Pattern, units: dict, default_unit: str) -> tuple:
+    # ">10MB" | "<1GB" | "10MB-1GB" → (최소, 최대)
+    body = token.split(":", 1)[1]
+    if body.startswith(">"):
+        return parse_amount(body[1:], pattern, units, default_unit), None
+    if body.startswith("<"):
+        return None, parse_amount(body[1:], pattern, units, default_unit)
+    if "-" in body:
+        low, high = body.split("-", 1)
+        low = parse_amount(low, pattern, units, default_unit)
+        high = parse_amount(high, pattern, units, default_unit)
+        if low > high:
+            raise ValueError(f"범위가 거꾸로 되어 있습니다: {token}")
+        return low, high
+    raise ValueError(f"범위는 >값, <값, 값-값 형식이어야 합니다: {token}")
+
+
+def parse_rule(category: str, tokens: list, order: int) -> Rule:
+    suffixes = []
+    globs = []
+    regexes = []
+    fields = {}
+
+    for token in tokens:
+        kind, _, body = token.partition(":")
+        if token.startswith("."):
+            if len(token) < 2 or "/" in token or "\\" in token:
+                raise ValueError(f"확장자 형식이 잘못되었습니다: {token}")
+            suffixes.append(token.lower())
+        elif kind == "name" and body:
+            globs.append(body.lower())
+        elif kind == "re" and body:
+            try:
+                re.compile(body)
+            except re.error as e:
+                raise ValueError(f"정규식 오류 ({token}): {e}")
+            regexes.append(body)
+        elif kind == "size":
+            low, high = parse_range(token, SIZE_VALUE, SIZE_UNITS, "b")
+            fields["min_size"] = None if low is None else int(low)
+            fields["max_size"] = None if high is None else int(high)
+        elif kind == "age":
+            fields["min_age"], fields["max_age"] = parse_range(token, AGE_VALUE, AGE_UNITS, "d")
+        elif kind == "priority":
+            try:
+                fields["priority"] = int(body)
+            except ValueError:
+                raise ValueError(f"우선순위는 정수여야 합니다: {token}")
+        else:
+            raise ValueError(f"알 수 없는 규칙: {token} (확장자는 .으로 시작해야 합니다)")
+
+    rule = Rule(
+        category, tuple(suffixes), tuple(globs), tuple(regexes),
+        order=order, **fields,
+    )
+    if not rule.has_name_matchers and not rule.has_conditions:
+        raise ValueError(f"'{category}' 규칙에 조건이 없습니다.")
+    return rule
+
+
+def parse_rules(rules: dict) -> list[Rule]:
+    # settings["rules"] → 검사 순서대로 정렬된 Rule 목록
+    parsed = [
+        parse_rule(category, tokens, order)
+        for order, (category, tokens) in enumerate(rules.items())
+    ]
+    return sorted(parsed, key=lambda r: (-r.priority, r.order))
+
+
+def range_contains(outer: tuple, inner: tuple) -> bool:
+    (outer_low, outer_high), (inner_low, inner_high) = outer, inner
+    if outer_low is not None and (inner_low is None or inner_low < outer_low):
+        return False
+    if outer_high is not None and (inner_high is None or inner_high > outer_high):
+        return False
+    return True
+
+
+def conditions_contain(outer: Rule, inner: Rule) -> bool:
+    # outer 의 크기/시간 조건이 inner 의 조건을 모두 포함하는지
+    return (
+        range_contains((outer.min_size, outer.max_size), (inner.min_size, inner.max_size))
+        and range_contains((outer.min_age, outer.max_age), (inner.min_age, inner.max_age))
+    )
+
+
+def find_suffix_cover(rule: Rule, suffix: str) -> str | None:
+    # rule 이 suffix 로 끝나는 모든 이름에 맞으면 그 이유가 되는 확장자
+    if not rule.has_name_matchers:
+        return "(모든 이름)"
+    for own in rule.suffixes:
+        if suffix == own or suffix.endswith(own):
+            return own
+    return None
+
+
+def check_rules(ordered: list[Rule]) -> list[str]:
+    # 앞선 규칙에 완전히 가려져 절대 쓰이지 않는 조건은 오류(ValueError)
+    # 일부만 겹치는 경우는 경고 문자열로 돌려준다
+    warnings = []
+
+    for i, rule in enumerate(ordered):
+        earlier = ordered[:i]
+
+        if not rule.has_name_matchers:
+            for prev in earlier:
+                if not prev.has_name_matchers and conditions_contain(prev, rule):
+                    raise ValueError(
+                        f"'{rule.category}' 규칙은 앞선 '{prev.category}' 규칙에 "
+                        f"가려져 적용되지 않습니다."
+                    )
+            continue
+
+        for suffix in rule.suffixes:
+            partial = None
+            for prev in earlier:
+                cover = find_suffix_cover(prev, suffix)
+                if cover is None:
+                    continue
+                if conditions_contain(prev, rule):
+                    raise ValueError(
+                        f"확장자 중복: '{rule.category}' 의 {suffix} 는 앞선 "
+                        f"'{prev.category}' 의 {cover} 규칙에 가려집니다."
+                    )
+                partial = partial or prev
+            if partial is not None:
+                warnings.append(
+                    f"'{rule.category}' 의 {suffix} 파일 중 일부는 "
+                    f"'{partial.category}' 규칙이 먼저 가져갑니다."
+                )
+
+        for kind, patterns, other in (
+            ("name", rule.globs, "globs"),
+            ("re", rule.regexes, "regexes"),
+        ):
+            for pattern in patterns:
+                for prev in earlier:
+                    if pattern in getattr(prev, other) or not prev.has_name_matchers:
+                        if conditions_contain(prev, rule):
+                            raise ValueError(
+                                f"'{rule.category}' 의 {kind}:{pattern} 는 앞선 "
+                                f"'{prev.category}' 규칙에 가려집니다."
+                            )
+
+    return warnings
+
+
+def combine_patterns(rules: list[Rule], ranks: list[int]) -> tuple:
+    # name/re 규칙을 규칙마다 이름 붙은 그룹 하나로 묶은 정규식 하나로 합친다
+    #   (?P<r0>glob|.*?regex)|(?P<r3>...)|...
+    # 모든 갈래가 이름 처음에서 시작하므로 match() 는 순번이 가장 앞선
+    # 규칙의 갈래에서 멈추고, lastgroup 으로 어느 규칙인지 안다
+    # 합칠 수 없는 정규식((?i) 같은 전역 플래그, 번호 역참조)이 있으면 None
+    if not ranks:
+        return None, {}
+
+    branches = []
+    group_rank = {}
+    for rank in ranks:
+        rule = rules[rank]
+        parts = [f"(?i:{fnmatch.translate(g)})" for g in rule.globs]
+        parts += [f"[\\s\\S]*?(?:{p})" for p in rule.regexes]
+        group = f"r{rank}"
+        group_rank[group] = rank
+        branches.append(f"(?P<{group}>{'|'.join(parts)})")
+
+    try:
+        return re.compile("|".join(branches)), group_rank
+    except re.error:
+        return None, {}
+
+
+class RuleMatcher:
+    # 규칙을 한 번 컴파일해 두고 이름마다 dict 조회 몇 번으로 분류한다
+    #   - 확장자: 이름 끝에서부터 최대 max_parts 단계까지 잘라 보며 표에서 찾는다
+    #   - name/re: 합친 정규식 하나로 먼저 걸러 내고, 맞을 때만 규칙별로 확인
+    # 확장자 규칙만 있고 조건이 없으면 classify 는 suffix 조회만 하는 빠른 경로가 된다
+    def __init__(self, rules: dict, now: float | None = None):
+        self.source = {category: list(tokens) for category, tokens in rules.items()}
+        self.rules = parse_rules(rules)
+        self.warnings = check_rules(self.rules)
+        # age: 조건의 기준 시각 — now 를 주지 않았으면 refresh() 때마다 현재 시각으로
+        self.fixed_now = now
+        self.now = time.time() if now is None else now
+
+        self.categories = list(dict.fromkeys(r.category for r in self.rules))
+
+        self.suffix_table = {}      # 확장자 → [규칙 순번]
+        for rank, rule in enumerate(self.rules):
+            for suffix in rule.suffixes:
+                self.suffix_table.setdefault(suffix, []).append(rank)
+        self.max_parts = max((s.count(".") for s in self.suffix_table), default=0)
+
+        self.pattern_ranks = [
+            rank for rank, rule in enumerate(self.rules) if rule.globs or rule.regexes
+        ]
+        self.fallback_ranks = [
+            rank for rank, rule in enumerate(self.rules) if not rule.has_name_matchers
+        ]
+        self.pattern_re, self.group_rank = combine_patterns(self.rules, self.pattern_ranks)
+        self.plain = [not rule.has_conditions for rule in self.rules]
+        # 합친 정규식을 쓸 수 없을 때, 또는 조건이 맞지 않아 다음 규칙을 볼 때 사용
+        self.compiled = [
+            (
+                [re.compile(fnmatch.translate(g)) for g in rule.globs],
+                [re.compile(p) for p in rule.regexes],
+            )
+            for rule in self.rules
+        ]
+
+        simple = not self.pattern_ranks and not self.fallback_ranks and not any(
+            rule.has_conditions for rule in self.rules
+        )
+        self.fast = None
+        if simple:
+            # 확장자 → 카테고리 (가장 앞선 규칙) 한 번의 조회로 끝낸다
+            self.fast = {
+                suffix: self.rules[ranks[0]].category
+                for suffix, ranks in self.suffix_table.items()
+            }
+            self.classify = self.classify_suffix
+
+    def refresh(self):
+        # 실행(iter_plan)마다 부른다 — 감시 모드처럼 한 번 컴파일해서 오래 쓰는 경우에도
+        # age: 조건이 그 실행 시각을 기준으로 하도록 (한 실행 안에서는 같은 기준)
+        if self.fixed_now is None:
+            self.now = time.time()
+
+    def __eq__(self, other):
+        return isinstance(other, RuleMatcher) and self.source == other.source
+
+    def classify_suffix(self, name: str, size: int = 0, mtime: float = 0.0) -> str | None:
+        fast = self.fast
+        if self.max_parts == 1:
+            i = name.rfind(".")
+            if i <= 0:
+                return None
+            return fast.get(name[i:].lower())
+
+        # 여러 단계 확장자: 긴 것부터 보되 표에서 앞선 규칙을 고른다
+        lower = name.lower()
+        best = None
+        best_rank = None
+        end = len(lower)
+        for _ in range(self.max_parts):
+            i = lower.rfind(".", 0, end)
+            if i <= 0:
+                break
+            ranks = self.suffix_table.get(lower[i:])
+            if ranks and (best_rank is None or ranks[0] < best_rank):
+                best_rank = ranks[0]
+                best = fast[lower[i:]]
+            end = i
+        return best
+
+    def condition_ok(self, rule: Rule, size: int, mtime: float) -> bool:
+        if rule.min_size is not None and size < rule.min_size:
+            return False
+        if rule.max_size is not None and size > rule.max_size:
+            return False
+        if rule.min_age is not None or rule.max_age is not None:
+            age = self.now - mtime
+            if rule.min_age is not None and age < rule.min_age:
+                return False
+            if rule.max_age is not None and age > rule.max_age:
+                return False
+        return True
+
+    def match_patterns(self, name: str, size: int, mtime: float, start: int, best: int) -> int:
+        lower = name.lower()
+        for rank in self.pattern_ranks:
+            if rank < start:
+                continue
+            if rank >= best:
+                break
+            globs, regexes = self.compiled[rank]
+            if not (
+                any(g.match(lower) for g in globs)
+                or any(r.search(name) for r in regexes)
+            ):
+                continue
+            if self.plain[rank] or self.condition_ok(self.rules[rank], size, mtime):
+                return rank
+        return best
+
+    def classify(self, name: str, size: int = 0, mtime: float = 0.0) -> str | None:
+        # 맞는 규칙이 없으면 None (호출하는 쪽에서 Others 로 보낸다)
+        # 순번 목록은 모두 정렬되어 있으므로 목록마다 지금까지 찾은 것보다
+        # 앞선 순번만 보고, 조건이 맞는 첫 규칙에서 멈춘다
+        plain = self.plain
+        rules = self.rules
+        best = len(rules)
+
+        lower = name.lower()
+        end = len(lower)
+        for _ in range(self.max_parts):
+            i = lower.rfind(".", 0, end)
+            if i <= 0:
+                break
+            for rank in self.suffix_table.get(lower[i:], ()):
+                if rank >= best:
+                    break
+                if plain[rank] or self.condition_ok(rules[rank], size, mtime):
+                    best = rank
+                    break
+            end = i
+
+        if self.pattern_ranks and self.pattern_ranks[0] < best:
+            if self.pattern_re is not None:
+                m = self.pattern_re.match(name)
+                if m:
+                    rank = self.group_rank[m.lastgroup]
+                    if rank < best:
+                        if plain[rank] or self.condition_ok(rules[rank], size, mtime):
+                            best = rank
+                        else:
+                            # 조건이 맞지 않으면 뒤쪽 규칙은 하나씩 확인한다
+                            best = self.match_patterns(name, size, mtime, rank + 1, best)
+            else:
+                best = self.match_patterns(name, size, mtime, 0, best)
+
+        for rank in self.fallback_ranks:
+            if rank >= best:
+                break
+            if self.condition_ok(rules[rank], size, mtime):
+                best = rank
+                break
+
+        return rules[best].category if best < len(rules) else None
+
+
+def changed_suffixes(old: RuleMatcher, new: RuleMatcher) -> set | None:
+    # 규칙을 바꿨을 때 분류가 달라질 수 있는 파일의 확장자 (ScanEntry.suffix 형식)
+    # 확장자 규칙만 있을 때만 알 수 있다 — 아니면 None (모든 파일을 다시 분류)
+    if old.fast is None or new.fast is None:
+        return None
+
+    if max(old.max_parts, new.max_parts) > 1:
+        # 여러 단계 확장자는 규칙 순서로 고르므로 순서가 바뀐 것도 본다
+        def table(matcher):
+            return {s: (matcher.fast[s], ranks[0]) for s, ranks in matcher.suffix_table.items()}
+        before, after = table(old), table(new)
+    else:
+        before, after = old.fast, new.fast
+
+    changed = {s for s in before.keys() | after.keys() if before.get(s) != after.get(s)}
+    # .tar.gz 가 바뀌면 .gz 로 끝나는 파일을 다시 본다
+    return {"." + s.rsplit(".", 1)[-1] for s in changed}
+
+
+def compile_rules(rules: dict, now: float | None = None) -> RuleMatcher:
+    return RuleMatcher(rules, now)
+
+
+def get_matcher(rules) -> RuleMatcher:
+    # RuleMatcher, settings 형식 {카테고리: [토큰]}, 예전 형식 {확장자: 카테고리}
+    if isinstance(rules, RuleMatcher):
+        return rules
+    if rules and all(isinstance(v, str) for v in rules.values()):
+        grouped = {}
+        for ext, category in rules.items():
+            grouped.setdefault(category, []).append(ext)
+        rules = grouped
+    return compile_rules(rules)
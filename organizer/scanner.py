@@ -0,0 +1,113 @@
+import os
+import stat
+from pathlib import Path
+from typing import Iterator, NamedTuple
+from organizer.excludes import compile_excludes
+from organizer.platform import is_hidden_entry
+
+
+class ScanEntry(NamedTuple):
+    path: str
+    name: str
+    suffix: str         # 소문자 확장자 (Path.suffix 규칙)
+    size: int
+    mtime: float
+    dev: int
+    ino: int
+    hidden: bool
+
+
+def get_suffix(name: str) -> str:
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
+
+
+def make_entry(
+    entry: os.DirEntry,
+    exclude_hidden: bool,
+    exclude_extensions: set,
+    follow_symlinks: bool = True,
+) -> ScanEntry | None:
+    # follow_symlinks=False 면 파일을 가리키는 링크도 건너뛴다 (링크 너머의 파일은 정리하지 않는다)
+    try:
+        if not entry.is_file(follow_symlinks=follow_symlinks):
+            return None
+
+        suffix = get_suffix(entry.name)
+        if suffix in exclude_extensions:
+            return None
+
+        st = entry.stat(follow_symlinks=follow_symlinks)
+    except OSError:
+        return None
+
+    hidden = is_hidden_entry(entry.name, st)
+    if exclude_hidden and hidden:
+        return None
+
+    return ScanEntry(
+        path=entry.path,
+        name=entry.name,
+        suffix=suffix,
+        size=st.st_size,
+        mtime=st.st_mtime,
+        dev=st.st_dev,
+        ino=st.st_ino,
+        hidden=hidden,
+    )
+
+
+def scan_dir(
+    target_dir: Path,
+    exclude_hidden: bool = False,
+    exclude_extensions=(),
+    exclude_patterns=None,
+) -> Iterator[ScanEntry]:
+    # DirEntry 가 캐시한 정보만 사용해서 파일당 stat 을 최대 한 번으로 제한
+    # 제외 패턴은 이름만 보고 stat 전에 거른다
+    exclude_extensions = set(exclude_extensions)
+    excludes = compile_excludes(exclude_patterns)
+
+    with os.scandir(target_dir) as it:
+        for entry in it:
+            if excludes is not None and excludes.match(entry.name):
+                continue
+            record = make_entry(entry, exclude_hidden, exclude_extensions)
+            if record is not None:
+                yield record
+
+
+def stat_entry(
+    path: str,
+    exclude_hidden: bool = False,
+    exclude_extensions=(),
+) -> ScanEntry | None:
+    # 이름만 알고 있는 파일 하나를 ScanEntry 로 만든다 (감시 모드용)
+    name = os.path.basename(path)
+    suffix = get_suffix(name)
+    if suffix in exclude_extensions:
+        return None
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    hidden = is_hidden_entry(name, st)
+    if exclude_hidden and hidden:
+        return None
+
+    return ScanEntry(
+        path=path,
+        name=name,
+        suffix=suffix,
+        size=st.st_size,
+        mtime=st.st_mtime,
+        dev=st.st_dev,
+        ino=st.st_ino,
+        hidden=hidden,
+    )
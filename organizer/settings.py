@@ -1,6 +1,8 @@
 import json
+import os
 from pathlib import Path
 from organizer.platform import get_config_dir, get_desktop_path
+from organizer.rules import compile_rules
 
 
 DEFAULT_SETTINGS = {
@@ -14,8 +16,55 @@ DEFAULT_SETTINGS = {
     "mode": None,               # move | inplace (필수 선택)
     "archive_folder": "Archive",
     "exclude_hidden": True,
+    "exclude_patterns": [],     # .gitignore 형식 제외 패턴 (node_modules/, *.part, ~$*, /build ...)
+    "workers": 1,               # 동시 이동 작업 수 (1 이면 예전처럼 순차 실행, 2 이상이면 병렬)
+    "verify_copy": False,       # 다른 드라이브로 옮길 때 체크섬 확인 후 원본 삭제
+    "journal_durability": "batch",  # off | batch | full (undo 저널 fsync 정책)
+    "undo_compress": True,          # 되돌리기 기록을 zlib 으로 압축
+    "undo_retention": {             # 되돌리기 기록 보관 기준 (None 이면 제한 없음)
+        "max_count": 10,
+        "max_age_days": None,
+        "max_bytes": None,
+    },
+    "recursive": False,         # 하위 폴더까지 정리
+    "max_depth": None,          # 재귀 깊이 제한 (None 이면 제한 없음)
+    "follow_symlinks": False,   # 폴더 심볼릭 링크를 따라갈지 여부
+    "content_sniffing": False,  # 확장자가 없거나 모르는 파일은 내용으로 분류
+    "duplicates": None,         # None | skip | hardlink | move (내용이 같은 파일 처리)
+    "duplicates_folder": "Duplicates",  # duplicates 가 move 일 때 옮길 폴더
+    "date_folders": None,       # None | year | month (카테고리/2026/10 처럼 날짜별로 나누기)
+    "media_dates": True,        # 날짜 폴더: 사진/동영상은 EXIF/MP4 촬영 날짜 (없으면 수정 시각)
+    # 지난 실행 이후 바뀐 폴더만 다시 읽기 (--incremental 로 켠다)
+    # 폴더 수정 시각을 믿으므로 네트워크 드라이브, FAT 처럼 시각이 거친 곳에서는 변화를 놓칠 수 있다
+    "incremental_scan": False,
+    "full_rescan_hours": 24,    # 이 시간이 지나면 스냅샷을 버리고 전부 다시 읽기
+    "watch_debounce_seconds": 1.0,  # 감시 모드: 이벤트가 잠잠해질 때까지 기다리는 시간
+    "watch_settle_seconds": 2.0,    # 감시 모드: 크기가 변하지 않아야 하는 시간
+    "watch_batch_size": 100,        # 감시 모드: 되돌리기 기록 하나에 담을 파일 수
+    "watch_poll_interval": 2.0,     # inotify 를 못 쓸 때 폴더 확인 간격
+    "run_report": False,        # 실행마다 단계별 시간 등을 담은 보고서 저장 (--report 로 한 번만 켤 수도 있다)
+    "run_profile": None,        # None | cprofile | tracemalloc (보고서에 프로파일 결과 포함)
+    # 여러 대상 폴더 — [{"path": ..., "profile": 규칙 프로필 이름, 그 밖의 설정 덮어쓰기}]
+    # 비어 있으면 target_dir 하나만 정리한다
+    "roots": [],
+    "rule_profiles": {},        # 이름 → 규칙 (roots 의 profile 로 고른다, 없으면 rules)
+    "device_concurrency": 1,    # 한 드라이브에서 동시에 정리할 폴더 수 (디스크 탐색 경합 방지)
+    "max_parallel_roots": 8,    # 전체에서 동시에 정리할 폴더 수
+    "keep_replaced": True,      # 덮어쓰기 모드에서 원래 파일을 보관 폴더로 옮겨 두기 (되돌리기로 복원)
+    "staging_retention": {      # 보관 폴더 한도 (전체 합계, 넘으면 오래된 것부터 삭제)
+        "max_bytes": 5 * 1024 ** 3,
+        "max_age_days": 30,
+    },
 }
 
+# roots 항목에서 덮어쓸 수 있는 설정
+ROOT_OVERRIDES = (
+    "exclude_extensions", "on_conflict", "mode", "archive_folder", "exclude_hidden",
+    "exclude_patterns",
+    "recursive", "max_depth", "follow_symlinks", "content_sniffing",
+    "duplicates", "duplicates_folder", "date_folders", "media_dates",
+)
+
 
 def get_settings_path() -> Path:
     config_dir = get_config_dir()
@@ -23,10 +72,13 @@ def get_settings_path() -> Path:
     return config_dir / "settings.json"
 
 
-def load_settings() -> dict:
-    path = get_settings_path()
+def load_settings(path: Path | None = None) -> dict:
+    # path 를 주면 그 파일을 읽기만 한다 (없으면 FileNotFoundError)
+    explicit = path is not None
+    if not explicit:
+        path = get_settings_path()
 
-    if not path.exists():
+    if not explicit and not path.exists():
         settings = DEFAULT_SETTINGS.copy()
         settings["target_dir"] = str(get_desktop_path())
         save_settings(settings)
@@ -57,3 +109,75 @@ def reset_settings() -> dict:
     settings["target_dir"] = str(get_desktop_path())
     save_settings(settings)
     return settings
+
+
+def get_plan_options(settings: dict) -> dict:
+    # 저장된 설정 → iter_plan / organize_desktop 인자
+    # 규칙은 여기서 한 번 컴파일한다 (잘못된 규칙이면 ValueError)
+    return {
+        "target_dir": Path(settings["target_dir"]),
+        "rules": compile_rules(settings["rules"]),
+        "exclude_extensions": settings["exclude_extensions"],
+        "mode": settings["mode"],
+        "conflict_mode": settings["on_conflict"],
+        "archive_folder": settings["archive_folder"],
+        "exclude_hidden": settings["exclude_hidden"],
+        "exclude_patterns": settings["exclude_patterns"],
+        "recursive": settings["recursive"],
+        "max_depth": settings["max_depth"],
+        "follow_symlinks": settings["follow_symlinks"],
+        "sniff": settings["content_sniffing"],
+        "duplicates": settings["duplicates"],
+        "duplicates_folder": settings["duplicates_folder"],
+        "date_folders": settings["date_folders"],
+        "media_dates": settings["media_dates"],
+    }
+
+
+def get_root_options(settings: dict) -> list[dict]:
+    # roots 가 있으면 폴더마다, 없으면 target_dir 하나의 iter_plan 인자 목록
+    roots = settings.get("roots") or [{"path": settings["target_dir"]}]
+    profiles = settings.get("rule_profiles") or {}
+
+    result = []
+    for root in roots:
+        if isinstance(root, str):
+            root = {"path": root}
+        if not root.get("path"):
+            raise ValueError("대상 폴더 경로가 비어 있습니다.")
+
+        root_settings = dict(settings, target_dir=root["path"])
+        for key in ROOT_OVERRIDES:
+            if key in root:
+                root_settings[key] = root[key]
+
+        profile = root.get("profile")
+        if profile is not None:
+            if profile not in profiles:
+                raise ValueError(f"없는 규칙 프로필입니다: {profile} ({root['path']})")
+            root_settings["rules"] = profiles[profile]
+
+        try:
+            result.append(get_plan_options(root_settings))
+        except ValueError as e:
+            raise ValueError(f"{root['path']}: {e}")
+
+    check_root_overlap(result)
+    return result
+
+
+def check_root_overlap(root_options: list[dict]):
+    # 같은 폴더를 두 번 정리하거나, 하위 폴더까지 훑는 폴더 안에 다른 폴더가 있으면
+    # 두 실행이 같은 파일을 옮기게 되므로 막는다
+    seen = []
+    for options in root_options:
+        path = os.path.normcase(os.path.abspath(options["target_dir"]))
+        for other, recursive in seen:
+            if path == other:
+                raise ValueError(f"대상 폴더가 두 번 들어 있습니다: {options['target_dir']}")
+            inside = os.path.commonpath([path, other])
+            if (recursive and inside == other) or (options["recursive"] and inside == path):
+                raise ValueError(
+                    f"하위 폴더까지 정리하는 폴더가 다른 대상 폴더를 포함합니다: {options['target_dir']}"
+                )
+        seen.append((path, options["recursive"]))
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from organizer.platform import get_config_dir
+from organizer.rules import get_matcher
+
+# 대상 폴더별 스캔 스냅샷 (다음 실행에서 바뀐 폴더만 다시 읽기 위한 것)
+#   dirs  : 원본 쪽 폴더 → 수정 시각, 정리 대상 파일 이름, 하위 폴더
+#   dests : 카테고리 폴더 → 수정 시각, 이미 있는 이름 집합 (DestIndex 용)
+# 폴더 수정 시각이 그대로면 목록을 다시 읽지 않고 폴더 stat 한 번으로 끝낸다
+SNAPSHOT_VERSION = 1
+FULL_RESCAN_HOURS = 24
+
+# 방금 바뀐 폴더는 같은 시각 안에 또 바뀌어도 수정 시각이 같을 수 있으므로
+# 이 시간 안에 바뀐 폴더는 기록하지 않는다
+RACY_SECONDS = 2.0
+
+
+def get_snapshot_path(target_dir: Path) -> Path:
+    key = os.path.normcase(os.path.abspath(target_dir))
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+    snapshot_dir = get_config_dir() / "snapshots"
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    return snapshot_dir / f"{digest}.json"
+
+
+def get_fingerprint(options: dict) -> dict:
+    # 스캔 결과에 영향을 주는 설정 — 하나라도 바뀌면 처음부터 다시 훑는다
+    return {
+        "target_dir": os.path.abspath(options["target_dir"]),
+        "mode": options["mode"],
+        "archive_folder": options["archive_folder"],
+        "categories": sorted(get_matcher(options["rules"]).categories),
+        "exclude_extensions": sorted(options["exclude_extensions"]),
+        "exclude_hidden": options["exclude_hidden"],
+        "exclude_patterns": list(options.get("exclude_patterns") or ()),
+        "recursive": options.get("recursive", False),
+        "max_depth": options.get("max_depth"),
+        "duplicates_folder": options.get("duplicates_folder"),
+        "date_folders": options.get("date_folders"),
+    }
+
+
+def get_dir_mtime(path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def is_racy(mtime_ns: int) -> bool:
+    return time.time_ns() - mtime_ns < RACY_SECONDS * 1e9
+
+
+class ScanSnapshot:
+    def __init__(self, path: Path, fingerprint: dict, data: dict | None = None):
+        self.path = path
+        self.fingerprint = fingerprint
+        data = data or {}
+        self.full_scan_at = data.get("full_scan_at", time.time())
+        self.dirs = data.get("dirs", {})
+        self.dests = data.get("dests", {})
+        self.inconsistent = False
+        self.hits = 0
+        self.misses = 0
+
+    def lookup_dir(self, path: str) -> tuple[int | None, tuple | None]:
+        # 반환: (현재 수정 시각, 바뀌지 않았으면 (파일 이름, 하위 폴더))
+        mtime = get_dir_mtime(path)
+        record = self.dirs.get(path)
+        if mtime is None or record is None or record["mtime"] != mtime:
+            self.misses += 1
+            return mtime, None
+        self.hits += 1
+        return mtime, (record["files"], record["subdirs"])
+
+    def record_dir(self, path: str, mtime: int | None, files: list, subdirs: list):
+        if mtime is None or is_racy(mtime):
+            self.dirs.pop(path, None)
+            return
+        self.dirs[path] = {"mtime": mtime, "files": files, "subdirs": subdirs}
+
+    def dest_names(self, dest_dir: Path) -> set | None:
+        record = self.dests.get(str(dest_dir))
+        if record is None or get_dir_mtime(dest_dir) != record["mtime"]:
+            return None
+        return set(record["names"])
+
+    def record_dest(self, dest_dir: Path, names: set):
+        mtime = get_dir_mtime(dest_dir)
+        if mtime is None:
+            self.dests.pop(str(dest_dir), None)
+            return
+        self.dests[str(dest_dir)] = {"mtime": mtime, "names": sorted(names)}
+
+    def forget_dest(self, dest_dir: Path):
+        self.dests.pop(str(dest_dir), None)
+
+    def mark_inconsistent(self):
+        # 스냅샷과 실제 폴더가 다르다 — 저장하지 않고 다음 실행에서 전부 다시 훑는다
+        self.inconsistent = True
+
+    def save(self):
+        if self.inconsistent:
+            self.path.unlink(missing_ok=True)
+            return
+
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "fingerprint": self.fingerprint,
+            "full_scan_at": self.full_scan_at,
+            "dirs": self.dirs,
+            "dests": self.dests,
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def load_snapshot(
+    options: dict,
+    full_rescan_hours: float | None = FULL_RESCAN_HOURS,
+) -> ScanSnapshot:
+    # options 는 iter_plan 인자
+    # 스냅샷이 없거나, 설정이 바뀌었거나, 마지막 전체 스캔이 오래되었으면
+    # 빈 스냅샷으로 시작한다 (이번 실행이 전체 스캔이 된다)
+    path = get_snapshot_path(options["target_dir"])
+    fingerprint = get_fingerprint(options)
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        return ScanSnapshot(path, fingerprint)
+
+    if data.get("version") != SNAPSHOT_VERSION or data.get("fingerprint") != fingerprint:
+        return ScanSnapshot(path, fingerprint)
+
+    age = time.time() - data.get("full_scan_at", 0)
+    if full_rescan_hours is not None and age > full_rescan_hours * 3600:
+        return ScanSnapshot(path, fingerprint)
+
+    return ScanSnapshot(path, fingerprint, data)
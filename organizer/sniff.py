@@ -0,0 +1,185 @@
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from organizer.cache import FileCache, file_key
+from organizer.scanner import ScanEntry
+
+# 파일 앞부분만 읽어서 종류를 알아낸다
+HEAD_SIZE = 512
+SNIFF_WORKERS = 8
+
+# 알아내지 못했을 때 캐시에 넣는 값 (다시 열지 않도록)
+UNKNOWN = ""
+
+# (오프셋, 시그니처, 확장자)
+SIGNATURES = [
+    (0, b"\xff\xd8\xff", ".jpg"),
+    (0, b"\x89PNG\r\n\x1a\n", ".png"),
+    (0, b"GIF87a", ".gif"),
+    (0, b"GIF89a", ".gif"),
+    (0, b"BM", ".bmp"),         # 아래 VALIDATORS 로 헤더를 더 확인한다
+    (0, b"II*\x00", ".tif"),
+    (0, b"MM\x00*", ".tif"),
+    (0, b"8BPS", ".psd"),
+    (0, b"%PDF-", ".pdf"),
+    (0, b"{\\rtf", ".rtf"),
+    (0, b"PK\x03\x04", ".zip"),
+    (0, b"Rar!\x1a\x07", ".rar"),
+    (0, b"7z\xbc\xaf\x27\x1c", ".7z"),
+    (0, b"\x1f\x8b", ".gz"),
+    (0, b"ID3", ".mp3"),
+    (0, b"\xff", ".mp3"),       # ID3 없는 MP3 — 프레임 헤더
+    (0, b"OggS", ".ogg"),
+    (0, b"fLaC", ".flac"),
+    (0, b"\x1aE\xdf\xa3", ".mkv"),
+    (0, b"SQLite format 3\x00", ".sqlite"),
+    (0, b"MZ", ".exe"),
+    (0, b"\x7fELF", ".elf"),
+    (8, b"WEBP", ".webp"),
+    (8, b"WAVE", ".wav"),
+    (8, b"AVI ", ".avi"),
+    (4, b"ftyp", ".mp4"),
+]
+
+# ftyp 박스의 brand 로 mp4 계열을 세분한다
+FTYP_BRANDS = {
+    b"qt  ": ".mov",
+    b"heic": ".heic",
+    b"heix": ".heic",
+    b"mif1": ".heic",
+    b"M4A ": ".m4a",
+    b"3gp4": ".3gp",
+    b"3gp5": ".3gp",
+}
+
+
+BMP_DIB_SIZES = {12, 40, 52, 56, 64, 108, 124}
+
+
+def is_bmp_header(head: bytes) -> bool:
+    # 예약 필드가 0 이고 DIB 헤더 크기가 알려진 값, 픽셀 위치가 헤더 뒤
+    if len(head) < 18:
+        return False
+    size, reserved, pixels, dib = struct.unpack_from("<IIII", head, 2)
+    return (
+        reserved == 0 and dib in BMP_DIB_SIZES
+        and 14 + dib <= pixels and (size == 0 or pixels < size)
+    )
+
+
+def is_pe_header(head: bytes) -> bool:
+    # DOS 헤더의 e_lfanew 가 가리키는 곳에 "PE\0\0" 이 있어야 한다
+    if len(head) < 0x40:
+        return False
+    (offset,) = struct.unpack_from("<I", head, 0x3C)
+    return head[offset:offset + 4] == b"PE\x00\x00"
+
+
+def is_mp3_frame(head: bytes) -> bool:
+    # 11비트 동기 신호 + 예약 값이 아닌 버전/비트레이트/샘플링 주파수, 레이어는 II/III 만
+    # (Layer I 은 거의 쓰이지 않고, 허용하면 UTF-16 BOM(FF FE)으로 시작하는 텍스트와 겹친다)
+    if len(head) < 4 or head[1] & 0xE0 != 0xE0:
+        return False
+    version = (head[1] >> 3) & 0x3
+    layer = (head[1] >> 1) & 0x3
+    bitrate = head[2] >> 4
+    sample_rate = (head[2] >> 2) & 0x3
+    return version != 1 and layer in (1, 2) and bitrate not in (0, 15) and sample_rate != 3
+
+
+# 짧은 시그니처는 글자로 시작하는 텍스트 파일과도 맞으므로 헤더를 더 확인한다
+VALIDATORS = {
+    b"BM": is_bmp_header,
+    b"MZ": is_pe_header,
+    b"\xff": is_mp3_frame,
+}
+
+
+def compile_signatures(signatures: list) -> dict:
+    # 검사할 바이트(오프셋 위치의 첫 바이트)별로 후보를 묶어 둔다
+    # 긴 시그니처를 먼저 보도록 정렬
+    table = {}
+    for offset, magic, ext in sorted(signatures, key=lambda s: -len(s[1])):
+        table.setdefault((offset, magic[0]), []).append((offset, magic, ext))
+    return table
+
+
+SIGNATURE_TABLE = compile_signatures(SIGNATURES)
+SIGNATURE_OFFSETS = sorted({offset for offset, _, _ in SIGNATURES})
+
+
+def match_signature(head: bytes) -> str | None:
+    for offset in SIGNATURE_OFFSETS:
+        if len(head) <= offset:
+            break
+        for _, magic, ext in SIGNATURE_TABLE.get((offset, head[offset]), ()):
+            if head.startswith(magic, offset):
+                check = VALIDATORS.get(magic)
+                if check is not None and not check(head):
+                    continue
+                if magic == b"ftyp":
+                    return FTYP_BRANDS.get(head[8:12], ext)
+                return ext
+    return None
+
+
+def read_head(path: str) -> bytes:
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        # O_NOATIME 은 파일 소유자만 쓸 수 있다
+        fd = os.open(path, flags & ~getattr(os, "O_NOATIME", 0))
+    try:
+        return os.read(fd, HEAD_SIZE)
+    finally:
+        os.close(fd)
+
+
+def sniff_file(path: str) -> str:
+    try:
+        return match_signature(read_head(path)) or UNKNOWN
+    except OSError:
+        return UNKNOWN
+
+
+def get_entry_key(entry: ScanEntry) -> str:
+    return file_key(entry.dev, entry.ino, entry.size, entry.mtime, entry.path)
+
+
+class Sniffer:
+    def __init__(self, workers: int = SNIFF_WORKERS):
+        self.cache = FileCache("sniff")
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def sniff_many(self, entries: list[ScanEntry]) -> dict:
+        # 반환: {경로: 확장자} (알아내지 못한 파일은 빠진다)
+        if not entries:
+            return {}
+
+        keys = [get_entry_key(e) for e in entries]
+        cached = self.cache.get_many(keys)
+
+        result = {}
+        misses = []
+        for entry, key in zip(entries, keys):
+            if key in cached:
+                if cached[key]:
+                    result[entry.path] = cached[key]
+            else:
+                misses.append((entry, key))
+
+        # 바뀐 파일만 디스크에서 읽는다 (스레드 풀로 지연 시간 겹치기)
+        found = self.pool.map(sniff_file, [e.path for e, _ in misses])
+        new = {}
+        for (entry, key), ext in zip(misses, found):
+            new[key] = ext
+            if ext:
+                result[entry.path] = ext
+        self.cache.put_many(new)
+
+        return result
+
+    def close(self):
+        self.pool.shutdown()
+        self.cache.close()
@@ -0,0 +1,188 @@
+import itertools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from organizer.platform import get_config_dir
+
+# 덮어쓰기 모드에서 원래 있던 파일을 지우지 않고 옮겨 두는 보관 폴더
+#   드라이브(볼륨)마다 하나씩 — 같은 드라이브 안의 rename 이라 복사 없이 바로 끝난다
+#   되돌리기 기록이 보관된 경로를 가리키므로 되돌릴 때 두 파일을 모두 제자리로 돌린다
+#   보관 폴더 목록은 설정 폴더의 staging_areas.json 에 모아 두고, 정리는 전체를 대상으로 한다
+#
+# 보관 폴더는 다음 순서로 정한다 (같은 드라이브이고 쓸 수 있는 첫 번째)
+#   1. 설정 폴더/staging
+#   2. 덮어쓸 파일이 있는 폴더/.fileorganizer-staging (정리 폴더 안 — 훑을 때는 건너뛴다)
+#   3. 그 위로 마운트 지점까지 올라가며 — 드라이브 최상위는 마지막
+STAGING_NAME = ".fileorganizer-staging"
+MAX_NAME_BYTES = 240
+
+DEFAULT_RETENTION = {
+    "max_bytes": 5 * 1024 ** 3,
+    "max_age_days": 30,
+}
+
+areas_lock = threading.Lock()
+
+
+def get_areas_path() -> Path:
+    return get_config_dir() / "staging_areas.json"
+
+
+def load_areas() -> list[str]:
+    try:
+        return json.loads(get_areas_path().read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def save_areas(areas: list[str]):
+    path = get_areas_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(areas, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def register_area(staging_dir: Path):
+    with areas_lock:
+        areas = load_areas()
+        if str(staging_dir) not in areas:
+            areas.append(str(staging_dir))
+            save_areas(areas)
+
+
+def find_mount(path: Path, dev: int) -> Path:
+    # dev 가 바뀌기 직전까지 위로 올라간다
+    path = Path(os.path.abspath(path))
+    while path.parent != path:
+        try:
+            if os.stat(path.parent).st_dev != dev:
+                break
+        except OSError:
+            break
+        path = path.parent
+    return path
+
+
+def try_staging_dir(staging_dir: Path, dev: int) -> bool:
+    try:
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        st = os.stat(staging_dir)
+    except OSError:
+        return False
+    return st.st_dev == dev and os.access(staging_dir, os.W_OK)
+
+
+def find_staging_dir(path: Path, dev: int) -> Path:
+    # path: 덮어쓸 파일이 있는 폴더
+    candidates = [get_config_dir() / "staging"]
+    folder = Path(os.path.abspath(path))
+    mount = find_mount(folder, dev)
+    while True:
+        candidates.append(folder / STAGING_NAME)
+        if folder == mount:
+            break
+        folder = folder.parent
+
+    for staging_dir in candidates:
+        if try_staging_dir(staging_dir, dev):
+            register_area(staging_dir)
+            return staging_dir
+    raise OSError(f"덮어쓸 파일을 보관할 폴더를 만들 수 없습니다: {path}")
+
+
+class StagingArea:
+    # 한 번의 실행에서 드라이브별 보관 폴더를 기억해 둔다 (여러 스레드에서 써도 된다)
+    def __init__(self):
+        self.dirs = {}      # dev -> 보관 폴더
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.staged = 0
+
+    def get_dir(self, path: Path, dev: int) -> Path:
+        with self.lock:
+            if dev not in self.dirs:
+                self.dirs[dev] = find_staging_dir(path, dev)
+            return self.dirs[dev]
+
+    def stage(self, path: Path) -> str | None:
+        # path 를 보관 폴더로 옮기고 새 경로를 돌려준다 (파일이 없으면 None)
+        # 이름 앞의 시각이 보관한 순서 — 오래된 것부터 지운다
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return None
+        staging_dir = self.get_dir(path.parent, st.st_dev)
+
+        prefix = f"{time.time_ns()}-{os.getpid()}-{next(self.counter)}"
+        name = f"{prefix}-{path.name}"
+        if len(name.encode("utf-8")) > MAX_NAME_BYTES:
+            name = prefix + path.suffix[:16]
+        staged = staging_dir / name
+        try:
+            os.rename(path, staged)
+        except FileNotFoundError:
+            return None
+        with self.lock:
+            self.staged += 1
+        return str(staged)
+
+
+def get_staged_time(name: str) -> float | None:
+    # 이름 앞의 나노초 시각 → epoch 초
+    head = name.split("-", 1)[0]
+    return int(head) / 1e9 if head.isdigit() else None
+
+
+def evict_staged(retention: dict | None = None):
+    # 모든 보관 폴더를 합쳐 오래된 것부터 지운다 (LRU — 보관한 뒤로 쓰이지 않으므로 보관 순서)
+    retention = retention or DEFAULT_RETENTION
+    max_bytes = retention.get("max_bytes")
+    max_age_days = retention.get("max_age_days")
+
+    files = []      # (보관 시각, 크기, 경로)
+    missing = set()
+    for area in load_areas():
+        try:
+            with os.scandir(area) as it:
+                for entry in it:
+                    staged_at = get_staged_time(entry.name)
+                    if staged_at is None or not entry.is_file(follow_symlinks=False):
+                        continue
+                    files.append((staged_at, entry.stat(follow_symlinks=False).st_size, entry.path))
+        except FileNotFoundError:
+            missing.add(area)
+        except OSError:
+            # 꺼져 있는 외장 드라이브 등 — 다음에 다시 본다
+            continue
+
+    # 최신부터 더해 가다가 한도를 넘는 지점부터 오래된 쪽은 모두 지운다
+    files.sort(reverse=True)
+    now = time.time()
+    total = 0
+    for staged_at, size, path in files:
+        total += size
+        expired = (
+            (max_age_days is not None and now - staged_at > max_age_days * 86400)
+            or (max_bytes is not None and total > max_bytes)
+        )
+        if expired:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    if missing:
+        # 사라진 보관 폴더는 목록에서 뺀다
+        with areas_lock:
+            areas = load_areas()
+            save_areas([area for area in areas if area not in missing])
+
+
+def start_staging_eviction(retention: dict | None = None) -> threading.Thread:
+    # 실행을 막지 않도록 백그라운드에서
+    thread = threading.Thread(target=evict_staged, args=(retention,), daemon=True)
+    thread.start()
+    return thread
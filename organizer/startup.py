@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+from organizer.platform import get_config_dir
+
+# 시작 시간 측정
+#   FILEORGANIZER_STARTUP_TRACE=1 로 실행하면 모듈별 import 시간(-X importtime 과 같은 형식)과
+#   창이 처음 그려질 때까지의 시간을 startup.log 에 남긴다 (콘솔이 있으면 stderr 에도)
+#   꺼져 있으면 아무것도 설치하지 않는다
+ENV_VAR = "FILEORGANIZER_STARTUP_TRACE"
+REPORT_NAME = "startup.log"
+
+trace = None
+
+
+class TimedLoader:
+    # 원래 로더를 감싸서 모듈을 만들고 실행하는 시간을 잰다
+    def __init__(self, loader, timer, name: str):
+        self.loader = loader
+        self.timer = timer
+        self.name = name
+
+    def create_module(self, spec):
+        # 확장 모듈(PySide6 등)은 여기서 실제로 불러온다
+        return self.timer.measure(self.name, self.loader.create_module, spec)
+
+    def exec_module(self, module):
+        return self.timer.measure(self.name, self.loader.exec_module, module, done=True)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class ImportTimer:
+    # sys.meta_path 맨 앞에 들어가서 다른 finder 가 찾은 spec 의 로더만 바꿔 낀다
+    def __init__(self):
+        self.stack = []         # 지금 불러오는 중인 모듈들의 하위 import 시간 합
+        self.records = {}       # 이름 -> [자기 시간, 누적 시간, 깊이]
+        self.order = []
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = TimedLoader(spec.loader, self, name)
+        return spec
+
+    def measure(self, name: str, func, arg, done: bool = False):
+        # done: 모듈 실행까지 끝났을 때 — importtime 처럼 끝난 순서로 적는다
+        depth = len(self.stack)
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(arg)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+
+            record = self.records.setdefault(name, [0.0, 0.0, depth])
+            if done:
+                self.order.append(name)
+            record[0] += elapsed - children
+            record[1] += elapsed
+
+
+class StartupTrace:
+    def __init__(self, started: float):
+        self.started = started
+        self.marks = []
+        self.imports = ImportTimer()
+        self.reported = False
+
+    def mark(self, label: str):
+        self.marks.append((label, time.perf_counter() - self.started))
+
+    def format_report(self) -> str:
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for name in self.imports.order:
+            own, total, depth = self.imports.records[name]
+            lines.append(
+                f"import time: {own * 1e6:9.0f} | {total * 1e6:10.0f} | {'  ' * depth}{name}"
+            )
+
+        lines.append("")
+        for label, elapsed in self.marks:
+            lines.append(f"{label:<24} {elapsed * 1000:9.1f} ms")
+        return "\n".join(lines)
+
+    def write_report(self):
+        if self.reported:
+            return
+        self.reported = True
+
+        report = self.format_report()
+        path = get_config_dir() / REPORT_NAME
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(report + "\n", encoding="utf-8")
+        except OSError:
+            pass
+        # 창 모드 빌드(console=False)에는 stderr 가 없다
+        if sys.stderr is not None:
+            print(report, file=sys.stderr)
+
+
+def begin(started: float | None = None) -> StartupTrace | None:
+    # main.py 맨 처음(무거운 import 전)에 부른다
+    global trace
+    if not os.environ.get(ENV_VAR):
+        return None
+    trace = StartupTrace(time.perf_counter() if started is None else started)
+    sys.meta_path.insert(0, trace.imports)
+    return trace
+
+
+def mark(label: str):
+    if trace is not None:
+        trace.mark(label)
+
+
+def finish(label: str = "startup done"):
+    # 첫 화면 이후 미뤄 둔 일까지 끝났을 때 — 측정을 멈추고 보고서를 쓴다
+    if trace is None:
+        return
+    trace.mark(label)
+    if trace.imports in sys.meta_path:
+        sys.meta_path.remove(trace.imports)
+    trace.write_report()
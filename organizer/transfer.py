@@ -0,0 +1,165 @@
+import errno
+import hashlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+CHUNK_SIZE = 8 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 커널이 해당 파일 조합을 지원하지 않을 때 다음 방법으로 넘어가는 오류들
+FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    errno.EBADF, errno.ENOTSUP,
+}
+
+
+def get_part_path(dst: Path, size: int, mtime: float) -> Path:
+    # 원본 크기/수정시간이 같을 때만 이어받도록 이름에 넣어 둔다
+    return dst.with_name(f".{dst.name}.{size}-{int(mtime)}.part")
+
+
+def copy_with_copy_file_range(fsrc: int, fdst: int, pos: int, size: int) -> int:
+    while pos < size:
+        n = os.copy_file_range(fsrc, fdst, min(CHUNK_SIZE, size - pos), pos, pos)
+        if n == 0:
+            break
+        pos += n
+    return pos
+
+
+def copy_with_sendfile(fsrc: int, fdst: int, pos: int, size: int) -> int:
+    os.lseek(fdst, pos, os.SEEK_SET)
+    while pos < size:
+        n = os.sendfile(fdst, fsrc, pos, min(CHUNK_SIZE, size - pos))
+        if n == 0:
+            break
+        pos += n
+    return pos
+
+
+def copy_with_buffer(fsrc: int, fdst: int, pos: int, size: int) -> int:
+    os.lseek(fsrc, pos, os.SEEK_SET)
+    os.lseek(fdst, pos, os.SEEK_SET)
+    while pos < size:
+        data = os.read(fsrc, min(CHUNK_SIZE, size - pos))
+        if not data:
+            break
+        view = memoryview(data)
+        written = 0
+        while written < len(data):
+            written += os.write(fdst, view[written:])
+        pos += len(data)
+    return pos
+
+
+def get_copy_methods() -> list:
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(copy_with_copy_file_range)
+    # macOS 의 sendfile 은 소켓 전용이라 리눅스에서만 사용
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        methods.append(copy_with_sendfile)
+    methods.append(copy_with_buffer)
+    return methods
+
+
+def copy_range(fsrc: int, fdst: int, pos: int, size: int) -> int:
+    for method in get_copy_methods():
+        try:
+            return method(fsrc, fdst, pos, size)
+        except OSError as e:
+            if e.errno not in FALLBACK_ERRNOS:
+                raise
+            # 이미 복사한 위치부터 다음 방법으로 이어서 진행
+            pos = os.lseek(fdst, 0, os.SEEK_END)
+    return pos
+
+
+def file_digest(path) -> str:
+    h = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def copy_to_part(src: str, part: Path, size: int, mtime: float):
+    # size/mtime 은 계획할 때 본 원본 상태 — 그 사이 바뀐 파일은 옮기지 않는다
+    # (잘린 복사본을 남기고 원본을 지우지 않도록 열린 원본의 끝까지 복사한 뒤 다시 확인)
+    fsrc = os.open(src, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        fdst = os.open(part, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            # 이전 실행에서 남은 .part 가 있으면 그 뒤부터 이어받기
+            pos = os.fstat(fdst).st_size
+            if pos > size:
+                os.ftruncate(fdst, 0)
+                pos = 0
+
+            pos = copy_range(fsrc, fdst, pos, os.fstat(fsrc).st_size)
+            os.fsync(fdst)
+        finally:
+            os.close(fdst)
+
+        st = os.fstat(fsrc)
+        if st.st_size != size or st.st_mtime != mtime:
+            raise RuntimeError(f"계획 이후 원본이 바뀌었습니다: {src}")
+        if pos != size:
+            raise RuntimeError(f"복사가 완료되지 않았습니다: {src}")
+    finally:
+        os.close(fsrc)
+
+
+def cross_device_move(src: str, dst: Path, size: int, mtime: float, verify: bool = False):
+    # 임시 이름(.part)으로 복사 → 검증 → rename 으로 확정 → 원본 삭제
+    # 실패하면 .part 를 지우고 원본은 그대로 둔다 (Ctrl+C 로 멈춘 복사만 다음에 이어받는다)
+    part = get_part_path(dst, size, mtime)
+    try:
+        copy_to_part(src, part, size, mtime)
+        shutil.copystat(src, part)
+
+        if verify and file_digest(src) != file_digest(part):
+            raise RuntimeError(f"복사 검증 실패: {src}")
+
+        os.replace(part, dst)
+    except Exception:
+        part.unlink(missing_ok=True)
+        raise
+    os.unlink(src)
+
+
+def move_file(
+    src: str,
+    dst: Path,
+    same_device: bool,
+    size: int,
+    mtime: float,
+    verify: bool = False,
+):
+    # 복사 실패나 검증 실패는 RuntimeError — 원본은 그대로 남는다
+    if same_device:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as e:
+            # st_dev 가 같아도 bind mount, overlay, btrfs 서브볼륨 사이는 rename 할 수 없다
+            if e.errno != errno.EXDEV:
+                raise
+    cross_device_move(src, dst, size, mtime, verify)
+
+
+def link_file(original: str, src: str, dst: Path) -> bool:
+    # 같은 내용의 original 을 dst 에 하드링크로 걸고 src 를 지운다
+    # 링크를 만들 수 없으면 (원본 없음, 다른 드라이브, FAT 등) False
+    os.lstat(src)
+    try:
+        os.link(original, dst)
+    except FileExistsError:
+        # 그 자리에 다른 파일이 생겼으면 옮기기로 넘어가서 덮어쓰면 안 된다
+        raise
+    except OSError:
+        return False
+    os.unlink(src)
+    return True
@@ -1,14 +1,42 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTableWidget, QTableWidgetItem, QLineEdit, QCheckBox,
-    QRadioButton, QTextEdit, QFileDialog, QMessageBox, QButtonGroup
+    QRadioButton, QFileDialog, QMessageBox, QButtonGroup,
+    QProgressBar, QComboBox, QTableView
 )
-from PySide6.QtCore import Qt, QEvent
-from pathlib import Path
+from PySide6.QtCore import Qt, QEvent, QTimer
+import time
 
-from organizer.settings import load_settings, save_settings, reset_settings
-from organizer.core import organize_desktop
-from organizer.undo import undo_last_operation
+from organizer.settings import (
+    load_settings, save_settings, reset_settings, get_plan_options, get_root_options
+)
+from organizer.rules import compile_rules
+from organizer.formatting import format_bytes
+from organizer.preview_ui import PreviewModel
+from organizer import startup
+
+# core / undo / 기록 창은 첫 화면에 필요 없으므로 처음 쓸 때 불러온다 (시작 시간 단축)
+
+# 미리보기 스캔 결과를 화면으로 보내는 단위 (개수, 초)
+PREVIEW_CHUNK = 2000
+PREVIEW_INTERVAL = 0.1
+# 규칙/제외 확장자를 고친 뒤 미리보기를 다시 분류하기까지 기다리는 시간 (ms)
+PREVIEW_UPDATE_DELAY = 300
+
+# (표시 이름, settings["date_folders"] 값)
+DATE_FOLDER_CHOICES = [
+    ("나누지 않음", None),
+    ("연도별 (Images/2026)", "year"),
+    ("월별 (Images/2026/10)", "month"),
+]
+
+# (표시 이름, settings["duplicates"] 값)
+DUPLICATE_CHOICES = [
+    ("확인하지 않음", None),
+    ("옮기지 않고 건너뛰기", "skip"),
+    ("하드링크로 대체", "hardlink"),
+    ("중복 폴더로 옮기기", "move"),
+]
 
 
 class FileOrganizerUI(QWidget):
@@ -18,12 +46,20 @@ class FileOrganizerUI(QWidget):
         self.resize(760, 680)
 
         self.settings = load_settings()
+        self.preview_index = None   # 마지막 미리보기 (PreviewIndex)
+        self.preview_thread = None
+        self.preview_worker = None
+        self.preview_dirty = False  # 스캔 중에 규칙이 바뀜 — 끝나면 다시 분류
+        self.worker = None
+        self.run_report = None      # 진행 중인 정리 실행의 RunReport
+        self.rule_warnings = []
+        self.first_painted = False
         layout = QVBoxLayout(self)
 
 
 
         # ===== 대상 폴더 =====
-        self.target_label = QLabel(f"대상 폴더: {self.settings['target_dir']}")
+        self.target_label = QLabel(self.target_text())
         btn_change = QPushButton("변경")
         btn_change.clicked.connect(self.change_folder)
 
@@ -39,7 +75,12 @@ class FileOrganizerUI(QWidget):
         self.table = QTableWidget(0, 2)
         self.table.setHorizontalHeaderLabels(["Category", "Extensions"])
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.load_rules()
+        self.table.setToolTip(
+            "확장자: .jpg .tar.gz   이름: name:IMG_*   정규식: re:^\\d{8}\n"
+            "크기: size:>10MB, size:1MB-1GB   기간: age:>30d   우선순위: priority:10\n"
+            "위에서부터(우선순위가 높은 것부터) 처음 맞는 규칙으로 분류합니다."
+        )
+        # 규칙 목록은 창이 처음 그려진 뒤에 채운다 (finish_startup)
         layout.addWidget(self.table)
 
         add_btn = QPushButton("+ 분류 추가")
@@ -80,6 +121,29 @@ class FileOrganizerUI(QWidget):
 
 
 
+        # ===== 내용이 같은 파일 처리 =====
+        dup_row = QHBoxLayout()
+        dup_row.addWidget(QLabel("내용이 같은 파일이 있을 때"))
+        self.duplicate_combo = QComboBox()
+        for label, action in DUPLICATE_CHOICES:
+            self.duplicate_combo.addItem(label, action)
+        self.select_duplicate_action(self.settings["duplicates"])
+        dup_row.addWidget(self.duplicate_combo)
+        dup_row.addStretch()
+        layout.addLayout(dup_row)
+
+        # ===== 날짜별 폴더 =====
+        # 사진/동영상은 촬영 날짜, 그 밖의 파일은 수정 날짜
+        date_row = QHBoxLayout()
+        date_row.addWidget(QLabel("카테고리 폴더를 날짜로 나누기"))
+        self.date_combo = QComboBox()
+        for label, mode in DATE_FOLDER_CHOICES:
+            self.date_combo.addItem(label, mode)
+        self.select_date_folders(self.settings["date_folders"])
+        date_row.addWidget(self.date_combo)
+        date_row.addStretch()
+        layout.addLayout(date_row)
+
         # ===== 정리 방식 =====
         layout.addWidget(QLabel("정리 방식"))
 
@@ -113,16 +177,57 @@ class FileOrganizerUI(QWidget):
         self.hidden_check.setChecked(self.settings["exclude_hidden"])
         layout.addWidget(self.hidden_check)
 
+        # ===== 하위 폴더 =====
+        self.recursive_check = QCheckBox("하위 폴더까지 정리")
+        self.recursive_check.setChecked(self.settings["recursive"])
+        layout.addWidget(self.recursive_check)
+
+        # ===== 내용 확인 =====
+        self.sniff_check = QCheckBox("확장자가 없거나 알 수 없는 파일은 내용으로 분류")
+        self.sniff_check.setChecked(self.settings["content_sniffing"])
+        layout.addWidget(self.sniff_check)
+
         # ===== 미리보기 =====
         layout.addWidget(QLabel("미리보기"))
-        self.preview = QTextEdit()
-        self.preview.setReadOnly(True)
+        self.preview_model = PreviewModel()
+        self.preview = QTableView()
+        self.preview.setModel(self.preview_model)
+        self.preview.horizontalHeader().setStretchLastSection(True)
+        self.preview.verticalHeader().setVisible(False)
+        self.preview.verticalHeader().setDefaultSectionSize(20)
         layout.addWidget(self.preview)
 
+        self.preview_summary = QLabel("")
+        self.preview_summary.setStyleSheet("color: gray;")
+        self.preview_summary.setWordWrap(True)
+        layout.addWidget(self.preview_summary)
+
+        # 규칙/제외 확장자를 고치면 잠시 뒤 미리보기를 다시 분류한다 (다시 스캔하지 않음)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_UPDATE_DELAY)
+        self.preview_timer.timeout.connect(self.update_preview)
+        self.exclude_input.editingFinished.connect(self.preview_timer.start)
+
         btn_preview = QPushButton("미리 보기")
         btn_preview.clicked.connect(self.preview_result)
         layout.addWidget(btn_preview)
 
+        # ===== 진행 상황 =====
+        progress_row = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.progress_label = QLabel("")
+        self.progress_label.setStyleSheet("color: gray;")
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel)
+
+        progress_row.addWidget(self.progress_bar)
+        progress_row.addWidget(self.progress_label)
+        progress_row.addWidget(self.cancel_btn)
+        layout.addLayout(progress_row)
+
         # ===== 하단 버튼 =====
         bottom = QHBoxLayout()
         bottom.addStretch()
@@ -131,12 +236,18 @@ class FileOrganizerUI(QWidget):
         btn_save = QPushButton("설정 저장")
         btn_run = QPushButton("정리 실행")
         undo_btn = QPushButton("되돌리기")
+        btn_history = QPushButton("기록 보기")
+        btn_report = QPushButton("실행 보고서")
 
         btn_reset.clicked.connect(self.reset)
         btn_save.clicked.connect(self.save)
         btn_run.clicked.connect(self.run)
         undo_btn.clicked.connect(self.undo)
+        btn_history.clicked.connect(self.show_history)
+        btn_report.clicked.connect(self.show_last_report)
 
+        bottom.addWidget(btn_history)
+        bottom.addWidget(btn_report)
         bottom.addWidget(btn_reset)
         bottom.addWidget(btn_save)
         bottom.addWidget(btn_run)
@@ -144,19 +255,55 @@ class FileOrganizerUI(QWidget):
 
         layout.addLayout(bottom)
 
+        # 작업 중에는 잠가 둘 버튼
+        self.busy_buttons = [
+            btn_preview, btn_reset, btn_save, btn_run, undo_btn, btn_history, btn_report
+        ]
+
         # ===== Footer =====
         footer = QLabel("@youbuddy_day · youbuddy · 2026 · Version 1.0")
         footer.setAlignment(Qt.AlignCenter)
         footer.setStyleSheet("color: gray; font-size: 11px;")
         layout.addWidget(footer)
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_painted:
+            self.first_painted = True
+            startup.mark("first paint")
+            # 첫 화면을 먼저 보여 주고 나머지는 이벤트 루프가 한가할 때
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        self.load_rules()
+        self.table.itemChanged.connect(self.preview_timer.start)
+        # 창이 뜬 뒤에 중단된 실행 기록이 있는지 확인
+        self.check_incomplete_journals()
+        startup.finish()
+
     # ---------- helpers ----------
 
     def change_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "대상 폴더 선택")
         if folder:
             self.settings["target_dir"] = folder
-            self.target_label.setText(f"대상 폴더: {folder}")
+            self.target_label.setText(self.target_text())
+
+    def target_text(self) -> str:
+        text = f"대상 폴더: {self.settings['target_dir']}"
+        roots = self.settings["roots"]
+        if roots:
+            # 여러 폴더는 설정 파일의 roots 로 정한다 (미리보기는 위 폴더만)
+            text += f"  · 정리 실행: 설정의 폴더 {len(roots)}개"
+        return text
+
+    def select_duplicate_action(self, action):
+        index = self.duplicate_combo.findData(action)
+        self.duplicate_combo.setCurrentIndex(max(index, 0))
+
+    def select_date_folders(self, mode):
+        index = self.date_combo.findData(mode)
+        self.date_combo.setCurrentIndex(max(index, 0))
 
     def load_rules(self):
         for cat, exts in self.settings["rules"].items():
@@ -180,7 +327,6 @@ class FileOrganizerUI(QWidget):
 
     def collect_rules(self):
         rules = {}
-        used_exts = set()
         exclude = {e.lower() for e in self.exclude_input.text().split()}
 
         for r in range(self.table.rowCount()):
@@ -202,17 +348,10 @@ class FileOrganizerUI(QWidget):
 
             exts = []
             for e in raw_exts:
-                e = e.lower()   # ⭐ 핵심
-                if not e.startswith("."):
-                    raise ValueError(f"확장자는 .으로 시작해야 합니다: {e}")
-
-                if e in used_exts:
-                    raise ValueError(f"확장자 중복: {e}")
-
-                if e in exclude:
-                    raise ValueError(f"제외 확장자와 충돌: {e}")
-
-                used_exts.add(e)
+                if e.startswith("."):
+                    e = e.lower()   # ⭐ 핵심
+                    if e in exclude:
+                        raise ValueError(f"제외 확장자와 충돌: {e}")
                 exts.append(e)
 
             rules[cat] = exts
@@ -220,6 +359,9 @@ class FileOrganizerUI(QWidget):
         if not rules:
             raise ValueError("최소 한 개 이상의 분류 규칙이 필요합니다.")
 
+        # 문법 오류, 앞선 규칙에 가려지는 규칙(중복 확장자 포함)은 여기서 걸러진다
+        self.rule_warnings = compile_rules(rules).warnings
+
         return rules
 
         rules = {}
@@ -284,44 +426,163 @@ class FileOrganizerUI(QWidget):
 
         return rules
 
-    def preview_result(self):
-        try:
-            rules = self.collect_rules()
-            lines = []
-            for cat, exts in rules.items():
-                for e in exts:
-                    lines.append(f"{e} → {cat}/")
-            lines.append("* 그 외 파일 → Others/")
-            self.preview.setText("\n".join(lines))
-        except Exception as e:
-            QMessageBox.warning(self, "오류", str(e))
-
-    def save(self):
+    def collect_settings(self) -> dict:
         if not self.conflict_group.checkedButton():
-            QMessageBox.warning(self, "오류", "같은 이름 파일 처리 방식을 선택하세요.")
-            return False
+            raise ValueError("같은 이름 파일 처리 방식을 선택하세요.")
 
         if not self.mode_group.checkedButton():
-            QMessageBox.warning(self, "오류", "정리 방식을 선택하세요.")
-            return False
+            raise ValueError("정리 방식을 선택하세요.")
 
-        try:
-            rules = self.collect_rules()
-        except Exception as e:
-            QMessageBox.warning(self, "오류", str(e))
-            return False
+        rules = self.collect_rules()
 
-        self.settings.update({
+        return {
             "rules": rules,
             "exclude_extensions": self.exclude_input.text().split(),
             "on_conflict": "overwrite" if self.overwrite_radio.isChecked() else "rename",
             "mode": "move" if self.move_radio.isChecked() else "inplace",
             "archive_folder": self.archive_input.text().strip() or "Archive",
             "exclude_hidden": self.hidden_check.isChecked(),
-        })
+            "recursive": self.recursive_check.isChecked(),
+            "content_sniffing": self.sniff_check.isChecked(),
+            "duplicates": self.duplicate_combo.currentData(),
+            "date_folders": self.date_combo.currentData(),
+        }
+
+    def build_options(self, settings: dict) -> dict:
+        return get_plan_options(settings)
+
+    def preview_result(self):
+        from organizer.core import iter_plan
+        from organizer.preview import PreviewIndex
+        from organizer.worker import start_worker
+
+        try:
+            settings = dict(self.settings, **self.collect_settings())
+            options = self.build_options(settings)
+        except Exception as e:
+            QMessageBox.warning(self, "오류", str(e))
+            return
+
+        self.cancel_preview()
+        preview = PreviewIndex(options)
+        self.preview_index = preview
+        self.preview_dirty = False
+        self.preview_model.set_preview(preview)
+        self.preview_summary.setText("스캔 중...")
+        scan_options = preview.scan_options()
+
+        def task(progress, cancel, emit):
+            # 스캔 → 분류 → 이름 할당은 백그라운드에서, 결과는 묶어서 화면으로 보낸다
+            batch = []
+            last = time.monotonic()
+            for move in iter_plan(**scan_options):
+                if cancel.is_set():
+                    return False
+                batch.append(move)
+                now = time.monotonic()
+                if len(batch) >= PREVIEW_CHUNK or now - last >= PREVIEW_INTERVAL:
+                    emit(batch)
+                    batch = []
+                    last = now
+            if batch:
+                emit(batch)
+            return True
+
+        # 취소한 이전 미리보기의 신호가 늦게 와도 새 미리보기에 섞이지 않게 한다
+        def on_chunk(moves):
+            if preview is self.preview_index:
+                self.preview_model.append(moves)
+                self.show_preview_summary()
+
+        def on_finished(complete):
+            if preview is not self.preview_index:
+                return
+            self.preview_thread = None
+            self.preview_worker = None
+            preview.complete = complete
+            self.show_preview_summary()
+            if self.preview_dirty:
+                self.update_preview()
+
+        def on_failed(message):
+            if preview is not self.preview_index:
+                return
+            self.clear_preview()
+            QMessageBox.warning(self, "오류", message)
+
+        self.preview_thread, self.preview_worker = start_worker(
+            self, task,
+            on_progress=lambda progress: None,
+            on_finished=on_finished,
+            on_failed=on_failed,
+            on_chunk=on_chunk,
+        )
+
+    def cancel_preview(self):
+        if self.preview_worker is not None:
+            self.preview_worker.cancel()
+        self.preview_thread = None
+        self.preview_worker = None
+
+    def clear_preview(self):
+        self.cancel_preview()
+        self.preview_index = None
+        self.preview_model.set_preview(None)
+        self.preview_summary.setText("")
+
+    def update_preview(self):
+        # 규칙/제외 확장자만 바뀌었으면 영향 받는 행만 다시 분류한다
+        preview = self.preview_index
+        if preview is None:
+            return
+        if self.preview_worker is not None:
+            # 스캔이 끝나면 다시 부른다
+            self.preview_dirty = True
+            return
+        self.preview_dirty = False
+
+        try:
+            settings = dict(self.settings, **self.collect_settings())
+            options = self.build_options(settings)
+        except Exception:
+            # 고치는 중인 규칙의 오류는 미리 보기/저장 때 알려 준다
+            return
+        if options == preview.options or not preview.can_update(options):
+            return
+
+        visible_changed, _ = preview.update(options)
+        self.preview_model.refresh(visible_changed)
+        self.show_preview_summary()
+
+    def show_preview_summary(self):
+        preview = self.preview_index
+        scanning = self.preview_worker is not None
+        if not preview.visible:
+            self.preview_summary.setText("스캔 중..." if scanning else "정리할 파일이 없습니다.")
+            return
+
+        total = sum(size for _, size in preview.totals.values())
+        line = f"* 총 {len(preview.visible):,}개 파일 · {format_bytes(total)}"
+        if scanning:
+            line += " (스캔 중...)"
+        categories = " · ".join(
+            f"{category} {count:,}개 {format_bytes(size)}"
+            for category, (count, size) in sorted(preview.totals.items())
+        )
+        self.preview_summary.setText(f"{line}\n{categories}")
+
+    def save(self):
+        try:
+            self.settings.update(self.collect_settings())
+        except Exception as e:
+            QMessageBox.warning(self, "오류", str(e))
+            return False
 
         save_settings(self.settings)
-        QMessageBox.information(self, "저장 완료", "설정이 저장되었습니다.")
+        message = "설정이 저장되었습니다."
+        if self.rule_warnings:
+            message += "\n\n규칙이 겹치는 부분이 있습니다:\n" + "\n".join(self.rule_warnings)
+        QMessageBox.information(self, "저장 완료", message)
         return True
 
         if not self.conflict_group.checkedButton():
@@ -351,33 +612,289 @@ class FileOrganizerUI(QWidget):
         QMessageBox.information(self, "저장 완료", "설정이 저장되었습니다.")
 
     def run(self):
+        if self.worker is not None:
+            return
+
         if not self.save():
                 return
 
-        rules_flat = {
-            ext: cat
-            for cat, exts in self.settings["rules"].items()
-            for ext in exts
-        }
+        if self.settings["roots"]:
+            self.run_roots()
+            return
 
-        organize_desktop(
-            target_dir=Path(self.settings["target_dir"]),
-            rules=rules_flat,
-            exclude_extensions=self.settings["exclude_extensions"],
-            mode=self.settings["mode"],
-            conflict_mode=self.settings["on_conflict"],
-            archive_folder=self.settings["archive_folder"],
-            exclude_hidden=self.settings["exclude_hidden"],
-        )
+        from organizer.core import iter_plan, execute_plan
+        from organizer.report import RunReport
+        from organizer.snapshot import load_snapshot
 
-        QMessageBox.information(self, "완료", "파일 정리가 완료되었습니다.")
+        options = self.build_options(self.settings)
+
+        # 미리보기한 계획이 현재 설정과 같으면 폴더를 다시 스캔하지 않는다
+        # 아니면 스캔하면서 바로 이동한다 (계획 전체를 메모리에 올리지 않음)
+        preview = self.preview_index
+        if preview is not None and preview.complete and preview.options == options:
+            planned = preview.to_plan()
+        else:
+            planned = None
+
+        self.clear_preview()
+
+        workers = self.settings["workers"]
+        verify = self.settings["verify_copy"]
+        durability = self.settings["journal_durability"]
+        retention = self.settings["undo_retention"]
+        compress = self.settings["undo_compress"]
+        incremental = self.settings["incremental_scan"]
+        full_rescan_hours = self.settings["full_rescan_hours"]
+        keep_replaced = self.settings["keep_replaced"]
+        staging_retention = self.settings["staging_retention"]
+        report = None
+        if self.settings["run_report"]:
+            report = RunReport(self.settings["run_profile"])
+        self.run_report = report
+
+        def task(progress, cancel):
+            # 스냅샷 읽기도 작업 스레드에서
+            snapshot = None
+            if incremental:
+                snapshot = load_snapshot(options, full_rescan_hours)
+            plan = planned
+            if plan is None:
+                plan = iter_plan(**options, snapshot=snapshot, report=report)
+            return execute_plan(
+                plan,
+                workers=workers,
+                progress=progress,
+                verify=verify,
+                cancel=cancel,
+                durability=durability,
+                retention=retention,
+                compress=compress,
+                snapshot=snapshot,
+                report=report,
+                root=str(options["target_dir"].absolute()),
+                keep_replaced=keep_replaced,
+                staging_retention=staging_retention,
+            )
+
+        self.start_task(task, "파일 정리가 완료되었습니다.", "파일 정리를 취소했습니다.")
+
+    def run_roots(self):
+        # 설정의 여러 대상 폴더를 드라이브별로 나눠 동시에 정리한다
+        from organizer.roots import organize_roots
 
-    def undo(self):
         try:
-            undo_last_operation()
-            QMessageBox.information(self, "완료", "마지막 정리 작업을 되돌렸습니다.")
-        except Exception as e:
+            root_options = get_root_options(self.settings)
+        except ValueError as e:
             QMessageBox.warning(self, "오류", str(e))
+            return
+
+        self.clear_preview()
+        settings = self.settings
+
+        def task(progress, cancel):
+            return organize_roots(
+                root_options,
+                per_device=settings["device_concurrency"],
+                max_parallel=settings["max_parallel_roots"],
+                progress=progress,
+                cancel=cancel,
+                retention=settings["undo_retention"],
+                workers=settings["workers"],
+                verify=settings["verify_copy"],
+                durability=settings["journal_durability"],
+                compress=settings["undo_compress"],
+                incremental=settings["incremental_scan"],
+                full_rescan_hours=settings["full_rescan_hours"],
+                report=settings["run_report"],
+                keep_replaced=settings["keep_replaced"],
+                staging_retention=settings["staging_retention"],
+            )
+
+        self.start_task(task, "파일 정리가 완료되었습니다.", "파일 정리를 취소했습니다.")
+
+    def undo(self):
+        if self.worker is not None:
+            return
+
+        from organizer.undo import undo_last_operation
+
+        workers = self.settings["workers"]
+
+        def task(progress, cancel):
+            return undo_last_operation(
+                progress=progress, cancel=cancel, workers=workers
+            )
+
+        self.start_task(task, "마지막 정리 작업을 되돌렸습니다.", "되돌리기를 취소했습니다.")
+
+    def show_history(self):
+        from organizer.history_ui import HistoryDialog
+        from organizer.undo import undo_entry
+
+        dialog = HistoryDialog(self)
+        if not dialog.exec() or dialog.selected is None:
+            return
+
+        # 기록 보기에서 고른 실행(또는 그 일부)을 되돌린다
+        path, selector = dialog.selected
+        workers = self.settings["workers"]
+
+        def task(progress, cancel):
+            return undo_entry(
+                path, selector,
+                progress=progress, cancel=cancel, workers=workers
+            )
+
+        self.start_task(task, "선택한 작업을 되돌렸습니다.", "되돌리기를 취소했습니다.")
+
+    def show_last_report(self):
+        from organizer.report import load_latest_report
+
+        data = load_latest_report()
+        if data is None:
+            QMessageBox.information(self, "실행 보고서", "저장된 실행 보고서가 없습니다.")
+            return
+        self.show_report(data)
+
+    def show_report(self, data: dict):
+        from organizer.report_ui import ReportDialog
+
+        ReportDialog(data, self).exec()
+
+    def check_incomplete_journals(self):
+        from organizer.undo import (
+            find_incomplete_journals, recover_journal, rollback_journal, read_undo_file
+        )
+
+        for path in find_incomplete_journals():
+            data = read_undo_file(path)
+            box = QMessageBox(self)
+            box.setWindowTitle("중단된 작업")
+            box.setText(
+                f"이전 정리 작업이 중간에 종료되었습니다.\n"
+                f"시작: {data['timestamp']} · 이동된 파일 {len(data['operations'])}개\n\n"
+                f"복구: 이동된 파일을 그대로 두고 되돌리기 기록에 남깁니다.\n"
+                f"롤백: 이동된 파일을 모두 원래 위치로 되돌립니다."
+            )
+            recover_btn = box.addButton("복구", QMessageBox.AcceptRole)
+            rollback_btn = box.addButton("롤백", QMessageBox.DestructiveRole)
+            box.addButton("나중에", QMessageBox.RejectRole)
+            box.exec()
+
+            try:
+                if box.clickedButton() == recover_btn:
+                    recover_journal(path)
+                elif box.clickedButton() == rollback_btn:
+                    rollback_journal(path)
+            except Exception as e:
+                QMessageBox.warning(self, "오류", str(e))
+
+    # ---------- background ----------
+
+    def start_task(self, task, done_message: str, cancel_message: str):
+        from organizer.worker import start_worker
+
+        self.done_message = done_message
+        self.cancel_message = cancel_message
+
+        for btn in self.busy_buttons:
+            btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.progress_label.setText("준비 중...")
+
+        self.worker_thread, self.worker = start_worker(
+            self, task,
+            on_progress=self.on_progress,
+            on_finished=self.on_task_finished,
+            on_failed=self.on_task_failed,
+        )
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.progress_label.setText("취소하는 중...")
+
+    def on_progress(self, p):
+        if p.total:
+            self.progress_bar.setRange(0, p.total)
+            self.progress_bar.setValue(p.done)
+
+        text = f"{p.done:,}개 · {format_bytes(p.bytes_done)} · {p.files_per_sec:,.0f}개/초"
+        if p.eta is not None:
+            text += f" · 남은 시간 {p.eta:,.0f}초"
+        self.progress_label.setText(text)
+
+    def on_task_finished(self, result):
+        from organizer.undo import UndoReport
+
+        cancelled = self.worker.cancelled
+        report = self.run_report
+        self.end_task()
+
+        message = self.cancel_message if cancelled else self.done_message
+        if isinstance(result, UndoReport):
+            message += (
+                f"\n\n복원 {len(result.restored):,}개 · "
+                f"건너뜀 {len(result.skipped):,}개 · "
+                f"충돌 {len(result.conflicted):,}개"
+            )
+            if result.conflicted:
+                message += "\n(충돌한 작업은 기록에 남아 있습니다)"
+
+        details = None
+        if isinstance(result, list):
+            # 여러 폴더 정리 — 폴더별 결과는 자세히 보기에
+            failed = sum(1 for r in result if r.error)
+            message += f"\n\n폴더 {len(result)}개 · {sum(r.moved for r in result):,}개 파일"
+            if failed:
+                message += f" · 오류 {failed}개"
+            details = "\n".join(
+                f"{r.root} · " + (f"오류: {r.error}" if r.error else f"{r.moved:,}개")
+                for r in result
+            )
+
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Information)
+        box.setWindowTitle("취소" if cancelled else "완료")
+        box.setText(message)
+        if details:
+            box.setDetailedText(details)
+        report_btn = None
+        if report is not None and report.path is not None:
+            report_btn = box.addButton("보고서 보기", QMessageBox.ActionRole)
+        box.addButton(QMessageBox.Ok)
+        box.exec()
+
+        if report_btn is not None and box.clickedButton() == report_btn:
+            self.show_report(report.to_dict())
+
+    def on_task_failed(self, message: str):
+        self.end_task()
+        QMessageBox.warning(self, "오류", message)
+
+    def end_task(self):
+        self.worker = None
+        self.run_report = None
+        self.worker_thread = None
+        for btn in self.busy_buttons:
+            btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        self.progress_bar.setVisible(False)
+
+    def closeEvent(self, event):
+        # 작업 중에 창을 닫으면 현재 파일까지만 처리하고 멈춘다
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+        if self.preview_worker is not None:
+            self.preview_worker.cancel()
+            self.preview_thread.quit()
+            self.preview_thread.wait()
+        super().closeEvent(event)
 
     def reset(self):
         self.settings = reset_settings()
@@ -385,9 +902,14 @@ class FileOrganizerUI(QWidget):
         self.load_rules()
         self.exclude_input.setText(" ".join(self.settings["exclude_extensions"]))
         self.archive_input.setText(self.settings["archive_folder"])
+        self.recursive_check.setChecked(self.settings["recursive"])
+        self.sniff_check.setChecked(self.settings["content_sniffing"])
+        self.select_duplicate_action(self.settings["duplicates"])
+        self.select_date_folders(self.settings["date_folders"])
+        self.target_label.setText(self.target_text())
         self.rename_radio.setChecked(False)
         self.overwrite_radio.setChecked(False)
         self.move_radio.setChecked(False)
         self.inplace_radio.setChecked(False)
-        self.preview.clear()
+        self.clear_preview()
         QMessageBox.information(self, "완료", "설정이 초기화되었습니다.")
@@ -1,78 +1,489 @@
+import errno
 import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from organizer.platform import get_config_dir
+from typing import NamedTuple
+from organizer.journal import UndoJournal, read_journal
+from organizer.platform import is_process_alive
+from organizer.transfer import cross_device_move
+from organizer.undo_store import (
+    list_entries, allocate_entry, get_latest_entry,
+    remove_entry, start_eviction
+)
+from organizer.undo_format import (
+    write_compact, read_compact, read_header, summarize, to_epoch,
+    UndoLogReader, MemoryLogReader
+)
 
-MAX_UNDO = 10
 
+def get_undo_files() -> list[Path]:
+    return list_entries()
 
-def get_undo_dir() -> Path:
-    undo_dir = get_config_dir() / "undo"
-    undo_dir.mkdir(parents=True, exist_ok=True)
-    return undo_dir
 
+def open_journal(
+    durability: str = "batch",
+    retention: dict | None = None,
+    root: str | None = None,
+) -> UndoJournal:
+    # root: 정리한 대상 폴더 (여러 폴더를 정리할 때 기록을 폴더별로 찾기 위해)
+    journal = UndoJournal(allocate_entry(), durability, root=root)
+    start_eviction(retention)
+    return journal
 
-def get_undo_files() -> list[Path]:
-    undo_dir = get_undo_dir()
-    return sorted(
-        undo_dir.glob("undo_*.json"),
-        key=lambda p: p.name
-    )
 
+def compact_entry(path: Path, compress: bool = True) -> Path:
+    # 끝난 저널을 압축 형식(.undo)으로 바꾼다
+    data = read_journal(path)
+    data["committed"] = True
+    compact = path.with_suffix(".undo")
+    write_compact(compact, data, compress)
+    path.unlink()
+    return compact
 
-def shift_undo_logs():
-    files = get_undo_files()
-    # 오래된 것부터 삭제
-    if len(files) >= MAX_UNDO:
-        files[-1].unlink()
 
-    # 번호 밀기 (9 → 10, 8 → 9 ...)
-    for f in reversed(files):
-        idx = int(f.stem.split("_")[1])
-        f.rename(f.with_name(f"undo_{idx + 1:03}.json"))
+def finish_journal(journal: UndoJournal, compress: bool = True) -> Path:
+    journal.commit()
+    return compact_entry(journal.path, compress)
 
 
 def write_undo_log(operations: list):
-    shift_undo_logs()
+    journal = open_journal()
+    for op in operations:
+        journal.append(
+            op["from"], op["to"], op.get("size"), op.get("category"),
+            op.get("action") or "move", op.get("original"),
+        )
+    finish_journal(journal)
+
+
+def read_undo_file(path: Path) -> dict:
+    if path.suffix == ".undo":
+        return read_compact(path)
+
+    if path.suffix == ".jsonl":
+        return read_journal(path)
 
-    data = {
-        "timestamp": datetime.now().isoformat(),
-        "operations": operations
-    }
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["committed"] = True
+    return data
 
-    path = get_undo_dir() / "undo_000.json"
-    path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+
+def read_undo_header(path: Path) -> dict:
+    # 기록 목록용 요약 (압축 기록은 앞부분만 읽는다)
+    if path.suffix == ".undo":
+        return read_header(path)
+    return summarize(read_undo_file(path))
+
+
+def open_undo_reader(path: Path):
+    # 작업 목록을 필요한 만큼만 읽는 리더 (len / get / page)
+    if path.suffix == ".undo":
+        return UndoLogReader(path)
+    data = read_undo_file(path)
+    return MemoryLogReader(data["operations"], summarize(data))
 
 
 def read_latest_undo() -> dict | None:
-    files = get_undo_files()
-    if not files:
+    path = get_latest_entry()
+    if path is None:
         return None
-    return json.loads(files[0].read_text(encoding="utf-8"))
+    return read_undo_file(path)
+
+
+def find_root_entry(root) -> Path | None:
+    # 이 대상 폴더를 정리한 가장 최근 기록 (여러 폴더를 함께 정리한 경우)
+    key = os.path.normcase(os.path.abspath(root))
+    for path in get_undo_files():
+        try:
+            header = read_undo_header(path)
+        except (OSError, ValueError):
+            continue
+        if header.get("root") and os.path.normcase(header["root"]) == key:
+            return path
+    return None
 
 
 def pop_latest_undo():
-    files = get_undo_files()
-    if files:
-        files[0].unlink()
+    path = get_latest_entry()
+    if path is not None:
+        remove_entry(path)
 
 
-def undo_last_operation():
-    log = read_latest_undo()
-    if not log:
-        raise RuntimeError("되돌릴 작업이 없습니다.")
+def rewrite_entry(path: Path, data: dict, compress: bool = True):
+    new_path = path.with_suffix(".undo")
+    data["committed"] = True
+    write_compact(new_path, data, compress)
+    if path != new_path:
+        path.unlink()
+
+
+def rewrite_latest_undo(data: dict, compress: bool = True):
+    path = get_latest_entry()
+    if path is not None:
+        rewrite_entry(path, data, compress)
+
+
+def find_incomplete_journals() -> list[Path]:
+    # commit 줄이 없고, 기록하던 프로세스도 이미 끝난 저널
+    incomplete = []
+    for path in get_undo_files():
+        if path.suffix != ".jsonl":
+            continue
+        data = read_journal(path)
+        if data["committed"]:
+            continue
+        pid = data["pid"]
+        if pid and pid != os.getpid() and is_process_alive(pid):
+            continue
+        incomplete.append(path)
+    return incomplete
+
+
+def recover_journal(path: Path):
+    # 끝까지 기록된 작업만 정상 실행 기록으로 남긴다
+    compact_entry(path)
+
+
+def rollback_journal(path: Path):
+    # 중단된 실행에서 옮긴 파일을 모두 원래 자리로 돌린다
+    return undo_entry(path)
+
+
+# 병렬 되돌리기 때 한 번에 스레드 풀에 올리는 작업 수
+RESTORE_BATCH_SIZE = 1000
+
+# 덮어쓰기 작업을 되돌렸지만 덮어쓴 파일은 돌려놓지 못한 이유
+STAGED_GONE = "덮어쓴 파일이 보관 기간이 지나 지워짐"
+STAGED_BLOCKED = "덮어쓴 파일 자리에 다른 파일이 생김"
+
+
+class UndoFilter(NamedTuple):
+    # None 인 조건은 적용하지 않는다
+    categories: set | None = None
+    since: float | None = None      # 이동 시각 (epoch)
+    until: float | None = None
+    path_prefix: str | None = None  # 원래 위치나 정리된 위치가 이 경로로 시작
+
+    def matches(self, op: dict, run_time: float) -> bool:
+        if self.categories is not None and op.get("category") not in self.categories:
+            return False
+
+        moved_at = op.get("time") or run_time
+        if self.since is not None and moved_at < self.since:
+            return False
+        if self.until is not None and moved_at > self.until:
+            return False
+
+        if self.path_prefix:
+            prefix = os.path.normcase(self.path_prefix)
+            if not (
+                os.path.normcase(op["from"]).startswith(prefix)
+                or os.path.normcase(op["to"]).startswith(prefix)
+            ):
+                return False
+
+        return True
+
+
+class UndoReport(NamedTuple):
+    restored: list      # 원래 위치로 돌아간 작업
+    skipped: list       # (작업, 이유) — 정리된 파일이 없어서 건너뜀
+    conflicted: list    # (작업, 이유) — 원래 위치에 다른 파일이 있음
+    remaining: list     # 취소로 손대지 않은 작업
+
+
+class RestoreStep(NamedTuple):
+    op: dict
+    src: str            # 지금 파일이 있는 곳
+    dst: str            # 돌려놓을 곳
+
+
+def plan_restore(operations: list) -> tuple[list[list[RestoreStep]], list, list, list]:
+    # 되돌릴 작업을 의존 순서에 따라 단계(level)로 나눈다
+    # 한 작업의 원래 위치를 다른 작업의 정리된 파일이 차지하고 있으면
+    # 그 파일을 먼저 치워야 하므로 다음 단계로 미룬다
+    # 반환: (단계 목록, 건너뛸 작업, 순환을 끊으려고 임시 이름으로 옮길 단계,
+    #        (작업, 덮어쓴 작업) — 덮어쓴 작업을 되돌려야 파일이 제자리로 돌아오는 작업)
+    skipped = []
+    deferred = []
+
+    # 중복이라 옮기지 않은 파일은 되돌릴 것이 없다
+    moved = []
+    for op in operations:
+        if op.get("action") == "skip":
+            skipped.append((op, "중복이라 옮기지 않았음"))
+        else:
+            moved.append(op)
+    operations = moved
 
-    for op in reversed(log["operations"]):
-        src = Path(op["to"])
-        dst = Path(op["from"])
+    # 같은 위치로 여러 번 옮겨졌으면 마지막 작업의 파일만 남아 있다
+    # 뒤 작업이 앞 파일을 보관 폴더에 옮겨 두었으면 뒤 작업을 되돌린 다음에 되돌린다
+    following = {}
+    next_op = {}
+    for i in range(len(operations) - 1, -1, -1):
+        key = os.path.normcase(operations[i]["to"])
+        if key in following:
+            next_op[i] = following[key]
+        following[key] = i
 
-        if not src.exists():
+    steps = {}
+    for i, op in enumerate(operations):
+        if i in next_op:
+            later = operations[next_op[i]]
+            if later.get("action") == "overwrite" and later.get("original"):
+                deferred.append((op, later))
+            else:
+                skipped.append((op, "이후 작업이 같은 위치를 덮어씀"))
             continue
+        steps[i] = RestoreStep(op, op["to"], op["from"])
 
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        src.rename(dst)
+    by_src = {os.path.normcase(step.src): i for i, step in steps.items()}
+    blocker = {}
+    for i, step in steps.items():
+        j = by_src.get(os.path.normcase(step.dst))
+        if j is not None and j != i:
+            blocker[i] = j
 
-    pop_latest_undo()
+    # 순환(A↔B 맞바꿈 등)은 한 파일을 임시 이름으로 빼서 끊는다
+    pre_moves = []
+    state = {}      # 0 = 방문 중, 1 = 완료
+    for start in steps:
+        path = []
+        i = start
+        while i is not None and i not in state:
+            state[i] = 0
+            path.append(i)
+            i = blocker.get(i)
+
+        if i is not None and state[i] == 0:
+            # i 에서 시작하는 순환 — i 의 파일을 임시 이름으로 옮긴다
+            step = steps[i]
+            tmp = f"{step.src}.undo-{os.getpid()}.tmp"
+            pre_moves.append(RestoreStep(step.op, step.src, tmp))
+            steps[i] = RestoreStep(step.op, tmp, step.dst)
+            for k, b in list(blocker.items()):
+                if b == i:
+                    del blocker[k]
+
+        for k in path:
+            state[k] = 1
+
+    level = {}
+    for i in steps:
+        chain = []
+        k = i
+        while k not in level and k in blocker:
+            chain.append(k)
+            k = blocker[k]
+        base = level.get(k, 0)
+        level.setdefault(k, base)
+        for depth, c in enumerate(reversed(chain), start=1):
+            level[c] = base + depth
+
+    levels = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for i in sorted(steps, reverse=True):
+        levels[level[i]].append(steps[i])
+
+    return levels, skipped, pre_moves, deferred
+
+
+def copy_out(src: str, dst: str):
+    tmp = f"{dst}.undo-{os.getpid()}.tmp"
+    shutil.copy2(src, tmp)
+    if os.path.lexists(dst):
+        os.unlink(tmp)
+        raise FileExistsError(dst)
+    os.rename(tmp, dst)
+    os.unlink(src)
+
+
+def restore_step(step: RestoreStep) -> tuple[str, str | None, int]:
+    # 반환: (restored | skipped | conflicted, 이유, 바이트)
+    try:
+        st = os.stat(step.src)
+    except FileNotFoundError:
+        return "skipped", "정리된 파일이 없음", 0
+
+    if os.path.lexists(step.dst):
+        return "conflicted", "원래 위치에 다른 파일이 있음", 0
+
+    try:
+        os.makedirs(os.path.dirname(step.dst), exist_ok=True)
+        if step.op.get("action") == "hardlink":
+            # 원본과 묶인 링크를 그대로 돌려놓으면 한쪽을 고칠 때 다른 쪽도 바뀐다
+            # 복사본을 만들어 링크를 끊는다
+            copy_out(step.src, step.dst)
+        else:
+            try:
+                os.rename(step.src, step.dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # 다른 드라이브의 정리 폴더로 옮겼던 파일
+                cross_device_move(step.src, Path(step.dst), st.st_size, st.st_mtime)
+    except FileExistsError:
+        return "conflicted", "원래 위치에 다른 파일이 있음", 0
+    except FileNotFoundError:
+        return "skipped", "정리된 파일이 없음", 0
+
+    if step.op.get("action") == "overwrite" and step.op.get("original"):
+        # 덮어썼던 파일을 보관 폴더에서 정리된 위치로 돌려놓는다 (같은 드라이브)
+        try:
+            if os.path.lexists(step.src):
+                return "restored", STAGED_BLOCKED, st.st_size
+            os.rename(step.op["original"], step.src)
+        except FileNotFoundError:
+            return "restored", STAGED_GONE, st.st_size
+    return "restored", None, st.st_size
+
+
+def reverse_operations(
+    operations: list,
+    progress=None,
+    cancel=None,
+    workers: int = 1,
+) -> UndoReport:
+    report = UndoReport([], [], [], [])
+    levels, skipped, pre_moves, deferred = plan_restore(operations)
+    report.skipped.extend(skipped)
+
+    total = len(operations)
+    done = len(skipped)
+    restored_bytes = 0
+    notes = {}          # id(작업) -> 되돌렸지만 덮어쓴 파일을 돌려놓지 못한 이유
+
+    for step in pre_moves:
+        os.rename(step.src, step.dst)
+
+    def cancelled() -> bool:
+        return cancel is not None and cancel.is_set()
+
+    def collect(step: RestoreStep, result: tuple):
+        nonlocal done, restored_bytes
+        status, reason, size = result
+        if status == "restored":
+            report.restored.append(step.op)
+            restored_bytes += size
+            if reason is not None:
+                notes[id(step.op)] = reason
+        elif status == "skipped":
+            report.skipped.append((step.op, reason))
+        elif status == "conflicted":
+            report.conflicted.append((step.op, reason))
+        else:
+            report.remaining.append(step.op)
+            return
+        done += 1
+        if progress:
+            progress(done, restored_bytes, total)
+
+    def run_step(step: RestoreStep) -> tuple:
+        if cancelled():
+            return "cancelled", None, 0
+        return restore_step(step)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        for n, level in enumerate(levels):
+            if cancelled():
+                for rest in levels[n:]:
+                    report.remaining.extend(step.op for step in rest)
+                break
+
+            if workers <= 1:
+                for step in level:
+                    collect(step, run_step(step))
+                continue
+
+            # 같은 단계의 작업은 서로 독립이라 병렬로 처리한다
+            for start in range(0, len(level), RESTORE_BATCH_SIZE):
+                chunk = level[start:start + RESTORE_BATCH_SIZE]
+                futures = {pool.submit(run_step, step): step for step in chunk}
+                for future in as_completed(futures):
+                    collect(futures[future], future.result())
+
+    # 순환을 끊느라 임시 이름에 남은 파일은 제자리로 돌려 둔다
+    for step in pre_moves:
+        if os.path.lexists(step.dst) and not os.path.lexists(step.src):
+            os.rename(step.dst, step.src)
+
+    if deferred:
+        # 덮어쓴 작업이 되돌려져 보관했던 파일이 제자리로 왔으면 이어서 되돌린다
+        restored = {id(op) for op in report.restored}
+        remaining = {id(op) for op in report.remaining}
+        ready = []
+        for op, later in deferred:
+            note = notes.get(id(later))
+            if id(later) in remaining:
+                report.remaining.append(op)
+            elif id(later) not in restored:
+                report.conflicted.append((op, "같은 위치를 덮어쓴 작업을 되돌리지 못함"))
+            elif note == STAGED_GONE:
+                report.skipped.append((op, note))
+            elif note is not None:
+                report.conflicted.append((op, note))
+            else:
+                ready.append(op)
+
+        if ready and not cancelled():
+            offset, offset_bytes = done, restored_bytes
+
+            def chained_progress(d: int, b: int, t: int | None):
+                progress(offset + d, offset_bytes + b, total)
+
+            more = reverse_operations(
+                ready, chained_progress if progress else None, cancel, workers
+            )
+            for mine, theirs in zip(report, more):
+                mine.extend(theirs)
+        else:
+            report.remaining.extend(ready)
+
+    return report
+
+
+def undo_entry(
+    path: Path,
+    selector: UndoFilter | None = None,
+    progress=None,
+    cancel=None,
+    workers: int = 1,
+) -> UndoReport:
+    # 기록 하나(또는 그 일부)를 되돌린다
+    # 되돌리지 못한 작업(충돌, 취소, 선택 밖)은 기록에 남겨 둔다
+    log = read_undo_file(path)
+    operations = log["operations"]
+    run_time = to_epoch(log.get("timestamp"))
+
+    if selector is None:
+        selected = operations
+        kept = []
+    else:
+        selected = []
+        kept = []
+        for op in operations:
+            (selected if selector.matches(op, run_time) else kept).append(op)
+
+    report = reverse_operations(selected, progress, cancel, workers)
+
+    restored = {id(op) for op in report.restored}
+    restored.update(id(op) for op, _ in report.skipped)
+    left = [op for op in operations if id(op) not in restored]
+
+    if left:
+        log["operations"] = left
+        rewrite_entry(path, log)
+    else:
+        remove_entry(path)
+
+    return report
+
+
+def undo_last_operation(progress=None, cancel=None, workers: int = 1) -> UndoReport:
+    # progress(처리한 파일 수, 되돌린 바이트, 전체 파일 수)
+    # cancel 이 설정되면 남은 작업만 로그에 남기고 멈춘다
+    path = get_latest_entry()
+    if path is None:
+        raise RuntimeError("되돌릴 작업이 없습니다.")
+    return undo_entry(path, progress=progress, cancel=cancel, workers=workers)
@@ -0,0 +1,309 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+# 압축 undo 기록 (.undo)
+#
+#   [HEADER][summary JSON][폴더 사전][작업 블록 ...][블록 색인]
+#
+# - HEADER 는 고정 길이라 기록 목록은 앞부분만 읽어서 만든다
+# - 경로는 폴더 사전 번호 + 파일 이름으로 저장한다
+#   폴더 사전은 (길이, UTF-8 바이트) 의 나열 — 폴더 이름에 줄바꿈이 있어도 된다
+# - 작업은 BLOCK_OPS 개씩 블록으로 묶어(선택적으로 zlib 압축) 필요한 블록만 푼다
+MAGIC = b"FOUNDO1\0"
+VERSION = 1
+FLAG_COMPRESSED = 1
+BLOCK_OPS = 1024
+
+HEADER = struct.Struct("<8sHHdQQIQQQQ")
+# magic, version, flags, timestamp, count, total_bytes, summary_len,
+# dirs_offset, dirs_len, index_offset, block_count
+BLOCK_ENTRY = struct.Struct("<QII")     # offset, length, 작업 수
+# from_dir, to_dir, category, from_len, to_len, size, 이동 시각,
+# action, original_dir, original_len (이름 바이트는 from, to, original 순서)
+OP_RECORD = struct.Struct("<IIIHHQdBIH")
+DIR_LENGTH = struct.Struct("<I")
+
+# overwrite: 원래 있던 파일을 보관 폴더로 옮기고 덮어씀 (original = 보관한 경로)
+ACTIONS = ("move", "skip", "hardlink", "duplicate", "overwrite")
+ACTION_CODES = {name: i for i, name in enumerate(ACTIONS)}
+NO_DIR = 0xFFFFFFFF     # original 이 없는 작업
+
+
+def to_epoch(timestamp: str | None) -> float:
+    if not timestamp:
+        return 0.0
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def summarize(data: dict) -> dict:
+    categories = {}
+    total_bytes = 0
+    for op in data["operations"]:
+        category = op.get("category") or ""
+        categories[category] = categories.get(category, 0) + 1
+        total_bytes += op.get("size") or 0
+
+    return {
+        "timestamp": data.get("timestamp"),
+        "count": len(data["operations"]),
+        "bytes": total_bytes,
+        "categories": categories,
+        "committed": data.get("committed", True),
+        "root": data.get("root"),
+    }
+
+
+def encode_block(records: list[bytes], compress: bool) -> bytes:
+    raw = b"".join(records)
+    return zlib.compress(raw, 6) if compress else raw
+
+
+def encode_dirs(dirs) -> bytes:
+    parts = []
+    for name in dirs:
+        raw = name.encode("utf-8")
+        parts.append(DIR_LENGTH.pack(len(raw)))
+        parts.append(raw)
+    return b"".join(parts)
+
+
+def decode_dirs(blob: bytes) -> list[str]:
+    dirs = []
+    pos = 0
+    while pos < len(blob):
+        (length,) = DIR_LENGTH.unpack_from(blob, pos)
+        pos += DIR_LENGTH.size
+        dirs.append(blob[pos:pos + length].decode("utf-8"))
+        pos += length
+    return dirs
+
+
+def write_compact(path: Path, data: dict, compress: bool = True):
+    summary = summarize(data)
+    category_names = list(summary["categories"])
+    category_index = {name: i for i, name in enumerate(category_names)}
+    summary["category_names"] = category_names
+
+    dirs = {}
+    blocks = []
+    records = []
+
+    for op in data["operations"]:
+        src_dir, src_name = os.path.split(op["from"])
+        dst_dir, dst_name = os.path.split(op["to"])
+        src_name = src_name.encode("utf-8")
+        dst_name = dst_name.encode("utf-8")
+
+        original = op.get("original")
+        if original:
+            orig_dir, orig_name = os.path.split(original)
+            orig_dir = dirs.setdefault(orig_dir, len(dirs))
+            orig_name = orig_name.encode("utf-8")
+        else:
+            orig_dir = NO_DIR
+            orig_name = b""
+
+        records.append(OP_RECORD.pack(
+            dirs.setdefault(src_dir, len(dirs)),
+            dirs.setdefault(dst_dir, len(dirs)),
+            category_index[op.get("category") or ""],
+            len(src_name),
+            len(dst_name),
+            op.get("size") or 0,
+            op.get("time") or 0.0,
+            ACTION_CODES[op.get("action") or "move"],
+            orig_dir,
+            len(orig_name),
+        ) + src_name + dst_name + orig_name)
+
+        if len(records) == BLOCK_OPS:
+            blocks.append((encode_block(records, compress), len(records)))
+            records = []
+
+    if records:
+        blocks.append((encode_block(records, compress), len(records)))
+
+    summary_blob = json.dumps(summary, ensure_ascii=False).encode("utf-8")
+    dirs_blob = encode_dirs(dirs)
+    if compress:
+        dirs_blob = zlib.compress(dirs_blob, 6)
+
+    dirs_offset = HEADER.size + len(summary_blob)
+    offset = dirs_offset + len(dirs_blob)
+    index = []
+    for blob, count in blocks:
+        index.append(BLOCK_ENTRY.pack(offset, len(blob), count))
+        offset += len(blob)
+
+    header = HEADER.pack(
+        MAGIC, VERSION, FLAG_COMPRESSED if compress else 0,
+        to_epoch(summary["timestamp"]),
+        summary["count"], summary["bytes"], len(summary_blob),
+        dirs_offset, len(dirs_blob), offset, len(blocks),
+    )
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(summary_blob)
+        f.write(dirs_blob)
+        for blob, _ in blocks:
+            f.write(blob)
+        f.write(b"".join(index))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_header(path: Path) -> dict:
+    # 고정 헤더 + 요약만 읽는다 (작업 목록은 건드리지 않음)
+    with open(path, "rb") as f:
+        fields = HEADER.unpack(f.read(HEADER.size))
+        if fields[0] != MAGIC or fields[1] != VERSION:
+            raise ValueError(f"undo 기록 형식이 아닙니다: {path}")
+        return json.loads(f.read(fields[6]).decode("utf-8"))
+
+
+# mmap 으로 열어 두고 필요한 블록만 풀어서 읽는 리더
+class UndoLogReader:
+    def __init__(self, path: Path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic, version, flags, _timestamp, self.count, _bytes, summary_len,
+            dirs_offset, dirs_len, index_offset, block_count,
+        ) = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"undo 기록 형식이 아닙니다: {path}")
+
+        self.compressed = bool(flags & FLAG_COMPRESSED)
+        self.summary = json.loads(
+            self.map[HEADER.size:HEADER.size + summary_len].decode("utf-8")
+        )
+        self.categories = self.summary["category_names"]
+
+        dirs_blob = self.map[dirs_offset:dirs_offset + dirs_len]
+        if self.compressed:
+            dirs_blob = zlib.decompress(dirs_blob)
+        self.dirs = decode_dirs(dirs_blob)
+
+        self.blocks = [
+            BLOCK_ENTRY.unpack_from(self.map, index_offset + i * BLOCK_ENTRY.size)
+            for i in range(block_count)
+        ]
+        self.cached_block = (None, None)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if not self.map.closed:
+            self.map.close()
+        self.file.close()
+
+    def decode_block(self, number: int) -> list[dict]:
+        offset, length, _ = self.blocks[number]
+        raw = self.map[offset:offset + length]
+        if self.compressed:
+            raw = zlib.decompress(raw)
+
+        ops = []
+        pos = 0
+        while pos < len(raw):
+            (
+                src_dir, dst_dir, category, src_len, dst_len, size, moved_at,
+                action, orig_dir, orig_len,
+            ) = OP_RECORD.unpack_from(raw, pos)
+            pos += OP_RECORD.size
+            src_name = raw[pos:pos + src_len].decode("utf-8")
+            pos += src_len
+            dst_name = raw[pos:pos + dst_len].decode("utf-8")
+            pos += dst_len
+            op = {
+                "from": os.path.join(self.dirs[src_dir], src_name),
+                "to": os.path.join(self.dirs[dst_dir], dst_name),
+                "category": self.categories[category],
+                "size": size,
+                "time": moved_at,
+            }
+            if action:
+                op["action"] = ACTIONS[action]
+            if orig_dir != NO_DIR:
+                orig_name = raw[pos:pos + orig_len].decode("utf-8")
+                op["original"] = os.path.join(self.dirs[orig_dir], orig_name)
+            pos += orig_len
+            ops.append(op)
+        return ops
+
+    def get_block(self, number: int) -> list[dict]:
+        cached_number, ops = self.cached_block
+        if cached_number != number:
+            ops = self.decode_block(number)
+            self.cached_block = (number, ops)
+        return ops
+
+    def get(self, i: int) -> dict:
+        return self.get_block(i // BLOCK_OPS)[i % BLOCK_OPS]
+
+    def page(self, start: int, count: int) -> list[dict]:
+        return [self.get(i) for i in range(start, min(start + count, self.count))]
+
+    def __iter__(self):
+        for number in range(len(self.blocks)):
+            yield from self.decode_block(number)
+
+
+def read_compact(path: Path) -> dict:
+    with UndoLogReader(path) as reader:
+        return {
+            "timestamp": reader.summary["timestamp"],
+            "pid": None,
+            "root": reader.summary.get("root"),
+            "operations": list(reader),
+            "committed": True,
+        }
+
+
+# 압축되지 않은 기록(저널, 예전 JSON)을 같은 방식으로 읽기 위한 리더
+class MemoryLogReader:
+    def __init__(self, operations: list, summary: dict):
+        self.operations = operations
+        self.summary = summary
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def get(self, i: int) -> dict:
+        return self.operations[i]
+
+    def page(self, start: int, count: int) -> list[dict]:
+        return self.operations[start:start + count]
+
+    def __iter__(self):
+        return iter(self.operations)
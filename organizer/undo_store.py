@@ -0,0 +1,236 @@
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from organizer.platform import get_config_dir
+
+MAX_UNDO = 10
+
+# 실행마다 번호가 하나씩 늘어나는 기록 파일 (이름을 바꾸지 않는다)
+#   undo/undo_00000042.jsonl  ← 실행 중 저널
+#   undo/undo_00000042.undo   ← 완료 후 압축 기록
+#   undo/manifest.json  ← {"next_seq", "latest", "oldest"} 만 담은 작은 색인
+ENTRY_NAME = re.compile(r"undo_(\d{8})\.(undo|jsonl|json)$")
+ENTRY_SUFFIXES = (".undo", ".jsonl", ".json")    # 같은 번호가 둘이면 앞쪽 우선
+# 예전 방식 (undo_000 이 최신, 실행마다 번호를 밀던 파일)
+LEGACY_NAME = re.compile(r"undo_(\d{3})\.(jsonl|json)$")
+
+DEFAULT_RETENTION = {
+    "max_count": MAX_UNDO,
+    "max_age_days": None,
+    "max_bytes": None,
+}
+
+manifest_lock = threading.Lock()
+
+
+def get_undo_dir() -> Path:
+    undo_dir = get_config_dir() / "undo"
+    undo_dir.mkdir(parents=True, exist_ok=True)
+    return undo_dir
+
+
+def get_entry_path(undo_dir: Path, seq: int, suffix: str = ".jsonl") -> Path:
+    return undo_dir / f"undo_{seq:08}{suffix}"
+
+
+def find_entry(undo_dir: Path, seq: int) -> Path | None:
+    for suffix in ENTRY_SUFFIXES:
+        path = get_entry_path(undo_dir, seq, suffix)
+        if path.exists():
+            return path
+    return None
+
+
+def get_entry_seq(path: Path) -> int:
+    return int(ENTRY_NAME.match(path.name).group(1))
+
+
+def scan_entries(undo_dir: Path) -> list[tuple[int, Path]]:
+    # 전체 목록이 필요한 곳(기록 보기, 정리)에서만 사용 — 최신 순
+    found = {}
+    with os.scandir(undo_dir) as it:
+        for entry in it:
+            m = ENTRY_NAME.match(entry.name)
+            if not m:
+                continue
+            seq = int(m.group(1))
+            path = Path(entry.path)
+            # 압축 도중 종료되어 같은 번호의 저널이 남아 있으면 압축본을 쓴다
+            if seq in found:
+                order = ENTRY_SUFFIXES.index
+                if order(found[seq].suffix) <= order(path.suffix):
+                    continue
+            found[seq] = path
+    return sorted(found.items(), reverse=True)
+
+
+def migrate_legacy(undo_dir: Path):
+    legacy = []
+    for path in undo_dir.iterdir():
+        m = LEGACY_NAME.match(path.name)
+        if m:
+            legacy.append((int(m.group(1)), path))
+
+    # 번호가 클수록 오래된 기록이므로 큰 번호부터 1, 2, 3 ... 을 준다
+    legacy.sort(reverse=True)
+    for seq, (_, path) in enumerate(legacy, start=1):
+        path.rename(get_entry_path(undo_dir, seq, path.suffix))
+
+
+def build_manifest(undo_dir: Path) -> dict:
+    migrate_legacy(undo_dir)
+    entries = scan_entries(undo_dir)
+    if not entries:
+        return {"next_seq": 1, "latest": None, "oldest": None}
+    return {
+        "next_seq": entries[0][0] + 1,
+        "latest": entries[0][0],
+        "oldest": entries[-1][0],
+    }
+
+
+def get_manifest_path(undo_dir: Path) -> Path:
+    return undo_dir / "manifest.json"
+
+
+def load_manifest(undo_dir: Path) -> dict:
+    path = get_manifest_path(undo_dir)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = build_manifest(undo_dir)
+        save_manifest(undo_dir, manifest)
+        return manifest
+
+
+def save_manifest(undo_dir: Path, manifest: dict):
+    path = get_manifest_path(undo_dir)
+    tmp = path.with_name(f"manifest.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def allocate_entry() -> Path:
+    # 새 기록 파일을 O_EXCL 로 만든다
+    # 다른 실행과 번호가 겹치면 다음 번호로 넘어가므로 덮어쓰지 않는다
+    undo_dir = get_undo_dir()
+    with manifest_lock:
+        manifest = load_manifest(undo_dir)
+        seq = manifest["next_seq"]
+        while True:
+            path = get_entry_path(undo_dir, seq)
+            if find_entry(undo_dir, seq):
+                seq += 1
+                continue
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                seq += 1
+                continue
+            os.close(fd)
+            break
+
+        manifest["next_seq"] = seq + 1
+        manifest["latest"] = seq
+        if manifest["oldest"] is None:
+            manifest["oldest"] = seq
+        save_manifest(undo_dir, manifest)
+    return path
+
+
+def list_entries() -> list[Path]:
+    # 최신 순 전체 목록 (기록 보기 / 복구 확인용)
+    undo_dir = get_undo_dir()
+    with manifest_lock:
+        load_manifest(undo_dir)
+    return [path for _, path in scan_entries(undo_dir)]
+
+
+def get_latest_entry() -> Path | None:
+    undo_dir = get_undo_dir()
+    with manifest_lock:
+        manifest = load_manifest(undo_dir)
+        seq = manifest["latest"]
+        if seq is None:
+            return None
+
+        # 겹쳐 실행된 다른 프로세스가 더 새 기록을 만들었을 수 있다
+        while find_entry(undo_dir, seq + 1):
+            seq += 1
+
+        # 최신 기록이 지워졌으면 오래된 쪽으로 내려가며 찾는다
+        oldest = manifest["oldest"] or 1
+        while seq >= oldest:
+            path = find_entry(undo_dir, seq)
+            if path:
+                break
+            seq -= 1
+        else:
+            path = None
+            seq = None
+
+        if seq != manifest["latest"]:
+            manifest["latest"] = seq
+            if seq is None:
+                manifest["oldest"] = None
+            save_manifest(undo_dir, manifest)
+    return path
+
+
+def remove_entry(path: Path):
+    # 같은 번호의 저널/압축본을 함께 지운다
+    # 다음 조회 때 get_latest_entry 가 한 단계 아래로 내려간다
+    seq = get_entry_seq(path)
+    for suffix in ENTRY_SUFFIXES:
+        get_entry_path(path.parent, seq, suffix).unlink(missing_ok=True)
+
+
+def evict_entries(retention: dict):
+    # 최신 기록은 항상 남긴다
+    undo_dir = get_undo_dir()
+    max_count = retention.get("max_count")
+    max_age_days = retention.get("max_age_days")
+    max_bytes = retention.get("max_bytes")
+
+    entries = scan_entries(undo_dir)
+    now = time.time()
+    total = 0
+    kept = []
+
+    for i, (seq, path) in enumerate(entries):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+
+        total += st.st_size
+        # 기록 중인 저널은 지우지 않는다 (함께 정리 중인 다른 폴더, 다른 프로세스)
+        expired = i > 0 and path.suffix != ".jsonl" and (
+            (max_count is not None and i >= max_count)
+            or (max_age_days is not None and now - st.st_mtime > max_age_days * 86400)
+            or (max_bytes is not None and total > max_bytes)
+        )
+        if expired:
+            remove_entry(path)
+        else:
+            kept.append(seq)
+
+    if kept:
+        with manifest_lock:
+            manifest = load_manifest(undo_dir)
+            manifest["oldest"] = min(kept)
+            save_manifest(undo_dir, manifest)
+
+
+def start_eviction(retention: dict | None = None) -> threading.Thread:
+    # 실행을 막지 않도록 오래된 기록 정리는 백그라운드에서
+    thread = threading.Thread(
+        target=evict_entries,
+        args=(retention or DEFAULT_RETENTION,),
+        daemon=True,
+    )
+    thread.start()
+    return thread
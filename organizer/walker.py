@@ -0,0 +1,110 @@
+import os
+from pathlib import Path
+from typing import Iterator
+from organizer.excludes import compile_excludes
+from organizer.platform import is_hidden_entry
+from organizer.scanner import ScanEntry, make_entry, stat_entry
+from organizer.staging import STAGING_NAME
+
+
+def normalize_dir(path) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def walk_files(
+    root: Path,
+    max_depth: int | None = None,
+    follow_symlinks: bool = False,
+    exclude_dirs=(),
+    exclude_hidden: bool = False,
+    exclude_extensions=(),
+    exclude_patterns=None,
+    snapshot=None,
+) -> Iterator[ScanEntry]:
+    # 파일을 모으지 않고 하나씩 내보내는 제너레이터
+    # 메모리는 아직 방문하지 않은 폴더 경로만큼만 사용한다
+    # snapshot(ScanSnapshot) 을 주면 수정 시각이 그대로인 폴더는 목록을 읽지 않는다
+    # (심볼릭 링크를 따라갈 때는 링크 너머의 변화를 알 수 없어 쓰지 않는다)
+    # exclude_patterns(.gitignore 형식)에 걸린 폴더는 stat 하기 전에 잘라내 안을 읽지 않는다
+    if follow_symlinks:
+        snapshot = None
+    exclude_dirs = {normalize_dir(d) for d in exclude_dirs}
+    exclude_extensions = set(exclude_extensions)
+    excludes = compile_excludes(exclude_patterns)
+    visited = set()     # 심볼릭 링크 순환 방지용 (dev, inode)
+
+    # (경로, 깊이, 대상 폴더 기준 상대 경로 "a/b/")
+    stack = [(os.fspath(root), 0, "")]
+    while stack:
+        path, depth, rel_dir = stack.pop()
+
+        if snapshot is not None:
+            mtime, cached = snapshot.lookup_dir(path)
+            if cached is not None:
+                files, subdirs = cached
+                for name in files:
+                    record = stat_entry(
+                        os.path.join(path, name), exclude_hidden, exclude_extensions
+                    )
+                    if record is None:
+                        # 폴더가 바뀌지 않았는데 파일이 없다 — 수정 시각을 믿을 수 없다
+                        snapshot.mark_inconsistent()
+                        continue
+                    yield record
+                for sub in reversed(subdirs):
+                    stack.append((sub, depth + 1, rel_dir + os.path.basename(sub) + "/"))
+                continue
+
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+
+        files = []
+        subdirs = []
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                except OSError:
+                    continue
+
+                if excludes is not None and excludes.match(entry.name, rel_dir, is_dir):
+                    continue
+
+                if not is_dir:
+                    record = make_entry(entry, exclude_hidden, exclude_extensions, follow_symlinks)
+                    if record is not None:
+                        files.append(entry.name)
+                        yield record
+                    continue
+
+                if max_depth is not None and depth >= max_depth:
+                    continue
+
+                if normalize_dir(entry.path) in exclude_dirs or entry.name == STAGING_NAME:
+                    # 덮어쓴 파일 보관 폴더는 숨김 파일을 포함해도 훑지 않는다
+                    continue
+
+                try:
+                    st = entry.stat(follow_symlinks=follow_symlinks)
+                except OSError:
+                    continue
+
+                if exclude_hidden and is_hidden_entry(entry.name, st):
+                    continue
+
+                if follow_symlinks:
+                    key = (st.st_dev, st.st_ino)
+                    if key in visited:
+                        continue
+                    visited.add(key)
+
+                subdirs.append(entry.path)
+
+        if snapshot is not None:
+            snapshot.record_dir(path, mtime, files, subdirs)
+
+        # scandir 가 돌려준 순서대로 방문하도록 역순으로 쌓는다
+        for sub in reversed(subdirs):
+            stack.append((sub, depth + 1, rel_dir + os.path.basename(sub) + "/"))
@@ -0,0 +1,252 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import stat
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from organizer.core import iter_plan, execute_plan, iter_batches
+from organizer.excludes import compile_excludes
+from organizer.scanner import stat_entry
+
+# 감시 모드
+#   새로 생긴 파일 이름만 모아 두었다가, 크기/수정 시각이 SETTLE_SECONDS 동안
+#   그대로이면 (다운로드가 끝났으면) 작은 배치로 정리한다
+#   배치마다 execute_plan 을 따로 불러 되돌리기 기록도 배치마다 하나씩 생긴다
+DEBOUNCE_SECONDS = 1.0      # 이벤트가 이만큼 잠잠해지면 처리 시작
+SETTLE_SECONDS = 2.0        # 파일 크기가 이만큼 변하지 않아야 옮긴다
+WATCH_BATCH_SIZE = 100
+POLL_INTERVAL = 2.0         # inotify 를 쓸 수 없을 때 폴더를 확인하는 간격
+
+# 다운로드 중인 브라우저 임시 파일 (완료되면 원래 이름으로 바뀐다)
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".partial", ".download", ".tmp")
+
+# inotify 이벤트 (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ONLYDIR = 0x01000000
+IN_EVENT = struct.Struct("iIII")    # wd, mask, cookie, len
+
+
+class InotifyWatcher:
+    # 폴더 하나의 변경된 이름을 커널에서 받아온다
+    # 이벤트가 없을 때는 select 에서 잠들어 있으므로 CPU 를 쓰지 않는다
+    def __init__(self, target_dir: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.target_dir = target_dir
+        self.fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        # 쓰는 도중의 변화(IN_MODIFY)는 받지 않는다 — 크기 확인은 따로 한다
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF | IN_ONLYDIR
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(target_dir), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"폴더를 감시할 수 없습니다: {target_dir}")
+
+    def wait(self, timeout: float | None) -> set[str] | None:
+        # 반환: 바뀐 이름 집합, None 이면 놓친 이벤트가 있어 전체를 다시 봐야 함
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        names = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            pos = 0
+            while pos < len(data):
+                _, mask, _, length = IN_EVENT.unpack_from(data, pos)
+                pos += IN_EVENT.size
+                name = data[pos:pos + length].rstrip(b"\0")
+                pos += length
+
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                if mask & IN_DELETE_SELF:
+                    raise RuntimeError(f"감시 중인 폴더가 사라졌습니다: {self.target_dir}")
+                if name:
+                    names.add(os.fsdecode(name))
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    # inotify 를 쓸 수 없을 때 (Windows, macOS) 스냅샷을 비교한다
+    # 폴더 자체의 수정 시각이 그대로면 목록을 다시 읽지 않는다
+    def __init__(self, target_dir: Path, interval: float = POLL_INTERVAL):
+        self.target_dir = target_dir
+        self.interval = interval
+        self.dir_mtime = None
+        self.snapshot = self.take_snapshot()
+
+    def take_snapshot(self) -> dict:
+        self.dir_mtime = os.stat(self.target_dir).st_mtime_ns
+        snapshot = {}
+        with os.scandir(self.target_dir) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                snapshot[entry.name] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout: float | None) -> set[str] | None:
+        delay = self.interval if timeout is None else min(self.interval, timeout)
+        time.sleep(delay)
+
+        if os.stat(self.target_dir).st_mtime_ns == self.dir_mtime:
+            return set()
+
+        old = self.snapshot
+        self.snapshot = self.take_snapshot()
+        return {
+            name for name, state in self.snapshot.items()
+            if old.get(name) != state
+        }
+
+    def close(self):
+        pass
+
+
+def open_watcher(target_dir: Path, poll_interval: float = POLL_INTERVAL):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(target_dir)
+        except (OSError, AttributeError):
+            # inotify 한도 초과, 컨테이너 제한 등
+            pass
+    return PollingWatcher(target_dir, poll_interval)
+
+
+def is_partial(name: str) -> bool:
+    return name.lower().endswith(PARTIAL_SUFFIXES)
+
+
+def list_names(target_dir: Path) -> set[str]:
+    with os.scandir(target_dir) as it:
+        return {entry.name for entry in it}
+
+
+def watch(
+    options: dict,
+    workers: int = 1,
+    durability: str = "batch",
+    retention: dict | None = None,
+    compress: bool = True,
+    debounce: float = DEBOUNCE_SECONDS,
+    settle: float = SETTLE_SECONDS,
+    batch_size: int = WATCH_BATCH_SIZE,
+    poll_interval: float = POLL_INTERVAL,
+    initial: bool = False,
+    stop: threading.Event | None = None,
+    on_batch=None,
+    keep_replaced: bool = True,
+    staging_retention: dict | None = None,
+):
+    # options 는 iter_plan 인자 (target_dir, rules, ...)
+    # 감시는 target_dir 바로 아래만 한다 (정리 폴더 안의 변화는 무시)
+    # on_batch(옮긴 파일 수) 는 배치가 끝날 때마다 불린다
+    # stop 이 설정되면 멈춘다 (없으면 KeyboardInterrupt 로 멈춘다)
+    target_dir = Path(options["target_dir"])
+    exclude_hidden = options["exclude_hidden"]
+    exclude_extensions = set(options["exclude_extensions"])
+    excludes = compile_excludes(options.get("exclude_patterns"))
+
+    pending = {}        # 이름 -> (크기, 수정 시각, 그 상태로 처음 본 시각)
+    last_event = 0.0
+
+    watcher = open_watcher(target_dir, poll_interval)
+    try:
+        if initial:
+            names = list_names(target_dir)
+            last_event = time.monotonic()
+        else:
+            names = set()
+
+        while stop is None or not stop.is_set():
+            now = time.monotonic()
+            for name in names:
+                if is_partial(name):
+                    continue
+                if excludes is not None and excludes.match(name):
+                    # 제외 패턴은 이름만 보고 stat 전에 거른다
+                    continue
+                pending.setdefault(name, None)
+            if names:
+                last_event = now
+
+            # 대기 중인 파일의 상태를 다시 확인한다
+            ready = []
+            for name, state in list(pending.items()):
+                try:
+                    st = os.stat(target_dir / name)
+                except OSError:
+                    del pending[name]
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    # 정리 폴더 등 하위 폴더는 무시
+                    del pending[name]
+                    continue
+                current = (st.st_size, st.st_mtime_ns)
+                if state is None or state[:2] != current:
+                    pending[name] = current + (now,)
+                elif now - state[2] >= settle:
+                    ready.append(name)
+
+            # 이벤트가 잠잠해졌거나 배치가 가득 찼을 때만 처리한다
+            if ready and (now - last_event >= debounce or len(ready) >= batch_size):
+                for name in ready:
+                    del pending[name]
+                entries = [
+                    entry for entry in (
+                        stat_entry(str(target_dir / name), exclude_hidden, exclude_extensions)
+                        for name in sorted(ready)
+                    )
+                    if entry is not None
+                ]
+                for batch in iter_batches(entries, batch_size):
+                    moved = execute_plan(
+                        tuple(iter_plan(**options, entries=batch)),
+                        workers=workers,
+                        durability=durability,
+                        retention=retention,
+                        compress=compress,
+                        root=str(target_dir.absolute()),
+                        keep_replaced=keep_replaced,
+                        staging_retention=staging_retention,
+                    )
+                    if on_batch:
+                        on_batch(moved)
+                names = set()
+                continue
+
+            # 할 일이 없으면 다음 이벤트까지 잠든다
+            if pending:
+                timeout = min(settle, debounce) / 2
+            elif stop is not None:
+                timeout = 1.0
+            else:
+                timeout = None
+
+            names = watcher.wait(timeout)
+            if names is None:
+                # 이벤트를 놓쳤으면 폴더 전체를 한 번 다시 본다
+                names = list_names(target_dir)
+    finally:
+        watcher.close()
+
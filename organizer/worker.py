@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import NamedTuple
+from PySide6.QtCore import QObject, QThread, Signal
+
+# 진행 신호는 이 간격보다 자주 보내지 않는다 (이벤트 루프 보호)
+PROGRESS_INTERVAL = 0.1
+
+
+class Progress(NamedTuple):
+    done: int
+    total: int | None
+    bytes_done: int
+    files_per_sec: float
+    eta: float | None     # 남은 시간(초), 전체 개수를 모르면 None
+
+
+class ProgressThrottle:
+    def __init__(self, emit, interval: float = PROGRESS_INTERVAL):
+        self.emit = emit
+        self.interval = interval
+        self.started = time.monotonic()
+        self.last = 0.0
+
+    def __call__(self, done: int, bytes_done: int, total: int | None):
+        now = time.monotonic()
+        if now - self.last < self.interval and done != total:
+            return
+        self.last = now
+
+        elapsed = max(now - self.started, 1e-6)
+        rate = done / elapsed
+        eta = None
+        if total is not None and rate > 0:
+            eta = (total - done) / rate
+
+        self.emit(Progress(done, total, bytes_done, rate, eta))
+
+
+class TaskWorker(QObject):
+    # task(progress, cancel) 를 백그라운드 스레드에서 실행한다
+    # chunked 면 task(progress, cancel, emit) — emit(결과 일부) 가 chunk 신호로 전달된다
+    progress = Signal(object)
+    chunk = Signal(object)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, task, chunked: bool = False):
+        super().__init__()
+        self.task = task
+        self.chunked = chunked
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        throttle = ProgressThrottle(self.progress.emit)
+        try:
+            if self.chunked:
+                result = self.task(throttle, self.cancel_event, self.chunk.emit)
+            else:
+                result = self.task(throttle, self.cancel_event)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(result)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+
+def start_worker(
+    parent: QObject,
+    task,
+    on_progress,
+    on_finished,
+    on_failed,
+    on_chunk=None,
+) -> tuple[QThread, TaskWorker]:
+    thread = QThread(parent)
+    worker = TaskWorker(task, chunked=on_chunk is not None)
+    worker.moveToThread(thread)
+
+    # 스레드 시작 전에 연결해야 신호를 놓치지 않는다
+    worker.progress.connect(on_progress)
+    if on_chunk is not None:
+        worker.chunk.connect(on_chunk)
+    worker.finished.connect(on_finished)
+    worker.failed.connect(on_failed)
+
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit)
+    worker.failed.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread, worker
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+sys.path.insert(0, str(BENCH_DIR))
+
+from bench_suite import compare  # noqa: E402
+from synth import SynthSpec, make_tree, parse_count  # noqa: E402
+
+
+def listing(root: Path) -> dict:
+    return {
+        p.relative_to(root).as_posix(): p.stat().st_size
+        for p in root.rglob("*") if p.is_file()
+    }
+
+
+@pytest.mark.parametrize("text, count", [("1000", 1000), ("1k", 1000), ("2.5K", 2500), ("1M", 1_000_000)])
+def test_parse_count(text, count):
+    assert parse_count(text) == count
+
+
+def test_make_tree_is_reproducible(tmp_path):
+    spec = SynthSpec(files=200, depth=2, fanout=3, dup_names=0.2, hidden=0.1, sizes="mixed")
+    first = make_tree(tmp_path / "a", spec)
+    second = make_tree(tmp_path / "b", spec)
+    assert first == second
+    assert listing(tmp_path / "a") == listing(tmp_path / "b")
+
+    assert first["files"] == 200
+    assert first["dirs"] == 1 + 3 + 9
+    assert first["hidden"] > 0 and first["dup_names"] > 0
+    archive = tmp_path / "a" / "Archive"
+    assert sum(1 for p in archive.rglob("*") if p.is_file()) == first["dup_names"]
+
+    make_tree(tmp_path / "c", spec._replace(seed=1))
+    assert listing(tmp_path / "c") != listing(tmp_path / "a")
+
+
+def test_dense_files_differ(tmp_path):
+    make_tree(tmp_path, SynthSpec(files=20, sizes="small", dense=True, dup_names=0, hidden=0))
+    contents = [p.read_bytes() for p in tmp_path.iterdir() if p.is_file() and p.stat().st_size >= 8]
+    assert len(set(contents)) == len(contents)
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"organize@1000/same": {"files_per_sec": 1000, "calls_per_file": 4.0, "peak_rss_mb": None}}
+    results = {"organize@1000/same": {"files_per_sec": 800, "calls_per_file": 4.2, "peak_rss_mb": 50}}
+    assert compare(results, baseline, 0.15) == ["organize@1000/same files_per_sec: 1000 → 800"]
+    assert compare(results, baseline, 0.25) == []
+    assert compare({"undo@1000/same": {"files_per_sec": 1}}, baseline, 0.15) == []
+
+
+def test_suite_runs_end_to_end(tmp_path):
+    save = tmp_path / "base.json"
+    cmd = [
+        sys.executable, str(BENCH_DIR / "bench_suite.py"), "--files", "50",
+        "--src", str(tmp_path), "--entries", "2", "--save", str(save),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert save.exists()
+
+    proc = subprocess.run(cmd[:-2] + ["--baseline", str(save), "--tolerance", "100"], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert "회귀 없음" in proc.stdout
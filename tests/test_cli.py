@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from organizer.cli import EXIT_ERROR, EXIT_NOTHING, EXIT_OK, main
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run(capsys, *argv) -> tuple[int, str]:
+    code = main(list(argv))
+    return code, capsys.readouterr().out
+
+
+def test_preview_run_history_undo(tmp_path, capsys):
+    (tmp_path / "a.jpg").write_text("a")
+    (tmp_path / "b.mov").write_text("b")
+    target = ["--target", str(tmp_path), "--mode", "move", "--conflict", "rename"]
+
+    code, out = run(capsys, "preview", *target, "--format", "json")
+    assert code == EXIT_OK
+    plan = {row["source"]: row for row in json.loads(out)}
+    assert plan[str(tmp_path / "a.jpg")]["destination"] == str(tmp_path / "Archive" / "Images" / "a.jpg")
+    assert (tmp_path / "a.jpg").exists()
+
+    code, out = run(capsys, "run", *target, "--json")
+    assert code == EXIT_OK
+    result = json.loads(out)
+    assert result["moved"] == 2 and not result["cancelled"]
+    assert Path(result["undo_entry"]).exists()
+
+    code, out = run(capsys, "history", "--format", "json")
+    [row] = json.loads(out)
+    assert row["count"] == 2
+
+    code, out = run(capsys, "undo", "--json")
+    assert code == EXIT_OK
+    assert json.loads(out)["restored"] == 2
+    assert (tmp_path / "a.jpg").exists()
+
+
+def test_errors_become_exit_codes(tmp_path, capsys):
+    code = main(["run", "--target", str(tmp_path / "missing"), "--mode", "move", "--conflict", "rename"])
+    assert code == EXIT_ERROR
+    assert "오류" in capsys.readouterr().err
+
+    # 정리 방식을 정하지 않았다
+    assert main(["run", "--target", str(tmp_path)]) == EXIT_ERROR
+    assert main(["undo"]) == EXIT_NOTHING
+
+
+def test_cli_never_imports_qt(tmp_path):
+    # PySide6 가 설치되어 있어도 불러오면 실패하도록 막고 실행한다
+    (tmp_path / "a.jpg").write_text("a")
+    code = (
+        "import sys; sys.modules['PySide6'] = None\n"
+        "from organizer.cli import main\n"
+        f"code = main(['preview', '--target', {str(tmp_path)!r}, '--mode', 'move', '--conflict', 'rename'])\n"
+        "assert not any(m.startswith('PySide6') and sys.modules[m] for m in sys.modules)\n"
+        "sys.exit(code)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    proc = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert "a.jpg" in proc.stdout
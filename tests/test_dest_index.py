@@ -0,0 +1,47 @@
+from organizer.dest_index import DestIndex
+
+
+def test_free_name_is_used_as_is(tmp_path):
+    index = DestIndex()
+    assert index.allocate(tmp_path / "a.jpg", "rename") == (tmp_path / "a.jpg", "none")
+
+
+def test_rename_numbers_past_existing_files(tmp_path):
+    (tmp_path / "a.jpg").touch()
+    (tmp_path / "a_1.jpg").touch()
+    index = DestIndex()
+    assert index.allocate(tmp_path / "a.jpg", "rename") == (tmp_path / "a_2.jpg", "rename")
+    assert index.allocate(tmp_path / "a.jpg", "rename") == (tmp_path / "a_3.jpg", "rename")
+
+
+def test_overwrite_replaces_only_files_from_before_the_run(tmp_path):
+    (tmp_path / "b.jpg").touch()
+    index = DestIndex()
+    assert index.allocate(tmp_path / "b.jpg", "overwrite") == (tmp_path / "b.jpg", "overwrite")
+    # 같은 실행에서 두 번째로 오는 b.jpg 는 먼저 옮긴 파일을 덮어쓰면 안 된다
+    assert index.allocate(tmp_path / "b.jpg", "overwrite") == (tmp_path / "b_1.jpg", "rename")
+
+
+def test_overwrite_of_new_name_is_claimed(tmp_path):
+    index = DestIndex()
+    assert index.allocate(tmp_path / "c.jpg", "overwrite") == (tmp_path / "c.jpg", "none")
+    assert index.allocate(tmp_path / "c.jpg", "overwrite") == (tmp_path / "c_1.jpg", "rename")
+
+
+def test_release_and_discard(tmp_path):
+    (tmp_path / "d.jpg").touch()
+    index = DestIndex()
+    dest, _ = index.allocate(tmp_path / "d.jpg", "overwrite")
+    index.release(dest)
+    assert index.allocate(tmp_path / "d.jpg", "overwrite")[1] == "overwrite"
+
+    renamed, _ = index.allocate(tmp_path / "e.jpg", "rename")
+    index.discard(renamed)
+    assert not index.exists(renamed)
+
+
+def test_folder_is_listed_once(tmp_path):
+    index = DestIndex()
+    for i in range(5):
+        index.allocate(tmp_path / f"f{i}.jpg", "rename")
+    assert index.scans == 1
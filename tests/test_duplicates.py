@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from organizer.core import execute_plan, iter_plan
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.undo import read_undo_file, undo_last_operation
+from organizer.undo_store import list_entries
+
+
+def organize(target, duplicates, **overrides):
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(target), mode="move", on_conflict="rename",
+        duplicates=duplicates, **overrides,
+    )
+    return execute_plan(iter_plan(**get_plan_options(settings)))
+
+
+def test_skip_keeps_duplicate_in_place_and_records_it(tmp_path):
+    (tmp_path / "a.jpg").write_text("same")
+    (tmp_path / "b.jpg").write_text("same")
+    assert organize(tmp_path, "skip") == 1
+
+    [entry] = list_entries()
+    actions = sorted(op.get("action", "move") for op in read_undo_file(entry)["operations"])
+    assert actions == ["move", "skip"]
+    assert len(list((tmp_path / "Archive" / "Images").iterdir())) == 1
+
+
+def test_runs_that_only_skip_leave_no_undo_entry(tmp_path):
+    (tmp_path / "a.jpg").write_text("same")
+    (tmp_path / "b.jpg").write_text("same")
+    organize(tmp_path, "skip")
+    for _ in range(3):
+        assert organize(tmp_path, "skip") == 0
+    assert len(list_entries()) == 1
+
+    report = undo_last_operation()
+    assert len(report.restored) == 1
+    assert sorted(p.name for p in tmp_path.glob("*.jpg")) == ["a.jpg", "b.jpg"]
+
+
+def test_move_sends_duplicates_to_their_own_folder(tmp_path):
+    (tmp_path / "a.jpg").write_text("same")
+    (tmp_path / "b.jpg").write_text("same")
+    (tmp_path / "c.jpg").write_text("other")
+    assert organize(tmp_path, "move") == 3
+    assert len(list((tmp_path / "Archive" / "Images").iterdir())) == 2
+    assert len(list((tmp_path / "Archive" / "Duplicates" / "Images").iterdir())) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "link"), reason="하드링크 없음")
+def test_hardlink_points_at_the_kept_copy(tmp_path):
+    (tmp_path / "a.jpg").write_text("same")
+    (tmp_path / "b.jpg").write_text("same")
+    assert organize(tmp_path, "hardlink") == 2
+    files = list((tmp_path / "Archive" / "Images").iterdir())
+    assert len(files) == 2
+    assert len({os.stat(f).st_ino for f in files}) == 1
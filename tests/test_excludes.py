@@ -0,0 +1,152 @@
+import os
+
+import pytest
+
+from organizer.core import iter_plan
+from organizer.excludes import ExcludePattern, compile_excludes, parse_pattern
+from organizer.scanner import scan_dir
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.snapshot import get_fingerprint
+from organizer.walker import walk_files
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("node_modules/", ExcludePattern("node_modules", dir_only=True)),
+    ("*.PART", ExcludePattern("*.part")),
+    ("/build", ExcludePattern("build", anchored=True)),
+    ("docs\\*.tmp", ExcludePattern("docs/*.tmp", anchored=True)),
+    ("**/cache/", ExcludePattern("cache", dir_only=True)),
+    ("a/**/b", ExcludePattern("a/**/b", anchored=True)),
+    ("!keep.part", ExcludePattern("keep.part", negate=True)),
+    ("\\#name", ExcludePattern("#name")),
+    ("\\!name", ExcludePattern("!name")),
+])
+def test_parse_pattern(line, expected):
+    assert parse_pattern(line) == expected
+
+
+@pytest.mark.parametrize("line", ["", "   ", "# 주석"])
+def test_parse_pattern_skips_blank_and_comments(line):
+    assert parse_pattern(line) is None
+
+
+@pytest.mark.parametrize("line", ["/", "!/", "//"])
+def test_parse_pattern_rejects_empty(line):
+    with pytest.raises(ValueError):
+        parse_pattern(line)
+
+
+def test_compile_without_patterns():
+    assert compile_excludes(None) is None
+    assert compile_excludes(["", "# 주석"]) is None
+    matcher = compile_excludes(["*.tmp"])
+    assert compile_excludes(matcher) is matcher
+    assert not matcher.needs_path
+
+
+@pytest.mark.parametrize("negated", [False, True])
+def test_match(negated):
+    patterns = [
+        "node_modules/", "*.part", "~$*", "thumbs.db", "/build", "docs/*.bak",
+        "[._]*.swp", "a/**/b",
+    ]
+    if negated:
+        # 순서대로 검사하는 쪽도 같은 결과여야 한다
+        patterns.append("!nothing-matches-this")
+    matcher = compile_excludes(patterns)
+    assert matcher.ordered == negated
+    assert matcher.needs_path
+
+    cases = [
+        ("node_modules", "", True, True),
+        ("node_modules", "src/", True, True),
+        ("node_modules", "", False, False),     # 같은 이름의 파일은 그대로
+        ("video.mp4.PART", "x/", False, True),
+        ("~$memo.docx", "", False, True),
+        ("Thumbs.DB", "a/", False, True),
+        ("build", "", True, True),
+        ("build", "src/", True, False),         # 대상 폴더 바로 아래만
+        ("old.bak", "docs/", False, True),
+        ("old.bak", "x/docs/", False, False),
+        ("old.bak", "", False, False),
+        (".main.swp", "", False, True),
+        ("b", "a/", True, True),
+        ("b", "a/x/y/", False, True),
+        ("b", "c/", True, False),
+        ("report.pdf", "docs/", False, False),
+    ]
+    for name, rel_dir, is_dir, expected in cases:
+        assert matcher.match(name, rel_dir, is_dir) == expected, (name, rel_dir, is_dir)
+
+
+def test_negation_last_match_wins():
+    matcher = compile_excludes(["*.part", "!keep.part", "keep.part/"])
+    assert matcher.match("a.part")
+    assert not matcher.match("keep.part")
+    assert matcher.match("keep.part", is_dir=True)
+
+
+def test_star_does_not_cross_folders():
+    matcher = compile_excludes(["docs/*.bak"])
+    assert matcher.match("a.bak", "docs/")
+    assert not matcher.match("a.bak", "docs/sub/")
+
+
+def make_tree(root):
+    for rel in [
+        "keep.txt", "video.mp4.part", "src/main.py", "src/node_modules/pkg/index.js",
+        "node_modules/x.js", "build/out.bin", "src/build/out.bin", "docs/a.bak",
+        "docs/keep.part",
+    ]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+
+def test_walk_files_prunes_excluded_folders(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    opened = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        opened.append(os.path.relpath(path, tmp_path).replace(os.sep, "/"))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    patterns = ["node_modules/", "*.part", "!keep.part", "/build", "docs/*.bak"]
+    found = {
+        os.path.relpath(e.path, tmp_path).replace(os.sep, "/")
+        for e in walk_files(tmp_path, exclude_patterns=patterns)
+    }
+    assert found == {"keep.txt", "src/main.py", "src/build/out.bin", "docs/keep.part"}
+    # 제외된 폴더는 안을 읽지 않는다
+    assert not any("node_modules" in p or p == "build" for p in opened)
+
+
+def test_scan_dir_filters_top_level(tmp_path):
+    make_tree(tmp_path)
+    names = {e.name for e in scan_dir(tmp_path, False, (), ["*.part", "keep*"])}
+    assert names == set()
+    names = {e.name for e in scan_dir(tmp_path, False, (), ["*.part"])}
+    assert names == {"keep.txt"}
+
+
+def test_patterns_change_snapshot_fingerprint(tmp_path):
+    settings = dict(DEFAULT_SETTINGS, target_dir=str(tmp_path))
+    before = get_fingerprint(get_plan_options(settings))
+    settings["exclude_patterns"] = ["*.part"]
+    after = get_fingerprint(get_plan_options(settings))
+    assert before != after
+    assert after["exclude_patterns"] == ["*.part"]
+
+
+def test_plan_skips_excluded(tmp_path):
+    make_tree(tmp_path)
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(tmp_path), mode="move", recursive=True,
+        exclude_patterns=["node_modules/", "*.part", "/build", "docs/"],
+    )
+    names = {m.entry.name for m in iter_plan(**get_plan_options(settings))}
+    assert "x.js" not in names and "index.js" not in names
+    assert "video.mp4.part" not in names and "a.bak" not in names
+    assert "main.py" in names
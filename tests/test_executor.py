@@ -0,0 +1,105 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from organizer import core
+from organizer.core import MoveJob, execute_plan, group_jobs, plan_organize
+from organizer.scanner import ScanEntry
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.transfer import move_file
+from organizer.undo import undo_last_operation
+
+
+def make_files(root: Path, count: int):
+    for i in range(count):
+        (root / f"f{i}.jpg").write_bytes(b"x" * (i + 1))
+
+
+def plan_for(root: Path, conflict: str = "rename"):
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(root), mode="move", on_conflict=conflict,
+        recursive=True,
+    )
+    return plan_organize(**get_plan_options(settings))
+
+
+def job(position: int, dest: str, size: int, action: str = "move", original=None) -> MoveJob:
+    entry = ScanEntry(f"/src/{position}", "x", "", size, 0.0, 0, position, False)
+    return MoveJob(position, entry, Path(dest), "Images", 0, False, action, original)
+
+
+def test_group_jobs_keeps_same_destination_in_plan_order():
+    jobs = [job(0, "/d/a", 50), job(1, "/d/b", 10), job(2, "/d/a", 1)]
+    groups = group_jobs(jobs)
+    # 작은 그룹부터, 같은 대상은 계획 순서대로 한 그룹에
+    assert [[j.position for j in g] for g in groups] == [[1], [0, 2]]
+
+
+def test_group_jobs_puts_hardlinks_with_their_original():
+    jobs = [job(0, "/d/a", 5), job(1, "/d/b", 5, "hardlink", "/d/a")]
+    assert [[j.position for j in g] for g in group_jobs(jobs)] == [[0, 1]]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_workers_move_everything_and_report_progress(tmp_path, workers):
+    make_files(tmp_path, 40)
+    plan = plan_for(tmp_path)
+    calls = []
+
+    assert execute_plan(plan, workers=workers, progress=lambda *a: calls.append(a)) == 40
+    assert len(list((tmp_path / "Archive" / "Images").iterdir())) == 40
+    assert calls[-1] == (40, sum(range(1, 41)), 40)
+    assert [c[0] for c in calls] == sorted(c[0] for c in calls)
+
+
+def test_parallel_overwrite_is_undone(tmp_path):
+    images = tmp_path / "Archive" / "Images"
+    images.mkdir(parents=True)
+    for i in range(8):
+        (images / f"f{i}.jpg").write_text("old")
+        (tmp_path / f"f{i}.jpg").write_text("new")
+    plan = plan_for(tmp_path, "overwrite")
+    assert {m.conflict for m in plan} == {"overwrite"}
+
+    assert execute_plan(plan, workers=4) == 8
+    assert {p.read_text() for p in images.iterdir()} == {"new"}
+
+    undo_last_operation()
+    assert {p.read_text() for p in images.iterdir()} == {"old"}
+    assert {p.read_text() for p in tmp_path.glob("*.jpg")} == {"new"}
+
+
+def test_cancel_stops_between_files(tmp_path):
+    make_files(tmp_path, 10)
+    cancel = threading.Event()
+
+    def progress(done, bytes_done, total):
+        if done == 3:
+            cancel.set()
+
+    assert execute_plan(plan_for(tmp_path), progress=progress, cancel=cancel) == 3
+    assert len(list(tmp_path.glob("*.jpg"))) == 7
+
+
+def test_parallel_moves_are_opt_in():
+    assert DEFAULT_SETTINGS["workers"] == 1
+
+
+def test_cancelled_groups_do_not_advance_progress(tmp_path, monkeypatch):
+    make_files(tmp_path, 40)
+    cancel = threading.Event()
+    calls = []
+
+    def move_then_cancel(*args, **kwargs):
+        # 첫 이동이 끝나면 바로 취소 — 워커가 모두 끝내기 전에 취소가 걸리도록
+        move_file(*args, **kwargs)
+        cancel.set()
+
+    monkeypatch.setattr(core, "move_file", move_then_cancel)
+    moved = execute_plan(
+        plan_for(tmp_path), workers=4, progress=lambda done, *_: calls.append(done), cancel=cancel,
+    )
+    assert moved < 40
+    assert calls[-1] == moved
+    assert len(list(tmp_path.glob("*.jpg"))) == 40 - moved
@@ -0,0 +1,65 @@
+import os
+
+from organizer.journal import read_journal
+from organizer.undo import (
+    open_journal, finish_journal, find_incomplete_journals, rollback_journal,
+    recover_journal, read_undo_file,
+)
+from organizer.undo_store import list_entries
+
+
+def move(src, dst):
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    os.rename(src, dst)
+
+
+def start_run(tmp_path, count):
+    # 파일을 옮기며 저널에 적고 commit 없이 멈춘 실행
+    journal = open_journal("full", root=str(tmp_path))
+    for i in range(count):
+        src = tmp_path / f"f{i}.jpg"
+        src.write_text(str(i))
+        dst = tmp_path / "Archive" / "Images" / src.name
+        move(src, dst)
+        journal.append(str(src), str(dst), size=1, category="Images")
+    return journal
+
+
+def test_committed_journal_is_compacted(tmp_path):
+    journal = start_run(tmp_path, 3)
+    entry = finish_journal(journal)
+    assert entry.suffix == ".undo"
+    data = read_undo_file(entry)
+    assert data["committed"]
+    assert data["root"] == str(tmp_path)
+    assert [op["from"] for op in data["operations"]] == [str(tmp_path / f"f{i}.jpg") for i in range(3)]
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    journal = start_run(tmp_path, 2)
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"from": "/half')
+    data = read_journal(journal.path)
+    assert not data["committed"]
+    assert len(data["operations"]) == 2
+
+
+def test_interrupted_run_can_be_rolled_back(tmp_path):
+    journal = start_run(tmp_path, 3)
+    journal.close()
+    assert find_incomplete_journals() == [journal.path]
+
+    report = rollback_journal(journal.path)
+    assert len(report.restored) == 3
+    assert sorted(p.name for p in tmp_path.glob("*.jpg")) == ["f0.jpg", "f1.jpg", "f2.jpg"]
+    assert find_incomplete_journals() == []
+
+
+def test_interrupted_run_can_be_kept(tmp_path):
+    journal = start_run(tmp_path, 2)
+    journal.close()
+    recover_journal(journal.path)
+    assert find_incomplete_journals() == []
+    [entry] = list_entries()
+    assert read_undo_file(entry)["committed"]
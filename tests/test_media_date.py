@@ -0,0 +1,150 @@
+import os
+import struct
+from datetime import datetime
+
+import pytest
+
+from organizer import media_date
+from organizer.core import iter_plan
+from organizer.media_date import (
+    MP4_EPOCH_OFFSET, UNKNOWN, DateExtractor, get_date_folder, read_media_date,
+)
+from organizer.scanner import scan_dir
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+
+
+def tiff(order: str, ifd0: dict, exif: dict | None = None) -> bytes:
+    # {태그: ASCII 값} 으로 TIFF 헤더 + IFD0 (+ Exif IFD) 를 만든다
+    magic = b"II*\x00" if order == "<" else b"MM\x00*"
+    head = magic + struct.pack(order + "I", 8)
+
+    def ifd(tags: dict, start: int, extra: dict) -> tuple[bytes, bytes]:
+        entries = dict(tags)
+        entries.update(extra)
+        data_start = start + 2 + len(entries) * 12 + 4
+        table = struct.pack(order + "H", len(entries))
+        data = b""
+        for tag, value in sorted(entries.items()):
+            if isinstance(value, int):
+                table += struct.pack(order + "HHII", tag, 4, 1, value)
+                continue
+            raw = value + b"\x00"
+            table += struct.pack(order + "HHII", tag, 2, len(raw), data_start + len(data))
+            data += raw
+        return table + struct.pack(order + "I", 0), data
+
+    extra = {}
+    if exif is not None:
+        # Exif IFD 위치는 IFD0 크기를 알아야 정해진다 — 두 번 만든다
+        extra = {0x8769: 0}
+        table, data = ifd(ifd0, 8, extra)
+        extra = {0x8769: 8 + len(table) + len(data)}
+    table, data = ifd(ifd0, 8, extra)
+    body = head + table + data
+    if exif is not None:
+        exif_table, exif_data = ifd(exif, len(body), {})
+        body += exif_table + exif_data
+    return body
+
+
+def jpeg(tiff_body: bytes) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    exif = b"Exif\x00\x00" + tiff_body
+    app1 = b"\xff\xe1" + struct.pack(">H", len(exif) + 2) + exif
+    return b"\xff\xd8" + app0 + app1 + b"\xff\xda" + b"\x00" * 100
+
+
+def box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", len(payload) + 8) + kind + payload
+
+
+def mp4(created: datetime, version: int = 0, mdat_first: bool = True) -> bytes:
+    seconds = int(created.timestamp()) + MP4_EPOCH_OFFSET
+    if version == 1:
+        mvhd = bytes([1, 0, 0, 0]) + struct.pack(">QQ", seconds, seconds) + b"\x00" * 80
+    else:
+        mvhd = bytes([0, 0, 0, 0]) + struct.pack(">II", seconds, seconds) + b"\x00" * 80
+    moov = box(b"moov", box(b"mvhd", mvhd))
+    parts = [box(b"ftyp", b"isom\x00\x00\x02\x00"), box(b"mdat", b"\x00" * 5000), moov]
+    if not mdat_first:
+        parts[1], parts[2] = parts[2], parts[1]
+    return b"".join(parts)
+
+
+@pytest.mark.parametrize("order", ["<", ">"])
+def test_jpeg_prefers_date_time_original(tmp_path, order):
+    body = tiff(order, {0x0132: b"2020:01:01 00:00:00"}, {0x9003: b"2019:07:14 10:20:30"})
+    path = tmp_path / "a.jpg"
+    path.write_bytes(jpeg(body))
+    assert read_media_date(str(path), ".jpg") == "2019-07-14"
+
+
+def test_raw_falls_back_to_date_time(tmp_path):
+    path = tmp_path / "a.dng"
+    path.write_bytes(tiff("<", {0x0132: b"2018:02:03 04:05:06"}, {}))
+    assert read_media_date(str(path), ".dng") == "2018-02-03"
+
+
+@pytest.mark.parametrize("version", [0, 1])
+@pytest.mark.parametrize("mdat_first", [True, False])
+def test_mp4_creation_time(tmp_path, version, mdat_first):
+    path = tmp_path / "a.mp4"
+    path.write_bytes(mp4(datetime(2021, 5, 6, 12, 0), version, mdat_first))
+    assert read_media_date(str(path), ".mp4") == "2021-05-06"
+
+
+@pytest.mark.parametrize("name, data", [
+    ("a.jpg", b"\xff\xd8\xff\xda" + b"\x00" * 50),         # Exif 없음
+    ("b.jpg", b"not a jpeg"),
+    ("c.jpg", jpeg(tiff("<", {0x0132: b"0000:00:00 00:00:00"}))),
+    ("d.mp4", box(b"ftyp", b"isom") + box(b"mdat", b"")),
+    ("e.mp4", b"\x00\x00\x00\x01moov"),                    # 잘린 상자
+    ("f.tif", b"II*\x00\xff\xff\xff\x00"),                 # IFD 가 파일 밖
+])
+def test_unreadable_headers_give_unknown(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    assert read_media_date(str(path), os.path.splitext(name)[1]) == UNKNOWN
+
+
+def test_date_folder_modes():
+    assert get_date_folder("Images", "2026-10-18", "year") == "Images/2026"
+    assert get_date_folder("Images", "2026-10-18", "month") == "Images/2026/10"
+    assert get_date_folder("Images", None, "month") == "Images"
+
+
+def test_extractor_caches_dates(tmp_path, monkeypatch):
+    (tmp_path / "a.jpg").write_bytes(jpeg(tiff("<", {0x0132: b"2017:03:04 00:00:00"})))
+    (tmp_path / "b.jpg").write_bytes(b"\xff\xd8\xff\xda")
+    (tmp_path / "c.txt").write_text("x")
+    entries = list(scan_dir(tmp_path))
+
+    extractor = DateExtractor()
+    assert extractor.dates_many(entries) == {str(tmp_path / "a.jpg"): "2017-03-04"}
+    extractor.close()
+
+    # 두 번째는 파일을 열지 않고 캐시에서 (날짜가 없다는 결과도 캐시된다)
+    def fail(path, suffix):
+        raise AssertionError(path)
+
+    monkeypatch.setattr(media_date, "read_media_date", fail)
+    extractor = DateExtractor()
+    assert extractor.dates_many(entries) == {str(tmp_path / "a.jpg"): "2017-03-04"}
+    extractor.close()
+
+
+def test_plan_partitions_by_date(tmp_path):
+    (tmp_path / "photo.jpg").write_bytes(jpeg(tiff("<", {0x0132: b"2016:08:09 00:00:00"})))
+    doc = tmp_path / "doc.pdf"
+    doc.write_text("x")
+    stamp = datetime(2015, 11, 12).timestamp()
+    os.utime(doc, (stamp, stamp))
+
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(tmp_path), mode="move", on_conflict="rename",
+        rules={"Images": [".jpg"], "Docs": [".pdf"]}, date_folders="month",
+    )
+    plan = {m.entry.name: m.destination for m in iter_plan(**get_plan_options(settings))}
+    archive = tmp_path / "Archive"
+    assert plan["photo.jpg"] == archive / "Images" / "2016" / "08" / "photo.jpg"
+    assert plan["doc.pdf"] == archive / "Docs" / "2015" / "11" / "doc.pdf"
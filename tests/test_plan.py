@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from organizer.core import execute_plan, organize_desktop, plan_organize
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.undo_store import list_entries
+
+
+def options(target, **overrides):
+    settings = dict(DEFAULT_SETTINGS, target_dir=str(target), mode="move", on_conflict="rename")
+    settings.update(overrides)
+    return get_plan_options(settings)
+
+
+def listing(root: Path) -> set[str]:
+    return {p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file()}
+
+
+def test_planning_does_not_touch_the_disk(tmp_path):
+    (tmp_path / "a.jpg").write_text("a")
+    (tmp_path / "notes.txt").write_text("n")
+    plan = plan_organize(**options(tmp_path))
+
+    assert listing(tmp_path) == {"a.jpg", "notes.txt"}
+    assert not list_entries()
+    assert {m.entry.name: (m.category, m.conflict) for m in plan} == {
+        "a.jpg": ("Images", "none"),
+        "notes.txt": ("Others", "none"),
+    }
+    assert execute_plan(plan) == 2
+    assert listing(tmp_path) == {"Archive/Images/a.jpg", "Archive/Others/notes.txt"}
+
+
+def test_plan_reports_conflicts_with_existing_files(tmp_path):
+    (tmp_path / "Archive" / "Images").mkdir(parents=True)
+    (tmp_path / "Archive" / "Images" / "a.jpg").write_text("old")
+    (tmp_path / "a.jpg").write_text("new")
+
+    [move] = plan_organize(**options(tmp_path))
+    assert move.conflict == "rename"
+    assert move.destination.name == "a_1.jpg"
+
+    [move] = plan_organize(**options(tmp_path, on_conflict="overwrite"))
+    assert move.conflict == "overwrite"
+    assert move.destination.name == "a.jpg"
+
+
+def test_plan_allocates_distinct_names_within_a_run(tmp_path):
+    (tmp_path / "a.jpg").write_text("1")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.jpg").write_text("2")
+    plan = plan_organize(**options(tmp_path, recursive=True))
+    assert sorted(m.destination.name for m in plan) == ["a.jpg", "a_1.jpg"]
+
+
+def test_inplace_mode_uses_target_folder(tmp_path):
+    (tmp_path / "a.jpg").write_text("a")
+    [move] = plan_organize(**options(tmp_path, mode="inplace"))
+    assert move.destination == tmp_path / "Images" / "a.jpg"
+
+
+def test_executing_a_stale_plan_renames_new_conflicts(tmp_path):
+    (tmp_path / "a.jpg").write_text("a")
+    plan = plan_organize(**options(tmp_path))
+    # 미리보기 이후에 같은 이름의 파일이 생겼다
+    (tmp_path / "Archive" / "Images").mkdir(parents=True)
+    (tmp_path / "Archive" / "Images" / "a.jpg").write_text("other")
+
+    assert execute_plan(plan) == 1
+    assert listing(tmp_path) == {"Archive/Images/a.jpg", "Archive/Images/a_1.jpg"}
+    assert (tmp_path / "Archive" / "Images" / "a.jpg").read_text() == "other"
+
+
+def test_organize_desktop_matches_plan_and_execute(tmp_path):
+    (tmp_path / "a.jpg").write_text("a")
+    (tmp_path / "b.mov").write_text("b")
+    opts = options(tmp_path)
+    expected = {m.destination.relative_to(tmp_path).as_posix() for m in plan_organize(**opts)}
+
+    assert organize_desktop(**opts) == 2
+    assert listing(tmp_path) == expected
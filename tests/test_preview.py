@@ -0,0 +1,79 @@
+from organizer.core import execute_plan, iter_plan
+from organizer.preview import PreviewIndex
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+
+RULES = {"Images": [".jpg", ".png"], "Videos": [".mp4"]}
+
+
+def options(root, **overrides) -> dict:
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(root), mode="move", on_conflict="rename",
+        rules=RULES, exclude_extensions=[".psd"],
+    )
+    settings.update(overrides)
+    return get_plan_options(settings)
+
+
+def build(root, **overrides) -> PreviewIndex:
+    for name, size in [("a.jpg", 1), ("b.png", 2), ("c.mp4", 4), ("d.psd", 8), ("e.txt", 16)]:
+        (root / name).write_bytes(b"x" * size)
+    index = PreviewIndex(options(root, **overrides))
+    index.add(list(iter_plan(**index.scan_options())))
+    index.complete = True
+    return index
+
+
+def test_excluded_rows_are_scanned_but_hidden(tmp_path):
+    index = build(tmp_path)
+    assert len(index.moves) == 5
+    assert sorted(m.entry.name for m in index.to_plan()) == ["a.jpg", "b.png", "c.mp4", "e.txt"]
+    assert index.totals == {"Images": [2, 3], "Videos": [1, 4], "Others": [1, 16]}
+
+
+def test_rule_change_reclassifies_only_affected_suffixes(tmp_path):
+    index = build(tmp_path)
+    new = options(tmp_path, rules={"Images": [".jpg"], "Pics": [".png"], "Videos": [".mp4"]})
+    assert index.can_update(new)
+
+    visible_changed, changed = index.update(new)
+    assert not visible_changed
+    assert [index.moves[row].entry.name for row in changed] == ["b.png"]
+    moved = index.moves[changed[0]]
+    assert (moved.category, moved.destination) == ("Pics", tmp_path / "Archive" / "Pics" / "b.png")
+    assert index.totals == {"Images": [1, 1], "Pics": [1, 2], "Videos": [1, 4], "Others": [1, 16]}
+
+
+def test_exclude_toggle_updates_visible_rows(tmp_path):
+    index = build(tmp_path)
+    visible_changed, changed = index.update(options(tmp_path, exclude_extensions=[".txt"]))
+    assert visible_changed
+    assert sorted(index.moves[row].entry.name for row in changed) == ["d.psd", "e.txt"]
+    assert sorted(m.entry.name for m in index.to_plan()) == ["a.jpg", "b.png", "c.mp4", "d.psd"]
+    assert "Others" in index.totals and index.totals["Others"] == [1, 8]
+
+
+def test_reallocated_rows_do_not_collide(tmp_path):
+    (tmp_path / "Archive" / "Pics").mkdir(parents=True)
+    (tmp_path / "Archive" / "Pics" / "b.png").write_text("old")
+    index = build(tmp_path)
+    index.update(options(tmp_path, rules={"Images": [".jpg"], "Pics": [".png"], "Videos": [".mp4"]}))
+
+    [move] = [m for m in index.to_plan() if m.entry.name == "b.png"]
+    assert move.destination.name == "b_1.png" and move.conflict == "rename"
+    assert execute_plan(index.to_plan()) == 4
+    assert (tmp_path / "Archive" / "Pics" / "b.png").read_text() == "old"
+
+
+def test_other_option_changes_need_a_rescan(tmp_path):
+    index = build(tmp_path)
+    assert not index.can_update(options(tmp_path, mode="inplace"))
+    assert not index.can_update(options(tmp_path, recursive=True))
+
+
+
+def test_sniffing_preview_is_never_updated_in_place(tmp_path):
+    index = build(tmp_path, content_sniffing=True)
+    assert not index.incremental
+    assert not index.can_update(index.options)
+    # 내용 확인을 켜면 제외 확장자도 스캔할 때 거른다
+    assert len(index.moves) == 4
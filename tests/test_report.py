@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from organizer.core import execute_plan, iter_plan
+from organizer.report import (
+    KEEP_REPORTS, RunReport, format_report, load_latest_report, save_report,
+)
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+
+
+def organize(root, report, workers=1, **overrides):
+    settings = dict(DEFAULT_SETTINGS, target_dir=str(root), mode="move", on_conflict="rename")
+    settings.update(overrides)
+    return execute_plan(
+        iter_plan(**get_plan_options(settings), report=report),
+        workers=workers, report=report,
+    )
+
+
+def test_nested_phases_do_not_overlap():
+    report = RunReport()
+    report.enter("scan")
+    time.sleep(0.02)
+    report.enter("classify")
+    time.sleep(0.02)
+    report.leave()
+    report.leave()
+    assert report.phases["scan"] == pytest.approx(0.02, abs=0.015)
+    assert report.phases["classify"] == pytest.approx(0.02, abs=0.015)
+
+
+def test_wrap_counts_time_inside_next():
+    report = RunReport()
+
+    def slow():
+        time.sleep(0.02)
+        yield 1
+
+    assert list(report.wrap("scan", slow())) == [1]
+    assert report.phases["scan"] >= 0.02
+
+
+def test_unknown_profiler_is_rejected():
+    with pytest.raises(ValueError):
+        RunReport("perf")
+
+
+def test_run_report_is_saved(tmp_path):
+    (tmp_path / "Archive" / "Images").mkdir(parents=True)
+    (tmp_path / "Archive" / "Images" / "a.jpg").write_text("old")
+    (tmp_path / "a.jpg").write_text("new")
+    (tmp_path / "b.mov").write_text("12345")
+
+    report = RunReport()
+    assert organize(tmp_path, report) == 2
+    data = load_latest_report()
+    assert report.path.exists()
+    assert data == report.to_dict()
+
+    assert data["files"] == 2
+    assert data["bytes_moved"] == 8
+    assert data["categories"] == {"Images": {"files": 1, "bytes": 3}, "Videos": {"files": 1, "bytes": 5}}
+    assert data["conflicts"] == {"rename": 1, "none": 1}
+    assert data["same_device_moves"] == 2
+    assert data["workers"] == 1 and data["thread_phases"] == []
+    assert len(data["slowest"]) == 2
+    assert data["phases"]["scan"] > 0 and data["phases"]["move"] > 0
+
+    text = format_report(data)
+    assert "[단계별 시간]" in text and "Images" in text
+    assert "스레드" not in text
+
+
+def test_parallel_phases_are_shown_as_thread_totals(tmp_path):
+    for i in range(10):
+        (tmp_path / f"f{i}.jpg").write_text("x")
+    report = RunReport()
+    organize(tmp_path, report, workers=4)
+    data = report.to_dict()
+    assert data["workers"] == 4
+    assert data["thread_phases"] == ["move", "journal"]
+
+    move_line = next(line for line in format_report(data).splitlines() if line.strip().startswith("move"))
+    assert "스레드 4개 합계" in move_line
+    assert "%" not in move_line
+
+
+@pytest.mark.parametrize("profile", ["cprofile", "tracemalloc"])
+def test_profile_text(tmp_path, profile):
+    (tmp_path / "a.jpg").write_text("x")
+    report = RunReport(profile)
+    organize(tmp_path, report)
+    assert report.to_dict()["profile_text"]
+    assert f"[{profile}]" in format_report(report.to_dict())
+
+
+def test_only_recent_reports_are_kept():
+    for i in range(KEEP_REPORTS + 3):
+        path = save_report({"n": i})
+    assert len(list(path.parent.glob("run_*.json"))) == KEEP_REPORTS
+    assert load_latest_report() == {"n": KEEP_REPORTS + 2}
+
+
+def test_reports_are_off_by_default():
+    assert DEFAULT_SETTINGS["run_report"] is False
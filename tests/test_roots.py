@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+from organizer import roots
+from organizer.roots import organize_roots
+from organizer.settings import DEFAULT_SETTINGS, get_root_options
+from organizer.undo_store import list_entries
+
+
+def make_roots(tmp_path, count: int) -> list:
+    paths = []
+    for i in range(count):
+        root = tmp_path / f"root{i}"
+        root.mkdir()
+        (root / f"{i}.jpg").write_text(str(i))
+        paths.append(root)
+    return paths
+
+
+def settings_for(paths, **overrides) -> dict:
+    settings = dict(
+        DEFAULT_SETTINGS, mode="move", on_conflict="rename",
+        roots=[{"path": str(p)} for p in paths],
+    )
+    settings.update(overrides)
+    return settings
+
+
+def test_each_root_gets_its_own_result_and_undo_entry(tmp_path):
+    paths = make_roots(tmp_path, 3)
+    results = organize_roots(
+        get_root_options(settings_for(paths)), retention={"max_count": 1},
+    )
+    assert [r.root for r in results] == [str(p) for p in paths]
+    assert [r.moved for r in results] == [1, 1, 1]
+    assert all(r.error is None and not r.cancelled for r in results)
+    # 보관 개수가 폴더 수보다 작아도 서로의 기록을 지우지 않는다
+    # (오래된 기록 정리는 백그라운드 스레드에서 도므로 끝날 때까지 기다린다)
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and thread.daemon:
+            thread.join(5)
+    assert sorted(map(str, list_entries())) == sorted(r.undo_entry for r in results)
+
+
+def test_failing_root_does_not_stop_others(tmp_path):
+    paths = make_roots(tmp_path, 2)
+    options = get_root_options(settings_for(paths + [tmp_path / "missing"]))
+    results = organize_roots(options)
+    assert [r.moved for r in results] == [1, 1, 0]
+    assert results[2].error
+
+
+def test_one_root_per_device_at_a_time(tmp_path, monkeypatch):
+    paths = make_roots(tmp_path, 4)
+    active = []
+    peak = [0]
+    real_run_root = roots.run_root
+
+    def tracked(options, **kwargs):
+        active.append(options["target_dir"])
+        peak[0] = max(peak[0], len(active))
+        time.sleep(0.05)
+        try:
+            return real_run_root(options, **kwargs)
+        finally:
+            active.remove(options["target_dir"])
+
+    monkeypatch.setattr(roots, "run_root", tracked)
+    options = get_root_options(settings_for(paths))
+
+    organize_roots(options, per_device=1)
+    assert peak[0] == 1
+
+    for path in paths:
+        (path / "again.jpg").write_text("x")
+    peak[0] = 0
+    organize_roots(options, per_device=4)
+    assert peak[0] > 1
+
+
+def test_progress_is_summed_across_roots(tmp_path):
+    paths = make_roots(tmp_path, 3)
+    calls = []
+    organize_roots(
+        get_root_options(settings_for(paths)), per_device=3,
+        progress=lambda *args: calls.append(args),
+    )
+    assert calls[-1][0] == 3
+    assert all(total is None for _, _, total in calls)
+
+
+def test_cancelled_before_start(tmp_path):
+    paths = make_roots(tmp_path, 2)
+    cancel = threading.Event()
+    cancel.set()
+    results = organize_roots(get_root_options(settings_for(paths)), cancel=cancel)
+    assert [(r.moved, r.cancelled) for r in results] == [(0, True), (0, True)]
+    assert (paths[0] / "0.jpg").exists()
+
+
+def test_invalid_limits_and_overlapping_roots(tmp_path):
+    with pytest.raises(ValueError):
+        organize_roots([], per_device=0)
+    [path] = make_roots(tmp_path, 1)
+    with pytest.raises(ValueError):
+        get_root_options(settings_for([path, path]))
+    with pytest.raises(ValueError):
+        get_root_options(settings_for([tmp_path, path], recursive=True))
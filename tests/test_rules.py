@@ -0,0 +1,79 @@
+import os
+import time
+
+import pytest
+
+from organizer.rules import changed_suffixes, compile_rules
+
+NOW = 1_800_000_000.0
+
+
+def test_suffix_rules_use_the_fast_path():
+    matcher = compile_rules({"Images": [".jpg", ".png"], "Archives": [".tar.gz", ".zip"]})
+    assert matcher.fast is not None
+    assert matcher.classify("a.JPG") == "Images"
+    assert matcher.classify("b.tar.gz") == "Archives"
+    assert matcher.classify("c.gz") is None
+    assert matcher.classify(".jpg") is None
+
+
+def test_patterns_and_conditions():
+    matcher = compile_rules({
+        "Screenshots": ["name:screenshot*", "priority:10"],
+        "BigVideos": [".mp4", "size:>1GB"],
+        "Videos": [".mp4"],
+        "Old": ["age:>30d"],
+    }, now=NOW)
+    assert matcher.classify("Screenshot 1.png") == "Screenshots"
+    assert matcher.classify("a.mp4", size=2 * 1024 ** 3) == "BigVideos"
+    assert matcher.classify("a.mp4", size=10) == "Videos"
+    assert matcher.classify("a.txt", mtime=NOW - 40 * 86400) == "Old"
+    assert matcher.classify("a.txt", mtime=NOW - 86400) is None
+
+
+@pytest.mark.parametrize("rules", [
+    {"A": [".jpg"], "B": [".jpg"]},
+    {"A": ["jpg"]},
+    {"A": ["size:10MB-1MB"]},
+    {"A": ["re:("]},
+])
+def test_invalid_rules(rules):
+    with pytest.raises(ValueError):
+        compile_rules(rules)
+
+
+def test_age_reference_moves_with_refresh():
+    matcher = compile_rules({"Old": ["age:>1h"]})
+    mtime = time.time() - 1800
+    assert matcher.classify("a.txt", mtime=mtime) is None
+    # 감시 모드처럼 한 번 컴파일한 규칙을 오래 쓰는 경우
+    matcher.now -= 10_000
+    matcher.refresh()
+    assert matcher.classify("a.txt", mtime=mtime - 3600) == "Old"
+
+
+def test_fixed_reference_time_is_kept():
+    matcher = compile_rules({"Old": ["age:>1h"]}, now=NOW)
+    matcher.refresh()
+    assert matcher.now == NOW
+
+
+def test_iter_plan_refreshes_the_matcher(tmp_path):
+    from organizer.core import iter_plan
+
+    matcher = compile_rules({"Old": ["age:>1h"]})
+    matcher.now -= 10_000
+    path = tmp_path / "a.txt"
+    path.write_text("x")
+    two_hours_ago = time.time() - 7200
+    os.utime(path, (two_hours_ago, two_hours_ago))
+    plan = list(iter_plan(
+        tmp_path, matcher, [], "move", "rename", "Archive", False,
+    ))
+    assert [move.category for move in plan] == ["Old"]
+
+
+def test_changed_suffixes():
+    old = compile_rules({"Images": [".jpg", ".png"]})
+    new = compile_rules({"Images": [".jpg"], "Pics": [".png"]})
+    assert changed_suffixes(old, new) == {".png"}
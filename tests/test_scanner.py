@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from organizer.scanner import get_suffix, scan_dir, stat_entry
+
+
+@pytest.mark.parametrize("name, suffix", [
+    ("a.JPG", ".jpg"),
+    ("archive.tar.gz", ".gz"),
+    (".bashrc", ""),
+    ("noext", ""),
+    ("trailing.", ""),
+])
+def test_get_suffix_matches_pathlib(name, suffix):
+    assert get_suffix(name) == suffix
+
+
+def test_scan_dir_reports_stat_fields(tmp_path):
+    path = tmp_path / "a.JPG"
+    path.write_bytes(b"12345")
+    (tmp_path / "sub").mkdir()
+
+    [entry] = scan_dir(tmp_path)
+    st = os.stat(path)
+    assert entry.path == str(path)
+    assert entry.name == "a.JPG"
+    assert entry.suffix == ".jpg"
+    assert (entry.size, entry.mtime, entry.dev, entry.ino) == (
+        5, st.st_mtime, st.st_dev, st.st_ino,
+    )
+    assert not entry.hidden
+
+
+def test_scan_dir_filters_hidden_and_extensions(tmp_path):
+    for name in ["a.jpg", "b.psd", ".hidden.jpg"]:
+        (tmp_path / name).write_text("x")
+
+    assert {e.name for e in scan_dir(tmp_path)} == {"a.jpg", "b.psd", ".hidden.jpg"}
+    names = {e.name for e in scan_dir(tmp_path, True, [".psd"])}
+    assert names == {"a.jpg"}
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="심볼릭 링크 없음")
+def test_scan_dir_skips_broken_links(tmp_path):
+    (tmp_path / "a.jpg").write_text("x")
+    os.symlink(tmp_path / "missing.jpg", tmp_path / "broken.jpg")
+    assert [e.name for e in scan_dir(tmp_path)] == ["a.jpg"]
+
+
+def test_stat_entry_matches_scan_dir(tmp_path):
+    (tmp_path / "a.jpg").write_text("x")
+    [entry] = scan_dir(tmp_path)
+    assert stat_entry(entry.path) == entry
+    assert stat_entry(str(tmp_path)) is None
+    assert stat_entry(str(tmp_path / "missing.jpg")) is None
+    assert stat_entry(entry.path, exclude_extensions={".jpg"}) is None
@@ -0,0 +1,100 @@
+import os
+import time
+from pathlib import Path
+
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.snapshot import load_snapshot
+from organizer.walker import walk_files
+
+
+def make_tree(root: Path):
+    for rel in ["a.jpg", "x/b.jpg", "x/y/c.jpg"]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    backdate(root)
+
+
+def backdate(root: Path):
+    # 방금 바뀐 폴더는 기록하지 않으므로 수정 시각을 과거로 돌려 둔다
+    old = time.time() - 3600
+    for path in [root, *(p for p in root.rglob("*") if p.is_dir())]:
+        os.utime(path, (old, old))
+
+
+def options(root: Path, **overrides) -> dict:
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(root), mode="move", on_conflict="rename",
+        recursive=True,
+    )
+    settings.update(overrides)
+    return get_plan_options(settings)
+
+
+def walk(root: Path, snapshot) -> set[str]:
+    return {e.name for e in walk_files(root, snapshot=snapshot)}
+
+
+def test_unchanged_folders_are_not_listed(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    snapshot = load_snapshot(options(tmp_path))
+    assert walk(tmp_path, snapshot) == {"a.jpg", "b.jpg", "c.jpg"}
+    assert snapshot.hits == 0
+    snapshot.save()
+
+    opened = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda p: opened.append(p) or real_scandir(p))
+
+    snapshot = load_snapshot(options(tmp_path))
+    assert walk(tmp_path, snapshot) == {"a.jpg", "b.jpg", "c.jpg"}
+    assert (snapshot.hits, snapshot.misses, opened) == (3, 0, [])
+
+    # 바뀐 폴더만 다시 읽는다
+    (tmp_path / "x" / "new.jpg").write_text("n")
+    snapshot = load_snapshot(options(tmp_path))
+    assert walk(tmp_path, snapshot) == {"a.jpg", "b.jpg", "c.jpg", "new.jpg"}
+    assert opened == [str(tmp_path / "x")]
+
+
+def test_recently_changed_folders_are_not_recorded(tmp_path):
+    (tmp_path / "a.jpg").write_text("a")
+    snapshot = load_snapshot(options(tmp_path))
+    walk(tmp_path, snapshot)
+    assert snapshot.dirs == {}
+
+
+def test_missing_file_invalidates_snapshot(tmp_path):
+    make_tree(tmp_path)
+    snapshot = load_snapshot(options(tmp_path))
+    walk(tmp_path, snapshot)
+    snapshot.save()
+    assert snapshot.path.exists()
+
+    # 폴더 수정 시각은 그대로인데 파일이 사라졌다
+    (tmp_path / "x" / "b.jpg").unlink()
+    backdate(tmp_path)
+    snapshot = load_snapshot(options(tmp_path))
+    snapshot.dirs[str(tmp_path / "x")]["mtime"] = os.stat(tmp_path / "x").st_mtime_ns
+    assert walk(tmp_path, snapshot) == {"a.jpg", "c.jpg"}
+    assert snapshot.inconsistent
+    snapshot.save()
+    assert not snapshot.path.exists()
+
+
+def test_settings_change_or_age_forces_full_scan(tmp_path):
+    make_tree(tmp_path)
+    snapshot = load_snapshot(options(tmp_path))
+    walk(tmp_path, snapshot)
+    snapshot.save()
+
+    assert load_snapshot(options(tmp_path)).dirs
+    assert not load_snapshot(options(tmp_path, exclude_hidden=False)).dirs
+    assert not load_snapshot(options(tmp_path), full_rescan_hours=0).dirs
+
+    snapshot.path.write_text("{broken")
+    assert not load_snapshot(options(tmp_path)).dirs
+
+
+def test_snapshots_are_opt_in():
+    assert DEFAULT_SETTINGS["incremental_scan"] is False
@@ -0,0 +1,87 @@
+import struct
+
+import pytest
+
+from organizer.cache import FileCache
+from organizer.sniff import Sniffer, match_signature
+
+
+def bmp_header(dib=40, pixels=54):
+    return b"BM" + struct.pack("<IIII", 1000, 0, pixels, dib) + b"\0" * 40
+
+
+def pe_header(offset=0x80):
+    head = bytearray(b"MZ" + b"\0" * 510)
+    head[0x3C:0x40] = struct.pack("<I", offset)
+    head[offset:offset + 4] = b"PE\0\0"
+    return bytes(head)
+
+
+@pytest.mark.parametrize("head, ext", [
+    (b"\xff\xd8\xff\xe0\x00\x10JFIF", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"%PDF-1.7\n", ".pdf"),
+    (b"\x00\x00\x00\x18ftypqt  ", ".mov"),
+    (b"\x00\x00\x00\x18ftypisom", ".mp4"),
+    (bmp_header(), ".bmp"),
+    (pe_header(), ".exe"),
+    (b"\xff\xfb\x90\x64" + b"\0" * 16, ".mp3"),
+    (b"ID3\x04\x00", ".mp3"),
+])
+def test_known_signatures(head, ext):
+    assert match_signature(head) == ext
+
+
+@pytest.mark.parametrize("head", [
+    b"BMW service notes: oil change at 30k\n",
+    b"MZ: meeting notes from Tuesday, see below\n" * 4,
+    b"MZ" + b"\0" * 100,                       # e_lfanew 가 PE 를 가리키지 않음
+    bmp_header(dib=7),
+    b"\xff\xfe" + "hello".encode("utf-16-le"),  # UTF-16 BOM
+    b"\xff\xfb\xf0\x00",                       # 비트레이트 값이 잘못됨
+    b"plain text",
+])
+def test_short_magics_need_a_valid_header(head):
+    assert match_signature(head) is None
+
+
+def test_sniffer_caches_results(tmp_path):
+    from organizer.scanner import scan_dir
+
+    (tmp_path / "photo").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 20)
+    (tmp_path / "notes").write_text("BMW")
+    entries = list(scan_dir(tmp_path))
+
+    sniffer = Sniffer()
+    assert sniffer.sniff_many(entries) == {str(tmp_path / "photo"): ".png"}
+    sniffer.close()
+
+    cache = FileCache("sniff")
+    (count,) = cache.conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+    assert count == 2
+    cache.close()
+
+
+def test_cache_prunes_old_and_excess_entries():
+    cache = FileCache("test", max_age_days=30, max_entries=3)
+    cache.put_many({f"k{i}": str(i) for i in range(5)})
+    cache.conn.execute("UPDATE cache SET used = 0 WHERE key = 'k4'")
+    cache.conn.commit()
+    cache.close()
+
+    cache = FileCache("test")
+    found = cache.get_many([f"k{i}" for i in range(5)])
+    # 오래된 k4 는 나이로, 나머지 중 한 개는 개수 한도로 지워진다
+    assert "k4" not in found
+    assert len(found) == 3
+    cache.close()
+
+
+def test_cache_without_writes_is_not_pruned():
+    cache = FileCache("test", max_entries=1)
+    cache.put_many({"a": "1", "b": "2"})
+    cache.written = False
+    cache.close()
+    cache = FileCache("test")
+    assert len(cache.get_many(["a", "b"])) == 2
+    cache.close()
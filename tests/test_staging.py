@@ -0,0 +1,98 @@
+import os
+import time
+
+from organizer.core import execute_plan, iter_plan
+from organizer.platform import get_config_dir
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.staging import STAGING_NAME, StagingArea, evict_staged, load_areas
+from organizer.undo import undo_last_operation
+from organizer.walker import walk_files
+
+
+def organize(target, keep_replaced=True):
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(target), mode="move", on_conflict="overwrite",
+    )
+    return execute_plan(iter_plan(**get_plan_options(settings)), keep_replaced=keep_replaced)
+
+
+def test_overwritten_file_is_staged_and_restored_by_undo(tmp_path):
+    images = tmp_path / "Archive" / "Images"
+    images.mkdir(parents=True)
+    (images / "b.jpg").write_text("old")
+    (tmp_path / "b.jpg").write_text("new")
+
+    assert organize(tmp_path) == 1
+    assert (images / "b.jpg").read_text() == "new"
+    [area] = load_areas()
+    [staged] = os.listdir(area)
+    assert staged.endswith("-b.jpg")
+    with open(os.path.join(area, staged)) as f:
+        assert f.read() == "old"
+
+    report = undo_last_operation()
+    assert len(report.restored) == 1
+    assert (tmp_path / "b.jpg").read_text() == "new"
+    assert (images / "b.jpg").read_text() == "old"
+    assert os.listdir(area) == []
+
+
+def test_undo_reports_a_staged_file_that_was_evicted(tmp_path):
+    images = tmp_path / "Archive" / "Images"
+    images.mkdir(parents=True)
+    (images / "b.jpg").write_text("old")
+    (tmp_path / "b.jpg").write_text("new")
+    organize(tmp_path)
+
+    evict_staged({"max_bytes": 0, "max_age_days": None})
+    report = undo_last_operation()
+    assert (tmp_path / "b.jpg").read_text() == "new"
+    assert not (images / "b.jpg").exists()
+    assert len(report.restored) == 1
+
+
+def test_keep_replaced_off_deletes_the_old_file(tmp_path):
+    images = tmp_path / "Archive" / "Images"
+    images.mkdir(parents=True)
+    (images / "b.jpg").write_text("old")
+    (tmp_path / "b.jpg").write_text("new")
+    organize(tmp_path, keep_replaced=False)
+    assert (images / "b.jpg").read_text() == "new"
+    assert load_areas() == []
+
+
+def test_eviction_keeps_newest_files_within_budget(tmp_path):
+    staging = StagingArea()
+    staged = []
+    for i in range(4):
+        path = tmp_path / f"f{i}"
+        path.write_bytes(b"x" * 100)
+        staged.append(staging.stage(path))
+        time.sleep(0.001)
+    assert all(staged)
+
+    evict_staged({"max_bytes": 250, "max_age_days": None})
+    assert [os.path.exists(p) for p in staged] == [False, False, True, True]
+
+
+def test_walker_skips_staging_folders(tmp_path):
+    (tmp_path / STAGING_NAME).mkdir()
+    (tmp_path / STAGING_NAME / "1-2-3-a.jpg").write_text("x")
+    (tmp_path / "b.jpg").write_text("y")
+    assert [entry.name for entry in walk_files(tmp_path)] == ["b.jpg"]
+
+
+def test_staging_falls_back_next_to_the_destination(tmp_path):
+    # 설정 폴더를 쓸 수 없을 때 (다른 드라이브 등) 드라이브 최상위가 아니라 정리 폴더 안에 보관
+    get_config_dir().mkdir(parents=True, exist_ok=True)
+    (get_config_dir() / "staging").write_text("")
+    images = tmp_path / "Archive" / "Images"
+    images.mkdir(parents=True)
+    (images / "b.jpg").write_text("old")
+    (tmp_path / "b.jpg").write_text("new")
+
+    assert organize(tmp_path) == 1
+    assert load_areas() == [str(images / STAGING_NAME)]
+    [staged] = os.listdir(images / STAGING_NAME)
+    assert staged.endswith("-b.jpg")
+    assert [entry.name for entry in walk_files(tmp_path / "Archive")] == ["b.jpg"]
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from organizer import startup
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_python(code: str, home: Path, **env) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(ROOT), HOME=str(home), APPDATA=str(home), **env)
+    return subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+
+
+def test_trace_is_off_by_default(monkeypatch):
+    monkeypatch.delenv(startup.ENV_VAR, raising=False)
+    before = list(sys.meta_path)
+    assert startup.begin() is None
+    assert sys.meta_path == before
+    startup.mark("ignored")
+    startup.finish()
+
+
+def test_trace_reports_imports_and_marks(config_dir):
+    code = (
+        "from organizer import startup\n"
+        "startup.begin()\n"
+        "import organizer.core\n"
+        "startup.mark('imports')\n"
+        "startup.finish()\n"
+        "import sys; assert startup.trace.imports not in sys.meta_path\n"
+    )
+    proc = run_python(code, config_dir, **{startup.ENV_VAR: "1"})
+    assert proc.returncode == 0, proc.stderr
+
+    [log] = config_dir.rglob(startup.REPORT_NAME)
+    report = log.read_text(encoding="utf-8")
+    assert report.startswith("import time: self [us] | cumulative | imported package")
+    assert "organizer.dest_index" in report
+    assert report.splitlines()[-2].startswith("imports")
+    assert report.splitlines()[-1].startswith("startup done")
+    assert report.strip() in proc.stderr
+
+
+def test_main_window_defers_heavy_modules(config_dir):
+    pytest.importorskip("PySide6")
+    code = (
+        "import sys\n"
+        "import organizer.ui\n"
+        "deferred = ['organizer.core', 'organizer.undo', 'organizer.history_ui', 'organizer.worker']\n"
+        "loaded = [m for m in deferred if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    proc = run_python(code, config_dir)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,169 @@
+import errno
+import os
+
+import pytest
+
+from organizer import core, transfer
+from organizer.core import execute_plan, plan_organize
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+
+
+def make_file(path, data=b"hello"):
+    path.write_bytes(data)
+    return os.stat(path)
+
+
+def test_cross_device_move_copies_and_removes_source(tmp_path):
+    src = tmp_path / "a.bin"
+    st = make_file(src, b"x" * 100_000)
+    dst = tmp_path / "out" / "a.bin"
+    dst.parent.mkdir()
+    transfer.move_file(str(src), dst, same_device=False, size=st.st_size, mtime=st.st_mtime, verify=True)
+    assert not src.exists()
+    assert dst.read_bytes() == b"x" * 100_000
+    assert not list(dst.parent.glob("*.part"))
+
+
+def test_same_device_rename_falls_back_on_exdev(tmp_path, monkeypatch):
+    # bind mount / overlay 처럼 st_dev 가 같아도 rename 이 EXDEV 로 실패하는 경우
+    src = tmp_path / "a.txt"
+    st = make_file(src)
+    dst = tmp_path / "b.txt"
+
+    def rename(a, b):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(transfer.os, "rename", rename)
+    transfer.move_file(str(src), dst, same_device=True, size=st.st_size, mtime=st.st_mtime)
+    assert not src.exists()
+    assert dst.read_bytes() == b"hello"
+
+
+def test_other_rename_errors_are_raised(tmp_path, monkeypatch):
+    src = tmp_path / "a.txt"
+    st = make_file(src)
+
+    def rename(a, b):
+        raise PermissionError(errno.EACCES, "denied")
+
+    monkeypatch.setattr(transfer.os, "rename", rename)
+    with pytest.raises(PermissionError):
+        transfer.move_file(str(src), tmp_path / "b.txt", same_device=True, size=st.st_size, mtime=st.st_mtime)
+    assert src.exists()
+
+
+def test_resume_from_partial_copy(tmp_path):
+    src = tmp_path / "a.bin"
+    st = make_file(src, bytes(range(256)) * 100)
+    dst = tmp_path / "dst.bin"
+    part = transfer.get_part_path(dst, st.st_size, st.st_mtime)
+    part.write_bytes(src.read_bytes()[:1000])
+    transfer.move_file(str(src), dst, same_device=False, size=st.st_size, mtime=st.st_mtime)
+    assert dst.read_bytes() == bytes(range(256)) * 100
+    assert not part.exists()
+
+
+def plan_for(root, conflict="rename"):
+    settings = dict(DEFAULT_SETTINGS, target_dir=str(root), mode="move", on_conflict=conflict)
+    return plan_organize(**get_plan_options(settings))
+
+
+def fail_rename(monkeypatch, path, error):
+    # path 를 옮기는 rename 만 실패시킨다 (다른 파일, 저널, 보관 폴더는 그대로)
+    real_rename = os.rename
+
+    def rename(src, dst):
+        if str(src) == str(path):
+            raise error
+        return real_rename(src, dst)
+
+    monkeypatch.setattr(transfer.os, "rename", rename)
+
+
+def test_failed_transfer_skips_only_that_file(tmp_path, monkeypatch):
+    (tmp_path / "bad.jpg").write_text("1")
+    (tmp_path / "good.jpg").write_text("2")
+    real_move = core.move_file
+
+    def move_file(src, *args, **kwargs):
+        if src.endswith("bad.jpg"):
+            raise RuntimeError("복사가 완료되지 않았습니다")
+        return real_move(src, *args, **kwargs)
+
+    monkeypatch.setattr(core, "move_file", move_file)
+    settings = dict(DEFAULT_SETTINGS, target_dir=str(tmp_path), mode="move", on_conflict="rename")
+    moved = core.execute_plan(core.iter_plan(**get_plan_options(settings)), workers=2)
+    assert moved == 1
+    assert (tmp_path / "bad.jpg").exists()
+    assert (tmp_path / "Archive" / "Images" / "good.jpg").exists()
+
+
+def test_file_that_changed_after_planning_is_not_truncated(tmp_path, monkeypatch):
+    src = tmp_path / "a.jpg"
+    src.write_bytes(b"x" * 100)
+    plan = plan_for(tmp_path)
+    with open(src, "ab") as f:
+        f.write(b"y" * 100)
+
+    images = tmp_path / "Archive" / "Images"
+    fail_rename(monkeypatch, src, OSError(errno.EXDEV, "cross-device link"))
+    assert execute_plan(plan) == 0
+    assert src.read_bytes() == b"x" * 100 + b"y" * 100
+    assert list(images.iterdir()) == []
+
+
+def test_changed_source_raises_and_keeps_source(tmp_path):
+    src = tmp_path / "a.bin"
+    st = make_file(src, b"x" * 100)
+    src.write_bytes(b"x" * 200)
+    dst = tmp_path / "b.bin"
+    with pytest.raises(RuntimeError):
+        transfer.move_file(str(src), dst, same_device=False, size=st.st_size, mtime=st.st_mtime)
+    assert src.stat().st_size == 200
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.bin"]
+
+
+def test_copy_errors_remove_the_part_file(tmp_path, monkeypatch):
+    src = tmp_path / "a.bin"
+    st = make_file(src, b"x" * 100)
+
+    def copy_range(fsrc, fdst, pos, size):
+        os.write(fdst, b"x" * 10)
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(transfer, "copy_range", copy_range)
+    with pytest.raises(OSError):
+        transfer.move_file(str(src), tmp_path / "b.bin", same_device=False, size=st.st_size, mtime=st.st_mtime)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.bin"]
+
+
+def test_os_errors_skip_the_file_and_restore_staged_copy(tmp_path, monkeypatch):
+    images = tmp_path / "Archive" / "Images"
+    images.mkdir(parents=True)
+    (images / "a.jpg").write_text("old")
+    (tmp_path / "a.jpg").write_text("new")
+    (tmp_path / "b.mov").write_text("b")
+    plan = plan_for(tmp_path, "overwrite")
+
+    # 잠긴 파일 (Windows 의 PermissionError)
+    fail_rename(monkeypatch, tmp_path / "a.jpg", PermissionError(errno.EACCES, "locked"))
+    assert execute_plan(plan, workers=2) == 1
+    assert (tmp_path / "a.jpg").read_text() == "new"
+    assert (images / "a.jpg").read_text() == "old"
+    assert (tmp_path / "Archive" / "Videos" / "b.mov").exists()
+
+
+def test_disk_full_during_copy_skips_the_file(tmp_path, monkeypatch):
+    (tmp_path / "a.jpg").write_bytes(b"x" * 100)
+    (tmp_path / "b.mov").write_text("b")
+    plan = plan_for(tmp_path)
+    images = tmp_path / "Archive" / "Images"
+    fail_rename(monkeypatch, tmp_path / "a.jpg", OSError(errno.EXDEV, "cross-device link"))
+
+    def copy_range(fsrc, fdst, pos, size):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(transfer, "copy_range", copy_range)
+    assert execute_plan(plan) == 1
+    assert (tmp_path / "a.jpg").read_bytes() == b"x" * 100
+    assert list(images.iterdir()) == []
@@ -0,0 +1,88 @@
+import errno
+import os
+
+import pytest
+
+from organizer import undo
+from organizer.undo import UndoFilter, reverse_operations, undo_entry, write_undo_log
+from organizer.undo_store import get_latest_entry
+
+
+def op(src, dst, **extra):
+    return {"from": str(src), "to": str(dst), "size": 1, "category": "Images", **extra}
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_chain_is_restored_in_dependency_order(tmp_path, workers):
+    # a → b 다음에 c → a: a 자리를 c 가 차지하고 있으므로 c 를 먼저 돌려야 한다
+    a, b, c = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+    b.write_text("A")
+    a.write_text("C")
+    report = reverse_operations([op(a, b), op(c, a)], workers=workers)
+    assert len(report.restored) == 2
+    assert a.read_text() == "A"
+    assert c.read_text() == "C"
+    assert not b.exists()
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_swap_cycle_is_broken_with_a_temporary_name(tmp_path, workers):
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.write_text("B")
+    b.write_text("A")
+    report = reverse_operations([op(a, b), op(b, a)], workers=workers)
+    assert len(report.restored) == 2
+    assert a.read_text() == "A"
+    assert b.read_text() == "B"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a", "b"]
+
+
+def test_conflict_and_missing_files_are_reported(tmp_path):
+    (tmp_path / "moved1").write_text("1")
+    (tmp_path / "orig1").write_text("someone else")
+    report = reverse_operations([
+        op(tmp_path / "orig1", tmp_path / "moved1"),
+        op(tmp_path / "orig2", tmp_path / "gone"),
+    ])
+    assert [o["from"] for o, _ in report.conflicted] == [str(tmp_path / "orig1")]
+    assert [o["from"] for o, _ in report.skipped] == [str(tmp_path / "orig2")]
+
+
+def test_selective_undo_keeps_the_rest_of_the_entry(tmp_path):
+    ops = []
+    for name, category in [("x.jpg", "Images"), ("y.pdf", "Docs")]:
+        moved = tmp_path / category / name
+        moved.parent.mkdir()
+        moved.write_text(name)
+        ops.append(dict(op(tmp_path / name, moved), category=category))
+    write_undo_log(ops)
+    entry = get_latest_entry()
+
+    report = undo_entry(entry, UndoFilter(categories={"Docs"}))
+    assert [o["category"] for o in report.restored] == ["Docs"]
+    assert (tmp_path / "y.pdf").exists()
+    assert (tmp_path / "Images" / "x.jpg").exists()
+
+    report = undo_entry(get_latest_entry())
+    assert [o["category"] for o in report.restored] == ["Images"]
+    assert get_latest_entry() is None
+
+
+def test_undo_copies_back_across_drives(tmp_path, monkeypatch):
+    # 다른 드라이브의 정리 폴더로 옮겼던 파일은 rename 이 EXDEV 로 실패한다
+    moved = tmp_path / "Archive" / "a.jpg"
+    moved.parent.mkdir()
+    moved.write_text("A")
+    real_rename = os.rename
+
+    def rename(src, dst):
+        if str(src) == str(moved):
+            raise OSError(errno.EXDEV, "cross-device link")
+        return real_rename(src, dst)
+
+    monkeypatch.setattr(undo.os, "rename", rename)
+    report = reverse_operations([op(tmp_path / "a.jpg", moved)])
+    assert len(report.restored) == 1
+    assert (tmp_path / "a.jpg").read_text() == "A"
+    assert not moved.exists()
+    assert not list(moved.parent.iterdir())
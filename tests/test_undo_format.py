@@ -0,0 +1,70 @@
+import pytest
+
+from organizer.undo_format import (
+    BLOCK_OPS, UndoLogReader, read_compact, read_header, write_compact,
+)
+
+
+def make_ops(count):
+    ops = []
+    for i in range(count):
+        op = {
+            "from": f"/desk/sub dir/file {i}.jpg",
+            "to": f"/desk/Archive/Images/file {i}.jpg",
+            "category": "Images" if i % 3 else "Docs",
+            "size": i * 10,
+            "time": 1760000000.5 + i,
+        }
+        if i % 5 == 1:
+            op["action"] = "overwrite"
+            op["original"] = f"/desk/.fileorganizer-staging/{i}-file {i}.jpg"
+        elif i % 5 == 2:
+            op["action"] = "skip"
+        ops.append(op)
+    return ops
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip(tmp_path, compress):
+    ops = make_ops(BLOCK_OPS * 2 + 7)
+    path = tmp_path / "1.undo"
+    write_compact(path, {"timestamp": "2026-10-18T09:00:00", "root": "/desk", "operations": ops}, compress)
+
+    data = read_compact(path)
+    assert data["operations"] == ops
+    assert data["root"] == "/desk"
+
+    header = read_header(path)
+    assert header["count"] == len(ops)
+    assert header["bytes"] == sum(op["size"] for op in ops)
+    docs = sum(1 for op in ops if op["category"] == "Docs")
+    assert header["categories"] == {"Docs": docs, "Images": len(ops) - docs}
+
+
+def test_reader_pages_across_blocks(tmp_path):
+    ops = make_ops(BLOCK_OPS + 10)
+    path = tmp_path / "1.undo"
+    write_compact(path, {"timestamp": None, "operations": ops})
+    with UndoLogReader(path) as reader:
+        assert len(reader) == len(ops)
+        assert reader.get(BLOCK_OPS + 3) == ops[BLOCK_OPS + 3]
+        assert reader.page(BLOCK_OPS - 2, 4) == ops[BLOCK_OPS - 2:BLOCK_OPS + 2]
+
+
+def test_folder_names_with_newlines(tmp_path):
+    ops = [
+        {"from": "/a\nb/x.jpg", "to": "/c/Images/x.jpg", "category": "Images", "size": 1, "time": 1.0},
+        {"from": "/d/y.jpg", "to": "/c/Images/y.jpg", "category": "Images", "size": 2, "time": 2.0},
+    ]
+    path = tmp_path / "1.undo"
+    write_compact(path, {"timestamp": None, "operations": ops})
+    assert read_compact(path)["operations"] == ops
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "1.undo"
+    path.write_bytes(b"not an undo log" * 10)
+    with pytest.raises(ValueError):
+        read_header(path)
+    with pytest.raises(ValueError):
+        UndoLogReader(path)
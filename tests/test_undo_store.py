@@ -0,0 +1,82 @@
+import os
+import time
+
+from organizer.undo_store import (
+    allocate_entry, evict_entries, get_entry_seq, get_latest_entry, get_manifest_path,
+    get_undo_dir, list_entries, remove_entry,
+)
+
+
+def finished_entries(count: int) -> list:
+    # 완료된 기록처럼 .undo 로 바꿔 둔다 (기록 중인 .jsonl 은 지우지 않으므로)
+    paths = []
+    for _ in range(count):
+        path = allocate_entry()
+        done = path.with_suffix(".undo")
+        os.replace(path, done)
+        paths.append(done)
+    return paths
+
+
+def test_sequence_numbers_never_rename_files():
+    first = allocate_entry()
+    second = allocate_entry()
+    assert [get_entry_seq(first), get_entry_seq(second)] == [1, 2]
+    assert first.exists() and second.exists()
+    assert get_latest_entry() == second
+    assert list_entries() == [second, first]
+
+
+def test_latest_falls_back_when_removed():
+    first, second = finished_entries(2)
+    remove_entry(second)
+    assert get_latest_entry() == first
+    remove_entry(first)
+    assert get_latest_entry() is None
+    # 번호는 다시 쓰지 않는다
+    assert get_entry_seq(allocate_entry()) == 3
+
+
+def test_eviction_keeps_count_and_latest():
+    paths = finished_entries(5)
+    evict_entries({"max_count": 2})
+    assert list_entries() == [paths[4], paths[3]]
+
+    evict_entries({"max_count": 0})
+    assert list_entries() == [paths[4]]
+
+
+def test_eviction_by_age_and_size():
+    paths = finished_entries(3)
+    for path in paths:
+        path.write_bytes(b"x" * 100)
+    old = time.time() - 10 * 86400
+    os.utime(paths[0], (old, old))
+
+    evict_entries({"max_age_days": 5})
+    assert list_entries() == [paths[2], paths[1]]
+    evict_entries({"max_bytes": 150})
+    assert list_entries() == [paths[2]]
+
+
+def test_eviction_skips_open_journals():
+    journal = allocate_entry()
+    [latest] = finished_entries(1)
+    evict_entries({"max_count": 1})
+    assert list_entries() == [latest, journal]
+
+
+def test_manifest_is_rebuilt_and_legacy_names_migrated():
+    undo_dir = get_undo_dir()
+    # 예전 방식: undo_000 이 최신
+    for i, text in enumerate(["newest", "middle", "oldest"]):
+        (undo_dir / f"undo_{i:03}.json").write_text(text)
+    get_manifest_path(undo_dir).unlink(missing_ok=True)
+
+    latest = get_latest_entry()
+    assert latest.name == "undo_00000003.json"
+    assert [p.read_text() for p in list_entries()] == ["newest", "middle", "oldest"]
+    assert get_entry_seq(allocate_entry()) == 4
+
+    get_manifest_path(undo_dir).write_text("{broken")
+    assert get_latest_entry().name == "undo_00000004.jsonl"
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from organizer.core import execute_plan, plan_organize
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.walker import walk_files
+
+
+def make_tree(root: Path):
+    for rel in ["a.jpg", "x/b.jpg", "x/y/c.jpg", "x/y/z/d.jpg", ".hid/e.jpg"]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+
+def names(root: Path, **kwargs) -> set[str]:
+    return {e.name for e in walk_files(root, **kwargs)}
+
+
+def test_walks_every_level_lazily(tmp_path):
+    make_tree(tmp_path)
+    it = walk_files(tmp_path)
+    assert iter(it) is it
+    assert {e.name for e in it} == {"a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"}
+
+
+@pytest.mark.parametrize("depth, expected", [
+    (0, {"a.jpg"}),
+    (1, {"a.jpg", "b.jpg"}),
+    (2, {"a.jpg", "b.jpg", "c.jpg"}),
+])
+def test_max_depth(tmp_path, depth, expected):
+    make_tree(tmp_path)
+    assert names(tmp_path, max_depth=depth) & {"a.jpg", "b.jpg", "c.jpg", "d.jpg"} == expected
+
+
+def test_excluded_and_hidden_folders(tmp_path):
+    make_tree(tmp_path)
+    assert names(tmp_path, exclude_dirs=[tmp_path / "x" / "y"], exclude_hidden=True) == {
+        "a.jpg", "b.jpg",
+    }
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="심볼릭 링크 없음")
+def test_symlink_loops_are_visited_once(tmp_path):
+    make_tree(tmp_path)
+    os.symlink(tmp_path / "x", tmp_path / "x" / "y" / "loop")
+    assert names(tmp_path) == {"a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"}
+    found = [e.name for e in walk_files(tmp_path, follow_symlinks=True)]
+    assert sorted(found) == ["a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="심볼릭 링크 없음")
+def test_file_symlinks_are_skipped_unless_followed(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "real.jpg").write_text("x")
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.jpg").write_text("a")
+    os.symlink(outside / "real.jpg", root / "link.jpg")
+
+    assert names(root) == {"a.jpg"}
+    assert names(root, follow_symlinks=True) == {"a.jpg", "link.jpg"}
+
+
+def test_recursive_run_does_not_rescan_archive(tmp_path):
+    make_tree(tmp_path)
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(tmp_path), mode="move", on_conflict="rename",
+        recursive=True, exclude_hidden=False,
+    )
+    assert execute_plan(plan_organize(**get_plan_options(settings))) == 5
+    assert plan_organize(**get_plan_options(settings)) == ()
+
+
+def test_inplace_recursive_skips_category_folders(tmp_path):
+    make_tree(tmp_path)
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(tmp_path), mode="inplace", on_conflict="rename",
+        recursive=True, exclude_hidden=True,
+    )
+    assert execute_plan(plan_organize(**get_plan_options(settings))) == 4
+    assert len(list((tmp_path / "Images").iterdir())) == 4
+    assert plan_organize(**get_plan_options(settings)) == ()
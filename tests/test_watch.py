@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.undo_store import list_entries
+from organizer.watch import PollingWatcher, is_partial, open_watcher, watch
+
+
+def wait_for(condition, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("시간 초과")
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def watching(tmp_path):
+    settings = dict(
+        DEFAULT_SETTINGS, target_dir=str(tmp_path), mode="move", on_conflict="rename",
+        exclude_patterns=["~$*"],
+    )
+    stop = threading.Event()
+    batches = []
+    thread = threading.Thread(
+        target=watch,
+        args=(get_plan_options(settings),),
+        kwargs=dict(
+            debounce=0.05, settle=0.1, poll_interval=0.05, initial=True,
+            stop=stop, on_batch=batches.append,
+        ),
+    )
+    thread.start()
+    yield batches
+    stop.set()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_is_partial():
+    assert is_partial("movie.mp4.CRDOWNLOAD")
+    assert is_partial("a.part")
+    assert not is_partial("a.jpg")
+
+
+def test_polling_watcher_reports_changed_names(tmp_path):
+    (tmp_path / "a.jpg").write_text("a")
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+    assert watcher.wait(0) == set()
+    (tmp_path / "b.jpg").write_text("b")
+    assert watcher.wait(0) == {"b.jpg"}
+    watcher.close()
+
+
+def test_open_watcher_falls_back_to_polling(tmp_path):
+    watcher = open_watcher(tmp_path)
+    try:
+        assert hasattr(watcher, "wait")
+    finally:
+        watcher.close()
+
+
+def test_new_files_are_organized_in_batches(tmp_path, watching):
+    (tmp_path / "old.jpg").write_text("old")
+    wait_for(lambda: len(watching) == 1)
+    assert (tmp_path / "Archive" / "Images" / "old.jpg").exists()
+
+    (tmp_path / "new.mov").write_text("new")
+    (tmp_path / "~$lock.jpg").write_text("lock")
+    (tmp_path / "dl.jpg.part").write_text("partial")
+    wait_for(lambda: len(watching) == 2)
+    assert (tmp_path / "Archive" / "Videos" / "new.mov").exists()
+
+    # 배치마다 되돌리기 기록이 하나씩
+    assert watching == [1, 1]
+    assert len(list_entries()) == 2
+    assert (tmp_path / "~$lock.jpg").exists()
+    assert (tmp_path / "dl.jpg.part").exists()
+
+
+def test_finished_download_is_organized_after_rename(tmp_path, watching):
+    partial = tmp_path / "photo.jpg.crdownload"
+    partial.write_text("x")
+    time.sleep(0.3)
+    assert not (tmp_path / "Archive").exists()
+
+    partial.rename(tmp_path / "photo.jpg")
+    wait_for(lambda: (tmp_path / "Archive" / "Images" / "photo.jpg").exists())
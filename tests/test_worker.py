@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from organizer.core import execute_plan, plan_organize
+from organizer.settings import DEFAULT_SETTINGS, get_plan_options
+from organizer.undo import undo_last_operation
+from organizer.undo_store import list_entries
+
+
+def organize(root, count):
+    for i in range(count):
+        (root / f"f{i}.jpg").write_text("x")
+    settings = dict(DEFAULT_SETTINGS, target_dir=str(root), mode="move", on_conflict="rename")
+    return execute_plan(plan_organize(**get_plan_options(settings)))
+
+
+def test_cancelled_undo_keeps_the_rest(tmp_path):
+    assert organize(tmp_path, 6) == 6
+    cancel = threading.Event()
+
+    def progress(done, bytes_done, total):
+        assert total == 6
+        if done == 2:
+            cancel.set()
+
+    report = undo_last_operation(progress=progress, cancel=cancel)
+    assert len(report.restored) == 2
+    assert len(report.remaining) == 4
+    assert len(list(tmp_path.glob("*.jpg"))) == 2
+
+    # 남은 작업은 기록에 남아 다시 되돌릴 수 있다
+    assert len(list_entries()) == 1
+    report = undo_last_operation()
+    assert len(report.restored) == 4
+    assert len(list(tmp_path.glob("*.jpg"))) == 6
+
+
+def test_progress_throttle_always_sends_the_last_update():
+    pytest.importorskip("PySide6")
+    from organizer.worker import ProgressThrottle
+
+    sent = []
+    throttle = ProgressThrottle(sent.append, interval=3600)
+    for done in range(1, 11):
+        throttle(done, done * 10, 10)
+
+    # 많아야 첫 번째와 마지막만
+    assert [p.done for p in sent][-1:] == [10]
+    assert len(sent) <= 2
+    last = sent[-1]
+    assert (last.total, last.bytes_done, last.eta) == (10, 100, 0)
+    assert last.files_per_sec > 0
+
+
+def test_progress_throttle_without_total():
+    pytest.importorskip("PySide6")
+    from organizer.worker import ProgressThrottle
+
+    sent = []
+    throttle = ProgressThrottle(sent.append, interval=0)
+    throttle(5, 50, None)
+    assert sent[0].eta is None